@@ -0,0 +1,47 @@
+"""Flattening cached word entries into columns, and back.
+
+Compares `util.flatten_recur`/`deflatten_recur` run per record with the
+compiled `jisho_api.flatten.Flattener` on a batch of copies of the test
+fixture entries.
+
+    python benchmarks/bench_flatten.py --records 100000
+"""
+import argparse
+import json
+import time
+from pathlib import Path
+
+from jisho_api.flatten import flattener
+from jisho_api.util import deflatten_recur, flatten_recur
+from jisho_api.word.cfg import WordConfig
+
+FIXTURE = Path(__file__).parent.parent / "jisho_api" / "fixtures" / "word.json"
+
+
+def timed(name, fn, n):
+    start = time.perf_counter()
+    out = fn()
+    elapsed = time.perf_counter() - start
+    print(f"{name:>18}: {elapsed:6.2f}s, {n / elapsed:10.0f} records/s")
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with open(FIXTURE, "r", encoding="utf-8") as fp:
+        data = json.load(fp)["data"]
+    records = [data[i % len(data)] for i in range(args.records)]
+    n = len(records)
+
+    f = flattener(WordConfig)
+    rows = timed("flatten_recur", lambda: [flatten_recur(r) for r in records], n)
+    timed("deflatten_recur", lambda: [deflatten_recur(r) for r in rows], n)
+    cols = timed("Flattener.flatten", lambda: f.flatten(records), n)
+    timed("Flattener.unflatten", lambda: f.unflatten(cols), n)
+
+
+if __name__ == "__main__":
+    main()
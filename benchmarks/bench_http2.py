@@ -0,0 +1,45 @@
+"""HTTP/1.1 connection pool vs one multiplexed HTTP/2 connection.
+
+Starts a `FakeJisho` with `--latency` seconds per reply, then runs the same
+sync lookups at each `--concurrency` through `Transport` (one pooled
+connection per thread) and `HTTP2Transport` (streams over one h2c
+connection), reporting latency percentiles, throughput and how many
+connections the server accepted. Needs `pip install "jisho_api[http2]"`.
+
+    python benchmarks/bench_http2.py --requests 1000 --concurrency 50 200
+"""
+import argparse
+
+from jisho_api.fake import FakeJisho
+from jisho_api.loadgen import load_client, run_load
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--kind", default="word")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[50, 200])
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    with FakeJisho(latency=args.latency, seed=0) as fake:
+        url = fake.base_url
+        for concurrency in args.concurrency:
+            for name, http2 in (("http/1.1 pool", False), ("http/2", True)):
+                before = fake.counts["connections"]
+                client = load_client(url, concurrency, http2=http2)
+                report = run_load(
+                    client, args.kind, "sync", requests=args.requests, concurrency=concurrency
+                )
+                client.transport.close()
+                print(
+                    f"{name:>13} x{concurrency:<4}"
+                    f" p50 {report.p50:7.1f}ms  p95 {report.p95:7.1f}ms"
+                    f"  p99 {report.p99:7.1f}ms  {report.throughput:7.1f}/s"
+                    f"  errors {report.errors}"
+                    f"  connections {fake.counts['connections'] - before}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Study-list queries over a kanji cache: loading every file vs `KanjiRanking`.
+
+Writes `--kanji` synthetic cached kanji to a temporary folder, then times
+the top 50 JLPT N5-N4 kanji of at most 10 strokes by frequency, by
+validating and sorting every cached reply, by building the ranking, and by
+loading the saved ranking and querying it.
+
+    python benchmarks/bench_ranking.py --kanji 10000
+"""
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from jisho_api.cache import FileCache
+from jisho_api.kinds import reply_from_payload
+from jisho_api.ranking import KanjiRanking
+
+
+def payload(kanji, rng):
+    education = {
+        "grade": rng.choice([None, "junior high"] + [f"grade {g}" for g in range(1, 7)]),
+        "jlpt": rng.choice([None, "N1", "N2", "N3", "N4", "N5"]),
+        "newspaper_rank": rng.choice([None, rng.randint(1, 2500)]),
+    }
+    return {
+        "meta": {"status": 200},
+        "data": {
+            "kanji": kanji,
+            "strokes": rng.randint(1, 30),
+            "main_meanings": ["meaning"],
+            "main_readings": {"kun": ["くん"], "on": ["オン"]},
+            "meta": {"education": education},
+            "radical": {"meaning": "water", "parts": [kanji], "basis": kanji},
+        },
+    }
+
+
+def timed(name, fn):
+    start = time.perf_counter()
+    out = fn()
+    print(f"{name:>16}: {(time.perf_counter() - start) * 1000:9.1f}ms")
+    return out
+
+
+def from_files(fc):
+    replies = [reply_from_payload("kanji", fc.read(k)).data for k in fc.keys()]
+    picked = [
+        d
+        for d in replies
+        if d.strokes <= 10
+        and d.meta.education.jlpt in ("N5", "N4")
+        and d.meta.education.newspaper_rank
+    ]
+    picked.sort(key=lambda d: (d.meta.education.newspaper_rank, d.kanji))
+    return [d.kanji for d in picked[:50]]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--kanji", type=int, default=10000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        fc = FileCache(Path(tmp) / "kanji")
+        for i in range(args.kanji):
+            kanji = chr(0x4E00 + i)
+            fc.put(kanji, payload(kanji, rng))
+
+        expected = timed("files + sort", lambda: from_files(fc))
+
+        def build():
+            r = KanjiRanking(Path(tmp) / "index")
+            r.update(fc)
+            r.save()
+
+        timed("build ranking", build)
+        timed("update, no change", lambda: KanjiRanking(Path(tmp) / "index").update(fc))
+
+        def query():
+            r = KanjiRanking(Path(tmp) / "index")
+            return r.top("rank", k=50, strokes=(None, 10), jlpt=(4, 5))
+
+        got = timed("load + top 50", query)
+        assert got == expected
+
+
+if __name__ == "__main__":
+    main()
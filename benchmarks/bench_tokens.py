@@ -0,0 +1,79 @@
+"""Throughput of batched vs one-per-request tokenization.
+
+Runs against an in-process fake of jisho that answers every query with a
+zen_bar of one token per character, after `--latency` seconds, so the
+numbers show round trips saved rather than jisho's own speed.
+
+    python benchmarks/bench_tokens.py --sentences 200 --latency 0.05
+"""
+import argparse
+import random
+import time
+from urllib.parse import unquote
+
+from jisho_api.client import Client
+from jisho_api.tokenize.request import Tokens
+
+KANA = "あいうえおかきくけこさしすせそたちつてとなにぬねのまみむめもやゆよらりるれろわを"
+
+
+class FakeJisho:
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.requests = 0
+
+    def get(self, url, headers=None):
+        self.requests += 1
+        time.sleep(self.latency)
+        query = unquote(url.rsplit("/", 1)[1])
+        items = "".join(
+            f'<li data-pos="Noun"><span class="japanese_word__text_wrapper">'
+            f'<a data-word="{ch}">{ch}</a></span></li>'
+            if ch != Tokens.DELIMITER
+            else f'<li><span class="japanese_word__text_wrapper">{ch}</span></li>'
+            for ch in query
+        )
+        self.content = f'<section id="zen_bar"><ul>{items}</ul></section>'.encode()
+        return self
+
+    def metrics(self):
+        return {"requests": self.requests}
+
+
+def run(name, fn, sentences, latency):
+    fake = FakeJisho(latency)
+    client = Client(transport=fake)
+    start = time.perf_counter()
+    fn(sentences, client)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{name:>8}: {len(sentences) / elapsed:8.1f} sentences/s, "
+        f"{fake.requests} requests, {elapsed:.2f}s"
+    )
+
+
+def one_per_request(sentences, client):
+    for s in sentences:
+        Tokens.request(s, client=client)
+
+
+def batched(sentences, client):
+    Tokens.request_batch(sentences, client=client)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sentences", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    sentences = [
+        "".join(rng.choices(KANA, k=rng.randint(8, 30))) for _ in range(args.sentences)
+    ]
+    run("single", one_per_request, sentences, args.latency)
+    run("batched", batched, sentences, args.latency)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,13 @@
-def scrape(cls, words, root_dump):
-    from pathlib import Path
+def scrape(cls, words, root_dump, client=None):
+    from jisho_api.stream import iter_scrape
 
-    cls.ROOT = Path(root_dump)
-    nwords = {}
-    for i, w in enumerate(words):
-        # 0 - name should be between quotes to search specifically for it
-        # with a * it is a wildcard, to see applications of this word at the end
-        strict = "*" not in w
-        if strict:
-            w = f'"{w}"'
+    # requests are cached under root_dump, cls.ROOT is left alone
+    return dict(iter_scrape(cls, words, cache_root=root_dump, client=client))
 
-        # 1 - make request
-        wr = cls.request(w, cache=True)
-        if wr is None:
-            continue
-        nwords[w] = wr
-    return nwords
+
+def iter_scrape(cls, words, dump=None, cache_root=None, headers=None, client=None):
+    from jisho_api.stream import iter_scrape
+
+    return iter_scrape(
+        cls, words, dump=dump, cache_root=cache_root, headers=headers, client=client
+    )
@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+from jisho_api import timing
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# queries with no matches are remembered for a day, then asked again
+NEGATIVE_TTL = 24 * 60 * 60
+EMPTY_STATUS = 404
+
+
+class CacheError(ValueError):
+    pass
+
+
+def empty_payload() -> dict[str, Any]:
+    return {"meta": {"status": EMPTY_STATUS}, "data": []}
+
+
+def is_empty(payload: dict[str, Any]) -> bool:
+    return payload.get("meta", {}).get("status") == EMPTY_STATUS
+
+
+class FileCache:
+    """One JSON file per query under `root`.
+
+    Known-empty queries are stored as a small marker payload next to the
+    real results, and expire after `negative_ttl` seconds. Results expire
+    after `ttl` seconds, or never when it is None.
+    """
+
+    HIT = "hit"
+    EMPTY = "empty"
+    EXPIRED = "expired"
+    MISS = "miss"
+
+    def __init__(
+        self,
+        root: Path | str,
+        ttl: float | None = None,
+        negative_ttl: float | None = NEGATIVE_TTL,
+    ):
+        self.root = Path(root)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+
+    def path(self, key: str) -> Path:
+        return self.root / f"{key}.json"
+
+    def _expired(self, p: Path, empty: bool) -> bool:
+        ttl = self.negative_ttl if empty else self.ttl
+        return ttl is not None and time.time() - p.stat().st_mtime > ttl
+
+    def read(self, key: str) -> dict[str, Any] | None:
+        """Stored payload for `key`, expired or not; raises `CacheError` on bad files."""
+        p = self.path(key)
+        if not p.exists():
+            return None
+        with timing.span("cache.read"):
+            with open(p, "r", encoding="utf-8") as fp:
+                content = fp.read()
+            if not content:
+                raise CacheError(f"Cached file is empty for {key}.")
+            try:
+                return json.loads(content)
+            except json.JSONDecodeError:
+                raise CacheError(f"Cached file is corrupted for {key}.")
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Cached payload for `key`, or None when it was never fetched or has expired.
+
+        Known-empty queries return the marker payload, check it with `is_empty`.
+        """
+        payload = self.read(key)
+        if payload is None or self._expired(self.path(key), is_empty(payload)):
+            return None
+        return payload
+
+    def status(self, key: str) -> str:
+        try:
+            payload = self.read(key)
+        except CacheError:
+            return self.MISS
+        if payload is None:
+            return self.MISS
+        empty = is_empty(payload)
+        if self._expired(self.path(key), empty):
+            return self.EXPIRED
+        return self.EMPTY if empty else self.HIT
+
+    def put(self, key: str, payload: dict[str, Any]) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        with timing.span("cache.write"), open(
+            self.path(key), "w", encoding="utf-8"
+        ) as fp:
+            json.dump(payload, fp, indent=4, ensure_ascii=False)
+
+    def put_empty(self, key: str) -> None:
+        self.put(key, empty_payload())
+
+    def keys(self) -> list[str]:
+        if not self.root.exists():
+            return []
+        return [p.stem for p in self.root.glob("*.json")]
+
+    def stats(self) -> dict[str, int]:
+        counts = {self.HIT: 0, self.EMPTY: 0, self.EXPIRED: 0, self.MISS: 0}
+        for key in self.keys():
+            counts[self.status(key)] += 1
+        # files that exist but can not be read count as corrupted, not as misses
+        return {
+            "entries": counts[self.HIT],
+            "empty": counts[self.EMPTY],
+            "expired": counts[self.EXPIRED],
+            "corrupted": counts[self.MISS],
+        }
+
+
+class SlugCache(FileCache):
+    """Word results with every entry stored once, by slug.
+
+    Entries live under `root/entries/`, one file per slug, and the file of
+    a query only lists the slugs of its results in order, so overlapping
+    queries such as "water", "水" and "mizu" share their entries, and
+    writing an entry updates every query that contains it. Reads rebuild
+    the full payload; files written by a `FileCache` are read as they are.
+    Writers share a lock file of the root and `collect` takes it alone, so
+    it never removes an entry a query is being written for.
+    """
+
+    ENTRIES = "entries"
+    LOCK = ".lock"
+    # without fcntl, writers and collect of one process take turns
+    _lock = threading.Lock()
+
+    @contextmanager
+    def _locked(self, exclusive: bool = False) -> Iterator[None]:
+        if fcntl is None:
+            with self._lock:
+                yield
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.root / self.LOCK, "a") as fp:
+            fcntl.flock(fp, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(fp, fcntl.LOCK_UN)
+
+    def entry_path(self, slug: str) -> Path:
+        return self.root / self.ENTRIES / f"{urllib.parse.quote(slug, safe='')}.json"
+
+    def _write(self, p: Path, obj: Any) -> None:
+        # concurrent writers of a shared entry, in any process, each replace it whole
+        tmp = p.with_name(f"{p.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as fp:
+            json.dump(obj, fp, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, p)
+
+    def read(self, key: str) -> dict[str, Any] | None:
+        payload = super().read(key)
+        if payload is None or "slugs" not in payload:
+            return payload
+        payload = dict(payload)
+        data = []
+        for slug in payload.pop("slugs"):
+            try:
+                with open(self.entry_path(slug), "r", encoding="utf-8") as fp:
+                    data.append(json.load(fp))
+            except (OSError, json.JSONDecodeError):
+                raise CacheError(
+                    f"Cached entry {slug} is missing or corrupted for {key}."
+                )
+        payload["data"] = data
+        return payload
+
+    def put(self, key: str, payload: dict[str, Any]) -> None:
+        from jisho_api.vocab import WORD_FIELDS, unpack
+
+        if is_empty(payload):
+            super().put(key, payload)
+            return
+        payload = unpack(payload, WORD_FIELDS)
+        (self.root / self.ENTRIES).mkdir(parents=True, exist_ok=True)
+        with timing.span("cache.write"), self._locked():
+            for entry in payload["data"]:
+                self._put_entry(entry)
+            query = {k: v for k, v in payload.items() if k != "data"}
+            query["slugs"] = [entry["slug"] for entry in payload["data"]]
+            self._write(self.path(key), query)
+
+    def entry(self, slug: str) -> dict[str, Any] | None:
+        p = self.entry_path(slug)
+        if not p.exists():
+            return None
+        with open(p, "r", encoding="utf-8") as fp:
+            return json.load(fp)
+
+    def put_entry(self, entry: dict[str, Any]) -> bool:
+        """Store one entry, unless it is stored as is already; True when written."""
+        with self._locked():
+            return self._put_entry(entry)
+
+    def _put_entry(self, entry: dict[str, Any]) -> bool:
+        p = self.entry_path(entry["slug"])
+        try:
+            if self.entry(entry["slug"]) == entry:
+                return False
+        except json.JSONDecodeError:
+            pass
+        p.parent.mkdir(parents=True, exist_ok=True)
+        self._write(p, entry)
+        return True
+
+    def referenced(self) -> set[str]:
+        slugs: set[str] = set()
+        for key in self.keys():
+            try:
+                payload = super().read(key)
+            except CacheError:
+                continue
+            if payload is not None:
+                slugs.update(payload.get("slugs", ()))
+        return slugs
+
+    def collect(self, dry_run: bool = False) -> tuple[int, int]:
+        """Remove entries no query refers to; returns how many and their bytes."""
+        root = self.root / self.ENTRIES
+        if not root.exists():
+            return 0, 0
+        removed = freed = 0
+        with self._locked(exclusive=True):
+            keep = {self.entry_path(s).name for s in self.referenced()}
+            for p in root.glob("*.json"):
+                if p.name in keep:
+                    continue
+                removed += 1
+                freed += p.stat().st_size
+                if not dry_run:
+                    p.unlink(missing_ok=True)
+        return removed, freed
+
+
+class MemoryCache:
+    """Thread-safe LRU cache kept in memory, in front of a `FileCache`."""
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._data: OrderedDict[Any, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._data
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        with self._lock:
+            try:
+                self._data.move_to_end(key)
+            except KeyError:
+                self.misses += 1
+                return default
+            self.hits += 1
+            return self._data[key]
+
+    def put(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -4,10 +4,15 @@ from pathlib import Path
 
 import click
 from rich.console import Console
+from rich.rule import Rule
 
 console = Console()
+# printed between entries; the same line Markdown("---") draws, without parsing it each time
+RULE = Rule(style="markdown.hr")
 from rich.progress import Progress
-from typing import List
+from typing import List, Optional
+
+from jisho_api.util import CLITagger, quote_term
 
 
 @click.group()
@@ -16,54 +21,138 @@ def main():
     pass
 
 
+def _start_profiling(profile: bool, dump_profile: Optional[str] = None):
+    ctx = click.get_current_context()
+    if profile:
+        from jisho_api import timing
+
+        timing.enable()
+        ctx.call_on_close(timing.rich_print)
+
+    if dump_profile is None:
+        return
+    if dump_profile.endswith(".html"):
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            raise click.UsageError("HTML profiles need pyinstrument installed.")
+
+        profiler = Profiler()
+        profiler.start()
+
+        def dump():
+            profiler.stop()
+            with open(dump_profile, "w", encoding="utf-8") as fp:
+                fp.write(profiler.output_html())
+
+    else:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+        def dump():
+            profiler.disable()
+            profiler.dump_stats(dump_profile)
+
+    def close():
+        dump()
+        console.print(f"Profile written to '{dump_profile}'")
+
+    ctx.call_on_close(close)
+
+
 @click.group()
-def search():
+@click.option("--profile", type=bool, is_flag=True, help="Print time spent per stage.")
+def search(profile: bool):
     """Search jisho.org for words, kanjis, or sentences."""
-    pass
+    _start_profiling(profile)
 
 
 @click.group()
-def scrape():
+@click.option("--profile", type=bool, is_flag=True, help="Print time spent per stage.")
+@click.option(
+    "--dump-profile",
+    default=None,
+    help="Write a cProfile dump of the run, or a pyinstrument report for *.html.",
+)
+def scrape(profile: bool, dump_profile: Optional[str]):
     """Scrape requests, given a list of search terms."""
-    pass
+    _start_profiling(profile, dump_profile)
 
 
 @click.command(name="config")
-def config():
+@click.option("--show", type=bool, is_flag=True, help="Print the settings in effect.")
+def config(show: bool):
     """Set ~/.jisho/config.json with cache settings."""
+    from jisho_api.config import CONFIG_PATH, get_config, reload_config
+
+    if show:
+        click.echo(get_config().model_dump_json(indent=4))
+        return
+
     val = click.confirm("Cache enabled?")
-    p = Path.home() / ".jisho"
-    p.mkdir(exist_ok=True)
-    with open(p / "config.json", "w") as fp:
-        json.dump({"cache": val}, fp, indent=4)
+    cfg = {}
+    if CONFIG_PATH.exists():
+        try:
+            with open(CONFIG_PATH, "r") as fp:
+                cfg = json.load(fp)
+        except ValueError:
+            cfg = None
+        if not isinstance(cfg, dict):
+            console.print("[red bold][Error] [white] The config file is invalid, starting over.")
+            cfg = {}
+    cfg["cache"] = val
+    CONFIG_PATH.parent.mkdir(exist_ok=True)
+    with open(CONFIG_PATH, "w") as fp:
+        json.dump(cfg, fp, indent=4)
+    reload_config()
     console.print("Config written to '.jisho/config.json'")
 
 
-def _get_home_config():
-    p = Path.home() / ".jisho/config.json"
-    if p.exists():
-        with open(p, "r") as fp:
-            return json.load(fp)
-    else:
-        return None
+def _cache_enabled(kind: str) -> bool:
+    from jisho_api.config import get_config
 
+    return bool(get_config().kind(kind).cache)
 
-def _cache_enabled():
-    cfg = _get_home_config()
-    if cfg:
-        return cfg["cache"]
-    return False
+
+def _workers(workers: Optional[int], kind: Optional[str] = None) -> int:
+    from jisho_api.config import get_config
+
+    if workers is not None:
+        return workers
+    cfg = get_config()
+    return cfg.kind(kind).concurrency if kind else cfg.workers
+
+
+def delta_scraper(cls, words: List[str], sample: Optional[int] = None):
+    from jisho_api.delta import delta_scrape
+    from jisho_api.kinds import kind_of
+
+    words = [quote_term(w) for w in words if w]
+    with Progress(console=console, transient=True) as progress:
+        task1 = progress.add_task("[green]Scraping...", total=len(words))
+        report = delta_scrape(
+            cls,
+            words,
+            sample=sample,
+            workers=_workers(None, kind_of(cls)),
+            advance=lambda: progress.advance(task1),
+        )
+    console.print(
+        CLITagger.colorize("Added", report.added, "green")
+        + CLITagger.colorize("Changed", report.changed, "yellow")
+        + CLITagger.colorize("Removed", report.removed, "red")
+        + CLITagger.colorize("Unchanged", report.unchanged, "white")
+        + CLITagger.colorize("Failed", report.failed, "red", last=True)
+    )
 
 
 def scraper(cls, words: List[str], root_dump: Path, cache: bool = True):
     with Progress(console=console, transient=True) as progress:
         task1 = progress.add_task("[green]Scraping...", total=len(words))
         for w in words:
-            # 0 - name should be between quotes to search specifically for it
-            # with a * it is a wildcard, to see applications of this word at the end
-            strict = "*" not in w
-            if strict:
-                w = f'"{w}"'
+            w = quote_term(w)
 
             # 1 - if file exists do not request
             word_path = root_dump / f"{w}.json"
@@ -80,6 +169,13 @@ def scraper(cls, words: List[str], root_dump: Path, cache: bool = True):
             progress.advance(task1)
 
 
+def _dump_root(cls) -> Path:
+    # the configured cache folder of `cls`, which requests write to
+    from jisho_api.client import default_client
+
+    return default_client().cache_for(cls).root
+
+
 def _load_words(file_path):
     with open(file_path, "r") as fp:
         txt = fp.read()
@@ -89,11 +185,17 @@ def _load_words(file_path):
 
 @click.command(name="word")
 @click.argument("file_path")
-def scrape_words(file_path: str):
+@click.option("--incremental", type=bool, is_flag=True, help="Only write entries that changed.")
+@click.option("--sample", type=int, default=None, help="Revalidate at most N cached entries.")
+def scrape_words(file_path: str, incremental: bool, sample: Optional[int]):
     """Scrape list of words in txtfile, separated by newline."""
     from jisho_api.word.request import Word
 
-    root_dump = Word.ROOT
+    if incremental:
+        delta_scraper(Word, _load_words(file_path), sample=sample)
+        return
+
+    root_dump = _dump_root(Word)
     root_dump.mkdir(parents=True, exist_ok=True)
 
     scraper(Word, _load_words(file_path), root_dump)
@@ -101,11 +203,17 @@ def scrape_words(file_path: str):
 
 @click.command(name="kanji")
 @click.argument("file_path")
-def scrape_kanji(file_path: str):
+@click.option("--incremental", type=bool, is_flag=True, help="Only write entries that changed.")
+@click.option("--sample", type=int, default=None, help="Revalidate at most N cached entries.")
+def scrape_kanji(file_path: str, incremental: bool, sample: Optional[int]):
     """Scrape list of kanji in txtfile, separated by newline."""
     from jisho_api.kanji.request import Kanji
 
-    root_dump = Kanji.ROOT
+    if incremental:
+        delta_scraper(Kanji, _load_words(file_path), sample=sample)
+        return
+
+    root_dump = _dump_root(Kanji)
     root_dump.mkdir(parents=True, exist_ok=True)
 
     scraper(Kanji, _load_words(file_path), root_dump)
@@ -113,11 +221,17 @@ def scrape_kanji(file_path: str):
 
 @click.command(name="sentence")
 @click.argument("file_path")
-def scrape_sentence(file_path: str):
+@click.option("--incremental", type=bool, is_flag=True, help="Only write entries that changed.")
+@click.option("--sample", type=int, default=None, help="Revalidate at most N cached entries.")
+def scrape_sentence(file_path: str, incremental: bool, sample: Optional[int]):
     """Scrape list of sentence in txtfile, separated by newline."""
     from jisho_api.sentence.request import Sentence
 
-    root_dump = Sentence.ROOT
+    if incremental:
+        delta_scraper(Sentence, _load_words(file_path), sample=sample)
+        return
+
+    root_dump = _dump_root(Sentence)
     root_dump.mkdir(parents=True, exist_ok=True)
 
     scraper(Sentence, _load_words(file_path), root_dump)
@@ -125,70 +239,740 @@ def scrape_sentence(file_path: str):
 
 @click.command(name="tokens")
 @click.argument("file_path")
-def scrape_tokens(file_path: str):
+@click.option("--incremental", type=bool, is_flag=True, help="Only write entries that changed.")
+@click.option("--sample", type=int, default=None, help="Revalidate at most N cached entries.")
+@click.option("--batch", type=bool, is_flag=True, help="Tokenize several sentences per request.")
+def scrape_tokens(file_path: str, incremental: bool, sample: Optional[int], batch: bool):
     """Scrape list of tokens in txtfile, separated by newline."""
     from jisho_api.tokenize.request import Tokens
 
-    root_dump = Tokens.ROOT
+    if batch:
+        sentences = [s for s in _load_words(file_path) if s]
+        with console.status("[green]Tokenizing..."):
+            res = Tokens.request_batch(sentences, cache=True)
+        console.print(
+            CLITagger.colorize("Sentences", len(res), "green")
+            + CLITagger.colorize(
+                "Failed", sum(r is None for r in res.values()), "red", last=True
+            )
+        )
+        return
+
+    if incremental:
+        delta_scraper(Tokens, _load_words(file_path), sample=sample)
+        return
+
+    root_dump = _dump_root(Tokens)
     root_dump.mkdir(parents=True, exist_ok=True)
 
     scraper(Tokens, _load_words(file_path), root_dump)
 
 
+def _search(kind: str, term: str, cache: bool, daemon: bool, reading: bool = False):
+    from jisho_api.kinds import reply_model, request_class
+
+    if daemon:
+        from jisho_api import server
+
+        try:
+            r = server.query(kind, term)
+        except OSError as e:
+            console.print(
+                f"[red bold][Error] [white] Daemon lookup failed ({e}), searching directly."
+            )
+        else:
+            if r is None:
+                console.print(f"[red bold][Error] [white] No matches found for {term}.")
+                return None
+            return reply_model(kind)(**r)
+    if cache and kind == "word":
+        term = _resolve_reading(term, reading)
+    return request_class(kind).request(term, cache=cache)
+
+
+def _word_index(cls, name: str):
+    # kept next to the word cache, and only fed the files written since the last run
+    from jisho_api.client import default_client
+    from jisho_api.word.request import Word
+
+    fc = default_client().cache_for(Word)
+    path = fc.root.parent / f"word_{name}.json"
+    index = cls.load(path)
+    if index.update(fc):
+        index.save(path)
+    return index
+
+
+def _resolve_reading(term: str, reading: bool = False) -> str:
+    # a kana search, or a romaji one with --reading, for a cached entry reuses its cache key
+    from jisho_api.client import default_client
+    from jisho_api.kana import ReadingIndex, is_kana
+    from jisho_api.word.request import Word
+
+    if not (reading or is_kana(term)):
+        return term
+    fc = default_client().cache_for(Word)
+    if fc.status(term) != fc.MISS:
+        return term
+    hits = _word_index(ReadingIndex, "readings").lookup(term)
+    return hits[0] if hits else term
+
+
+def _preflight(word: str, reading: bool = False) -> Optional[str]:
+    # before any request: the cache key that answers `word` offline, if any,
+    # otherwise print the close cached matches
+    from jisho_api.client import default_client
+    from jisho_api.fuzzy import FuzzyIndex
+    from jisho_api.word.request import Word
+
+    fc = default_client().cache_for(Word)
+    term = _resolve_reading(word, reading)
+    if fc.status(term) in (fc.HIT, fc.EMPTY):
+        return term
+    suggestions = _word_index(FuzzyIndex, "fuzzy").suggest(word)
+    if suggestions and suggestions[0].distance == 0:
+        return suggestions[0].terms[0]
+    if suggestions:
+        console.print("[yellow]Did you mean:")
+        for s in suggestions:
+            console.print(CLITagger.bullet(f"{s.text} [blue]({', '.join(s.terms)})"))
+    return None
+
+
+def _cached_word(term: str):
+    # read straight from the cache, expired or not, so nothing is requested
+    from jisho_api.cache import CacheError, is_empty
+    from jisho_api.client import default_client
+    from jisho_api.kinds import reply_from_payload
+    from jisho_api.word.request import Word
+
+    try:
+        payload = default_client().cache_for(Word).read(term)
+    except CacheError:
+        payload = None
+    if payload is None or is_empty(payload):
+        console.print(f"[red bold][Error] [white] No matches found for {term}.")
+        return None
+    return reply_from_payload("word", payload)
+
+
+@click.command(name="serve")
+@click.option("--host", default="127.0.0.1", show_default=True)
+@click.option("--port", default=8765, show_default=True)
+@click.option("--no-cache", type=bool, is_flag=True, help="Do not use the disk cache.")
+@click.option("--memory-size", type=int, default=None, help="Replies kept in memory.")
+@click.option("--workers", type=int, default=None, help="Threads, from the config when unset.")
+@click.option("--access-log", default=None, help="Record lookups, for `jisho warm --log`.")
+def serve(
+    host: str,
+    port: int,
+    no_cache: bool,
+    memory_size: Optional[int],
+    workers: Optional[int],
+    access_log: Optional[str],
+):
+    """Run a local HTTP/JSON lookup daemon with warm caches."""
+    from jisho_api.config import get_config
+    from jisho_api.server import serve as run
+
+    console.print(f"Serving jisho lookups on http://{host}:{port}")
+    run(
+        host=host,
+        port=port,
+        cache=not no_cache,
+        memory_size=memory_size or get_config().memory_size,
+        workers=_workers(workers),
+        access_log=access_log,
+    )
+
+
+@click.command(name="warm")
+@click.option("--word", "words", multiple=True, help="Word list, one per line.")
+@click.option("--kanji", "kanji", multiple=True, help="File with a kanji set.")
+@click.option("--sentence", "sentences", multiple=True, help="Sentence search terms.")
+@click.option("--tokens", "tokens", multiple=True, help="Sentences to tokenize.")
+@click.option("--log", "logs", multiple=True, help="Access log of `jisho serve`.")
+@click.option("--workers", type=int, default=None, help="Threads, from the config when unset.")
+def warm(
+    words: List[str],
+    kanji: List[str],
+    sentences: List[str],
+    tokens: List[str],
+    logs: List[str],
+    workers: Optional[int],
+):
+    """Prefetch word lists, kanji sets or logged lookups into the cache."""
+    from jisho_api.warm import PrefetchPlan, warm as run
+
+    plan = PrefetchPlan()
+    for kind, paths in (
+        ("word", words),
+        ("kanji", kanji),
+        ("sentence", sentences),
+        ("tokens", tokens),
+    ):
+        for path in paths:
+            plan.add_file(kind, path)
+    for path in logs:
+        plan.add_access_log(path)
+
+    with Progress(console=console, transient=True) as progress:
+        task = progress.add_task("[green]Warming...", total=len(plan))
+        report = run(
+            plan, workers=_workers(workers), advance=lambda: progress.advance(task)
+        )
+
+    console.print(
+        CLITagger.colorize("Planned", report.planned, "yellow")
+        + CLITagger.colorize("Cached", report.already_cached, "yellow")
+        + CLITagger.colorize("Fetched", report.fetched, "green")
+        + CLITagger.colorize("Empty", report.empty, "magenta")
+        + CLITagger.colorize("Failed", report.failed, "red", last=True)
+    )
+    console.print(
+        CLITagger.colorize("Coverage", f"{report.coverage:.1%}", "blue")
+        + CLITagger.colorize(
+            "Est. hit rate", f"{report.estimated_hit_rate:.1%}", "blue", last=True
+        )
+    )
+
+
+@click.command(name="crawl")
+@click.argument("out_dir")
+@click.option("--word", "words", multiple=True, help="Word to start from.")
+@click.option("--kanji", "kanji", multiple=True, help="Kanji to start from.")
+@click.option("--depth", default=2, show_default=True)
+@click.option("--budget", default=1000, show_default=True, help="Max nodes to fetch.")
+@click.option("--workers", type=int, default=None, help="Threads, from the config when unset.")
+def crawl(
+    out_dir: str,
+    words: List[str],
+    kanji: List[str],
+    depth: int,
+    budget: int,
+    workers: Optional[int],
+):
+    """Crawl words and kanji breadth-first into OUT_DIR/edges.tsv, resuming if possible."""
+    from jisho_api.crawl import Crawler
+
+    c = Crawler(out_dir, max_depth=depth, budget=budget, workers=_workers(workers))
+    for w in words:
+        c.seed("word", w)
+    for k in kanji:
+        c.seed("kanji", k)
+
+    with Progress(console=console, transient=True) as progress:
+        task = progress.add_task("[green]Crawling...", total=max(budget - c.fetched, 0))
+        n = c.run(advance=lambda: progress.advance(task))
+    console.print(
+        f"Fetched {n} nodes ({c.failed} failed in all), {len(c.frontier)} left in the frontier. "
+        f"Edges written to '{Path(out_dir) / 'edges.tsv'}'"
+    )
+
+
+@click.command(name="harvest")
+@click.argument("out_dir")
+@click.argument("file_path")
+@click.option("--pages", type=int, default=None, help="Max result pages per word.")
+@click.option("--workers", type=int, default=None, help="Threads, from the config when unset.")
+@click.option("--refresh", type=bool, is_flag=True, help="Fetch words already harvested again.")
+def harvest(
+    out_dir: str,
+    file_path: str,
+    pages: Optional[int],
+    workers: Optional[int],
+    refresh: bool,
+):
+    """Collect example sentences for the words in FILE_PATH into OUT_DIR, deduplicated."""
+    from jisho_api.harvest import SentenceStore, harvest as run
+
+    store = SentenceStore(out_dir)
+    words = [w for w in _load_words(file_path) if w]
+    with Progress(console=console, transient=True) as progress:
+        task = progress.add_task("[green]Harvesting...", total=len(words))
+        report = run(
+            store,
+            words,
+            max_pages=pages,
+            workers=_workers(workers, "sentence"),
+            refresh=refresh,
+            advance=lambda: progress.advance(task),
+        )
+    console.print(
+        CLITagger.colorize("Words", report.words, "green")
+        + CLITagger.colorize("Skipped", report.skipped, "yellow")
+        + CLITagger.colorize("Pages", report.pages, "blue")
+        + CLITagger.colorize("New", report.new, "green")
+        + CLITagger.colorize("Duplicates", report.duplicates, "magenta")
+        + CLITagger.colorize("Failed", report.failed, "red", last=True)
+    )
+    console.print(f"{len(store)} sentences for {len(store.words())} words in '{out_dir}'")
+
+
+_FAKE_OPTIONS = [
+    click.option("--latency", default=0.05, show_default=True, help="Seconds per reply."),
+    click.option("--jitter", default=0.0, show_default=True, help="Extra random seconds."),
+    click.option("--error-rate", default=0.0, show_default=True, help="Share of 500s."),
+    click.option("--throttle-rate", default=0.0, show_default=True, help="Share of 429s."),
+    click.option("--retry-after", default=1.0, show_default=True, help="Of the 429s."),
+    click.option("--seed", type=int, default=None),
+]
+
+
+def _fake_options(f):
+    for option in reversed(_FAKE_OPTIONS):
+        f = option(f)
+    return f
+
+
+@click.command(name="fake-jisho")
+@click.option("--host", default="127.0.0.1", show_default=True)
+@click.option("--port", default=8000, show_default=True)
+@_fake_options
+def fake_jisho(host: str, port: int, **kwargs):
+    """Run a stand-in for jisho.org that serves bundled fixtures."""
+    import asyncio
+
+    from jisho_api.fake import FakeJisho
+
+    fake = FakeJisho(host=host, port=port, **kwargs)
+    console.print(f"Serving fake jisho on http://{host}:{port}")
+    asyncio.run(fake.serve_forever())
+
+
+@click.command(name="loadtest")
+@click.option("--url", default=None, help="Server to load, an in-process fake jisho if unset.")
+@click.option(
+    "--kind",
+    "kinds",
+    multiple=True,
+    type=click.Choice(["word", "kanji", "sentence", "tokens"]),
+    help="Request kind, all of them by default.",
+)
+@click.option(
+    "--mode",
+    "modes",
+    multiple=True,
+    type=click.Choice(["sync", "async", "batch"]),
+    help="Lookup path, all of them by default; batch is tokens only.",
+)
+@click.option("--requests", "n", default=1000, show_default=True, help="Lookups per run.")
+@click.option("--concurrency", default=200, show_default=True)
+@click.option("--http2", is_flag=True, help="Multiplex over one HTTP/2 connection (needs httpx).")
+@_fake_options
+def loadtest(
+    url: Optional[str],
+    kinds: List[str],
+    modes: List[str],
+    n: int,
+    concurrency: int,
+    http2: bool,
+    **kwargs,
+):
+    """Drive lookups against a fake jisho and report latency percentiles and throughput."""
+    from jisho_api.fake import FakeJisho
+    from jisho_api.loadgen import MODES, load_client, run_load
+
+    fake = None
+    if url is None:
+        fake = FakeJisho(**kwargs)
+        url = fake.start()
+    runs = [
+        (kind, mode)
+        for kind in kinds or ["word", "kanji", "sentence", "tokens"]
+        for mode in modes or MODES
+        if mode != "batch" or kind == "tokens"
+    ]
+    try:
+        for kind, mode in runs:
+            # a fresh transport per run, so rate limits do not carry over
+            try:
+                client = load_client(url, concurrency, http2=http2)
+            except ImportError as e:
+                console.print(f"[red bold][Error] [white] {e}")
+                return
+            try:
+                report = run_load(client, kind, mode, requests=n, concurrency=concurrency)
+            finally:
+                # the transport is this run's own, with its pooled connections
+                client.close()
+                client.transport.close()
+            console.print(
+                f"[green]{kind:<9}[white]{mode:<6}"
+                + CLITagger.colorize("P50", f"{report.p50:.1f}ms", "yellow")
+                + CLITagger.colorize("P95", f"{report.p95:.1f}ms", "yellow")
+                + CLITagger.colorize("P99", f"{report.p99:.1f}ms", "yellow")
+                + CLITagger.colorize("Throughput", f"{report.throughput:.1f}/s", "blue")
+                + CLITagger.colorize("Errors", report.errors, "red", last=True)
+            )
+    finally:
+        if fake is not None:
+            fake.stop()
+            console.print(
+                CLITagger.colorize("Served", fake.counts["requests"], "green")
+                + CLITagger.colorize("Connections", fake.counts["connections"], "blue")
+                + CLITagger.colorize("Injected errors", fake.counts["errors"], "red")
+                + CLITagger.colorize(
+                    "Throttled", fake.counts["throttled"], "red", last=True
+                )
+            )
+
+
+def _parse_range(value: Optional[str]):
+    # "5", "1-8", "-8" or "3-"
+    if value is None:
+        return None
+    lo, sep, hi = value.partition("-")
+    try:
+        lo = int(lo) if lo else None
+        hi = (int(hi) if hi else None) if sep else lo
+    except ValueError:
+        raise click.BadParameter(f"expected N, MIN-MAX, -MAX or MIN-, got {value!r}")
+    return lo, hi
+
+
+@click.command(name="rank")
+@click.option(
+    "--order",
+    type=click.Choice(["strokes", "rank", "grade", "jlpt"]),
+    default="rank",
+    show_default=True,
+    help="Column to sort by; rank is the newspaper frequency rank.",
+)
+@click.option("--desc", type=bool, is_flag=True, help="Largest values first.")
+@click.option("-k", "k", default=50, show_default=True, help="Kanji to list, 0 for all.")
+@click.option("--strokes", default=None, help="Stroke count, N or MIN-MAX.")
+@click.option("--rank", "rank_", default=None, help="Frequency rank, N or MIN-MAX.")
+@click.option("--grade", default=None, help="School grade, N or MIN-MAX; 8 is junior high.")
+@click.option("--jlpt", default=None, help="JLPT level, N or MIN-MAX; 5 is N5.")
+def rank(
+    order: str,
+    desc: bool,
+    k: int,
+    strokes: Optional[str],
+    rank_: Optional[str],
+    grade: Optional[str],
+    jlpt: Optional[str],
+):
+    """List cached kanji by strokes, frequency, grade or JLPT level, for study lists."""
+    from jisho_api.client import default_client
+    from jisho_api.kanji.request import Kanji
+    from jisho_api.ranking import KanjiRanking
+
+    fc = default_client().cache_for(Kanji)
+    ranking = KanjiRanking(fc.root.parent / "kanji_index")
+    if ranking.update(fc):
+        ranking.save()
+
+    filters = {
+        name: r
+        for name, r in (
+            ("strokes", _parse_range(strokes)),
+            ("rank", _parse_range(rank_)),
+            ("grade", _parse_range(grade)),
+            ("jlpt", _parse_range(jlpt)),
+        )
+        if r is not None
+    }
+    for kanji in ranking.top(order, k=k or None, descending=desc, **filters):
+        v = ranking.values(kanji)
+        console.print(
+            f"[green]{kanji} "
+            + CLITagger.colorize("Strokes", v["strokes"] or "-", "yellow")
+            + CLITagger.colorize("Rank", v["rank"] or "-", "yellow")
+            + CLITagger.colorize("Grade", v["grade"] or "-", "magenta")
+            + CLITagger.colorize(
+                "JLPT", f"N{v['jlpt']}" if v["jlpt"] else "-", "magenta", last=True
+            )
+        )
+
+
+@click.group(name="cache")
+def cache():
+    """Inspect, verify, prune and compact the ~/.jisho/data cache."""
+    pass
+
+
+_KIND_OPTION = click.option(
+    "--kind",
+    "kinds",
+    multiple=True,
+    type=click.Choice(["word", "kanji", "sentence", "tokens"]),
+    help="Only this kind of cache, all of them by default.",
+)
+
+
+def _caches(kinds: List[str]):
+    from jisho_api.client import default_client
+    from jisho_api.kinds import KINDS, request_class
+
+    client = default_client()
+    return {k: client.cache_for(request_class(k)) for k in kinds or KINDS}
+
+
+def _parse_size(size: str) -> int:
+    units = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+    size = size.strip().upper().rstrip("B")
+    if size and size[-1] in units:
+        return int(float(size[:-1]) * units[size[-1]])
+    return int(size)
+
+
+@click.command(name="stats")
+@_KIND_OPTION
+@click.option("--workers", type=int, default=None, help="Threads, from the config when unset.")
+def cache_stats(kinds: List[str], workers: Optional[int]):
+    """Entries, bytes and age histogram per kind."""
+    from rich.table import Table
+
+    from jisho_api.maintenance import cache_stats as run
+
+    table = Table(show_edge=False)
+    stats = [
+        run(kind, fc, workers=_workers(workers)) for kind, fc in _caches(kinds).items()
+    ]
+    for col in ("kind", "files", "MB", "entries", "empty", "expired", "corrupted"):
+        table.add_column(col, justify="left" if col == "kind" else "right")
+    for col in stats[0].ages:
+        table.add_column(col, justify="right", style="blue")
+    for st in stats:
+        table.add_row(
+            st.kind,
+            str(st.files),
+            f"{st.bytes / (1 << 20):.2f}",
+            str(st.entries),
+            str(st.empty),
+            str(st.expired),
+            str(st.corrupted),
+            *map(str, st.ages.values()),
+        )
+    console.print(table)
+
+
+@click.command(name="verify")
+@_KIND_OPTION
+@click.option("--workers", type=int, default=None, help="Threads, from the config when unset.")
+@click.option("--remove", type=bool, is_flag=True, help="Delete files that fail to load.")
+def cache_verify(kinds: List[str], workers: Optional[int], remove: bool):
+    """Check every cached file parses and validates."""
+    from jisho_api.maintenance import verify
+
+    for kind, fc in _caches(kinds).items():
+        report = verify(kind, fc, workers=_workers(workers), remove=remove)
+        console.print(
+            CLITagger.colorize("Kind", kind, "yellow")
+            + CLITagger.colorize("Checked", report.checked, "green")
+            + CLITagger.colorize("Corrupted", len(report.corrupted), "red")
+            + CLITagger.colorize("Removed", report.removed, "red", last=True)
+        )
+        for term in report.corrupted:
+            console.print(CLITagger.bullet(term, color="red"))
+
+
+@click.command(name="prune")
+@_KIND_OPTION
+@click.option("--older-than", type=float, default=None, help="Remove files older than N days.")
+@click.option("--max-size", default=None, help="Byte budget, e.g. 500M, evicting least recently used.")
+@click.option("--workers", type=int, default=None, help="Threads, from the config when unset.")
+@click.option("--dry-run", type=bool, is_flag=True, help="Only report what would be removed.")
+def cache_prune(
+    kinds: List[str],
+    older_than: Optional[float],
+    max_size: Optional[str],
+    workers: Optional[int],
+    dry_run: bool,
+):
+    """Remove expired and corrupted files, and evict down to a size budget."""
+    from jisho_api.maintenance import DAY, prune
+
+    report = prune(
+        list(_caches(kinds).values()),
+        ttl=older_than * DAY if older_than is not None else None,
+        max_bytes=_parse_size(max_size) if max_size is not None else None,
+        workers=_workers(workers),
+        dry_run=dry_run,
+    )
+    console.print(
+        CLITagger.colorize("Removed", report.removed, "red")
+        + CLITagger.colorize("Freed", f"{report.freed / (1 << 20):.2f}MB", "red")
+        + CLITagger.colorize("Kept", report.kept, "green")
+        + CLITagger.colorize(
+            "Size", f"{report.kept_bytes / (1 << 20):.2f}MB", "green", last=True
+        )
+    )
+
+
+@click.command(name="compact")
+@_KIND_OPTION
+@click.option("--workers", type=int, default=None, help="Threads, from the config when unset.")
+def cache_compact(kinds: List[str], workers: Optional[int]):
+    """Rewrite cached files in the most compact format."""
+    from jisho_api.maintenance import compact
+
+    for kind, fc in _caches(kinds).items():
+        report = compact(kind, fc, workers=_workers(workers))
+        console.print(
+            CLITagger.colorize("Kind", kind, "yellow")
+            + CLITagger.colorize("Files", report.files, "green")
+            + CLITagger.colorize("Skipped", report.skipped, "red")
+            + CLITagger.colorize(
+                "Size",
+                f"{report.bytes_before / (1 << 20):.2f}MB -> "
+                f"{report.bytes_after / (1 << 20):.2f}MB",
+                "blue",
+                last=True,
+            )
+        )
+
+
+_FORMAT_OPTION = click.option(
+    "--format",
+    "fmt",
+    type=click.Choice(["rich", "json", "jsonl"]),
+    default="rich",
+    show_default=True,
+    help="json and jsonl print plain JSON, one entry per line for jsonl.",
+)
+
+
+def _emit(r, fmt: str, reverse: bool = True):
+    if fmt == "rich":
+        r.rich_print(reverse=reverse)
+        return
+    payload = r.model_dump(mode="json", exclude_unset=True, by_alias=True)
+    if fmt == "json":
+        click.echo(json.dumps(payload, ensure_ascii=False))
+        return
+    data = payload["data"]
+    for d in data if isinstance(data, list) else [data]:
+        click.echo(json.dumps(d, ensure_ascii=False))
+
+
+def _stream_pages(word: str, pages: int, fmt: str) -> bool:
+    from jisho_api.word.request import Word
+
+    # json is one document, so it has to wait for the last page
+    if fmt == "json":
+        merged = None
+        for r in Word.pages(word, max_pages=pages or None):
+            if merged is None:
+                merged = r
+            else:
+                merged.data.extend(r.data)
+        if merged is not None:
+            _emit(merged, fmt)
+        return merged is not None
+    # everything else is printed as each page arrives, in result order
+    found = False
+    for r in Word.pages(word, max_pages=pages or None):
+        _emit(r, fmt, reverse=False)
+        found = True
+    return found
+
+
 @click.command(name="word")
 @click.argument("word")
 @click.option("--cache", type=bool, is_flag=True)
 @click.option("--no-cache", type=bool, is_flag=True)
-def request_word(word: str, cache: bool, no_cache: bool):
+@click.option("--daemon", type=bool, is_flag=True, help="Ask a running `jisho serve`.")
+@click.option(
+    "--suggest",
+    type=bool,
+    is_flag=True,
+    help="Suggest close cached entries before searching, when the query is not cached.",
+)
+@click.option(
+    "--offline",
+    type=bool,
+    is_flag=True,
+    help="Answer from the cache and suggestions only, never asking jisho.",
+)
+@click.option(
+    "--reading", type=bool, is_flag=True, help="Look a romaji query up as a reading."
+)
+@click.option(
+    "--pages",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Result pages to stream, uncached; 0 for all of them.",
+)
+@_FORMAT_OPTION
+def request_word(
+    word: str,
+    cache: bool,
+    no_cache: bool,
+    daemon: bool,
+    suggest: bool,
+    offline: bool,
+    reading: bool,
+    pages: int,
+    fmt: str,
+):
     """Uses jisho.org word search API."""
-    from jisho_api.word.request import Word
-
-    flag = (cache or _cache_enabled()) and not no_cache
-    w = Word.request(word, cache=flag)
+    flag = (cache or _cache_enabled("word")) and not no_cache
+    if pages != 1 and (cache or daemon or reading or offline):
+        raise click.UsageError(
+            "--pages can not be combined with --cache, --daemon, --reading or --offline."
+        )
+    if suggest or offline:
+        term = _preflight(word, reading)
+        if offline:
+            if term is None:
+                console.print(f"[red bold][Error] [white] {word} is not cached.")
+                return
+            w = _cached_word(term)
+            if w:
+                _emit(w, fmt)
+            return
+    if pages != 1:
+        _stream_pages(word, pages, fmt)
+        return
+    w = _search("word", word, flag, daemon, reading=reading)
     if w:
-        w.rich_print()
+        _emit(w, fmt)
 
 
 @click.command(name="kanji")
 @click.argument("kanji")
 @click.option("--cache", type=bool, is_flag=True)
 @click.option("--no-cache", type=bool, is_flag=True)
-def request_kanji(kanji: str, cache: bool, no_cache: bool):
+@click.option("--daemon", type=bool, is_flag=True, help="Ask a running `jisho serve`.")
+@_FORMAT_OPTION
+def request_kanji(kanji: str, cache: bool, no_cache: bool, daemon: bool, fmt: str):
     """Uses #kanji filter on jisho.org search engine."""
-    from jisho_api.kanji.request import Kanji
-
-    flag = (cache or _cache_enabled()) and not no_cache
-    k = Kanji.request(kanji, cache=flag)
+    flag = (cache or _cache_enabled("kanji")) and not no_cache
+    k = _search("kanji", kanji, flag, daemon)
     if k:
-        k.rich_print()
+        _emit(k, fmt)
 
 
 @click.command(name="sentence")
 @click.argument("sentence")
 @click.option("--cache", type=bool, is_flag=True)
 @click.option("--no-cache", type=bool, is_flag=True)
-def request_sentence(sentence: str, cache: bool, no_cache: bool):
+@click.option("--daemon", type=bool, is_flag=True, help="Ask a running `jisho serve`.")
+@_FORMAT_OPTION
+def request_sentence(sentence: str, cache: bool, no_cache: bool, daemon: bool, fmt: str):
     """Uses #sentences filter on jisho.org search engine."""
-    from jisho_api.sentence.request import Sentence
-
-    flag = (cache or _cache_enabled()) and not no_cache
-    k = Sentence.request(sentence, cache=flag)
+    flag = (cache or _cache_enabled("sentence")) and not no_cache
+    k = _search("sentence", sentence, flag, daemon)
     if k:
-        k.rich_print()
+        _emit(k, fmt)
 
 
 @click.command(name="tokens")
 @click.argument("sentence")
 @click.option("--cache", type=bool, is_flag=True)
 @click.option("--no-cache", type=bool, is_flag=True)
-def request_tokens(sentence: str, cache: bool, no_cache: bool):
+@click.option("--daemon", type=bool, is_flag=True, help="Ask a running `jisho serve`.")
+@_FORMAT_OPTION
+def request_tokens(sentence: str, cache: bool, no_cache: bool, daemon: bool, fmt: str):
     """jisho.org default search engine tokenizer."""
-    from jisho_api.tokenize.request import Tokens
-
-    flag = (cache or _cache_enabled()) and not no_cache
-    k = Tokens.request(sentence, cache=flag)
+    flag = (cache or _cache_enabled("tokens")) and not no_cache
+    k = _search("tokens", sentence, flag, daemon)
     if k:
-        k.rich_print()
+        _emit(k, fmt)
 
 
 # =============
@@ -198,15 +982,30 @@ def make_cli():
     scrape.add_command(scrape_words)
     scrape.add_command(scrape_kanji)
     scrape.add_command(scrape_sentence)
+    scrape.add_command(scrape_tokens)
 
     search.add_command(request_word)
     search.add_command(request_kanji)
     search.add_command(request_sentence)
     search.add_command(request_tokens)
 
+    cache.add_command(cache_stats)
+    cache.add_command(cache_verify)
+    cache.add_command(cache_prune)
+    cache.add_command(cache_prune, name="gc")
+    cache.add_command(cache_compact)
+
     main.add_command(scrape)
     main.add_command(search)
     main.add_command(config)
+    main.add_command(serve)
+    main.add_command(warm)
+    main.add_command(crawl)
+    main.add_command(harvest)
+    main.add_command(fake_jisho)
+    main.add_command(loadtest)
+    main.add_command(rank)
+    main.add_command(cache)
     main()
 
 
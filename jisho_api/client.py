@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import requests
+
+from jisho_api.cache import NEGATIVE_TTL, FileCache, SlugCache
+from jisho_api.config import Config, get_config
+from jisho_api.kinds import kind_of, request_class
+from jisho_api.transport import Transport, default_transport
+
+
+class Client:
+    """Base URL, cache, HTTP session, rate limits and metrics for a set of lookups.
+
+    Every request class takes an optional `client`; without one they use
+    `default_client()`, which follows the `URL` and `ROOT` class attributes
+    and shares the module-wide transport. A `Client` with its own `root`
+    caches under `root/<kind>`, and gets its own `Transport` (session and
+    rate controller) unless one is given, so clients never share state
+    they were not explicitly given. With a `config`, TTLs and the cache
+    backend are taken per kind from it instead of `ttl` and `negative_ttl`.
+    `submit` runs requests on a thread pool of the client, started on first
+    use and shut down by `close`.
+    """
+
+    WORKERS = 8
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        root: Path | str | None = None,
+        transport: Transport | None = None,
+        ttl: float | None = None,
+        negative_ttl: float | None = NEGATIVE_TTL,
+        config: Config | None = None,
+    ):
+        self.base_url = base_url.rstrip("/") if base_url else None
+        self.root = Path(root) if root is not None else None
+        self.transport = transport or Transport()
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.config = config
+        self._lock = threading.Lock()
+        self._counts = {"cache_hits": 0, "cache_misses": 0, "fetches": 0, "errors": 0}
+        self._local = threading.local()
+        self._executor: ThreadPoolExecutor | None = None
+        self._inflight: dict[tuple[str, str, bool], Future] = {}
+
+    def url(self, cls) -> str:
+        if self.base_url is None:
+            return cls.URL
+        return self.base_url + cls.PATH
+
+    @classmethod
+    def from_config(cls, config: Config, transport: Transport | None = None) -> Client:
+        return cls(
+            base_url=config.base_url,
+            root=config.root,
+            transport=transport or Transport.from_config(config),
+            config=config,
+        )
+
+    def cache_for(self, cls, root: Path | str | None = None) -> FileCache:
+        """Cache of `cls` replies, in `root` instead of the client's folder for it when given."""
+        kind = kind_of(cls)
+        if root is None:
+            root = cls.ROOT if self.root is None else self.root / kind
+        if self.config is not None:
+            kc = self.config.kind(kind)
+            cache = SlugCache if kc.backend == "slug" else FileCache
+            return cache(root, ttl=kc.ttl, negative_ttl=kc.negative_ttl)
+        return FileCache(root, ttl=self.ttl, negative_ttl=self.negative_ttl)
+
+    def get(self, url: str, headers: dict[str, str] | None = None) -> requests.Response:
+        return self.transport.get(url, headers=headers)
+
+    def count(self, name: str) -> None:
+        with self._lock:
+            self._counts[name] += 1
+
+    def record_error(self, e: Exception) -> None:
+        """Count a failed request, and keep it for `last_error` in this thread."""
+        self.count("errors")
+        self._local.error = e
+
+    def last_error(self) -> Exception | None:
+        """The failure recorded by this thread since the last call, if any.
+
+        The request classes return None both for no matches and for failed
+        requests; this tells them apart.
+        """
+        e = getattr(self._local, "error", None)
+        self._local.error = None
+        return e
+
+    def metrics(self) -> dict[str, Any]:
+        with self._lock:
+            counts = dict(self._counts)
+        return {**counts, "transport": self.transport.metrics()}
+
+    def request(self, kind: str, term: str, cache: bool = False, headers=None):
+        return request_class(kind).request(term, cache=cache, headers=headers, client=self)
+
+    def submit(self, kind: str, term: str, cache: bool = False, headers=None) -> Future:
+        """`request` on the thread pool; concurrent calls for the same term share one request."""
+        key = (kind, term, cache)
+        with self._lock:
+            fut = self._inflight.get(key)
+            if fut is None:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.WORKERS)
+                fut = self._executor.submit(
+                    self.request, kind, term, cache=cache, headers=headers
+                )
+                self._inflight[key] = fut
+                # runs right here, under the lock, when the request is already done
+                fut.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return fut
+
+    def close(self) -> None:
+        """Shut the thread pool of `submit` down; requests already running finish."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def word(self, word: str, cache: bool = False, headers=None):
+        return self.request("word", word, cache=cache, headers=headers)
+
+    def kanji(self, kanji: str, cache: bool = False, headers=None):
+        return self.request("kanji", kanji, cache=cache, headers=headers)
+
+    def sentence(self, word: str, cache: bool = False, headers=None):
+        return self.request("sentence", word, cache=cache, headers=headers)
+
+    def tokens(self, sentence: str, cache: bool = False, headers=None):
+        return self.request("tokens", sentence, cache=cache, headers=headers)
+
+
+_DEFAULT: tuple[Config, Client] | None = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def default_client() -> Client:
+    """The client of lookups made without one, rebuilt when the config is reloaded."""
+    global _DEFAULT
+    config = get_config()
+    with _DEFAULT_LOCK:
+        if _DEFAULT is None or _DEFAULT[0] is not config:
+            if _DEFAULT is not None:
+                _DEFAULT[1].close()
+            _DEFAULT = (config, Client.from_config(config, transport=default_transport()))
+        return _DEFAULT[1]
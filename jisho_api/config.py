@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import json
+import os
+import warnings
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, Field, field_validator
+
+from jisho_api.cache import NEGATIVE_TTL
+
+CONFIG_PATH = Path.home() / ".jisho/config.json"
+ENV_PREFIX = "JISHO_"
+KIND_NAMES = ("word", "kanji", "sentence", "tokens")
+# "slug" stores every word entry once, see `SlugCache`
+BACKENDS = ("file", "slug")
+
+
+class KindConfig(BaseModel):
+    """Settings of one kind of request; unset values fall back to `Config`."""
+
+    cache: bool | None = Field(default=None)
+    ttl: float | None = Field(default=None)
+    negative_ttl: float | None = Field(default=NEGATIVE_TTL)
+    backend: str = Field(default="file")
+    concurrency: int | None = Field(default=None)
+
+    @field_validator("backend")
+    @classmethod
+    def _backend(cls, v: str) -> str:
+        if v not in BACKENDS:
+            raise ValueError(
+                f"Unknown cache backend {v!r}, expected one of {', '.join(BACKENDS)}"
+            )
+        return v
+
+
+class Config(BaseModel):
+    # cache replies on disk by default
+    cache: bool = Field(default=False)
+    # data folder, one subfolder per kind; the request classes' ROOT when unset
+    root: Path | None = Field(default=None)
+    # jisho.org or a mirror of it
+    base_url: str | None = Field(default=None)
+    # HTTP transport
+    max_concurrency: int = Field(default=8)
+    retries: int = Field(default=3)
+    timeout: float = Field(default=30.0)
+    # multiplexed HTTP/2 through httpx, when installed
+    http2: bool = Field(default=False)
+    # threads for batch work (warm, delta scrapes, crawls, harvests, cache tools)
+    workers: int = Field(default=4)
+    # lookup daemon
+    memory_size: int = Field(default=4096)
+    kinds: dict[str, KindConfig] = Field(default_factory=dict)
+
+    @field_validator("kinds")
+    @classmethod
+    def _kinds(cls, v: dict[str, KindConfig]) -> dict[str, KindConfig]:
+        for kind, kc in v.items():
+            if kind not in KIND_NAMES:
+                raise ValueError(
+                    f"Unknown kind {kind!r}, expected one of {', '.join(KIND_NAMES)}"
+                )
+            if kc.backend == "slug" and kind != "word":
+                raise ValueError("The slug backend only stores word results")
+        return v
+
+    def kind(self, kind: str) -> KindConfig:
+        """Settings of `kind` with every fallback filled in."""
+        kc = self.kinds.get(kind, KindConfig())
+        return kc.model_copy(
+            update={
+                "cache": self.cache if kc.cache is None else kc.cache,
+                "concurrency": kc.concurrency or self.workers,
+            }
+        )
+
+
+def _env_overrides(environ: dict[str, str]) -> dict[str, Any]:
+    # JISHO_CACHE=1, JISHO_WORKERS=16, JISHO_WORD_TTL=3600, ...
+    out: dict[str, Any] = {}
+    for name in Config.model_fields:
+        if name == "kinds":
+            continue
+        v = environ.get(ENV_PREFIX + name.upper())
+        if v is not None:
+            out[name] = v
+    for kind in KIND_NAMES:
+        for name in KindConfig.model_fields:
+            v = environ.get(f"{ENV_PREFIX}{kind.upper()}_{name.upper()}")
+            if v is not None:
+                out.setdefault("kinds", {}).setdefault(kind, {})[name] = v
+    return out
+
+
+def load_config(
+    path: Path | str | None = None, environ: dict[str, str] | None = None
+) -> Config:
+    """Config file, `JISHO_CONFIG` or ~/.jisho/config.json, with `JISHO_*` variables on top."""
+    environ = os.environ if environ is None else environ
+    path = Path(path or environ.get(ENV_PREFIX + "CONFIG") or CONFIG_PATH)
+    data: dict[str, Any] = {}
+    if path.exists():
+        with open(path, "r", encoding="utf-8") as fp:
+            data = json.load(fp)
+
+    env = _env_overrides(environ)
+    for kind, values in env.pop("kinds", {}).items():
+        data.setdefault("kinds", {}).setdefault(kind, {}).update(values)
+    data.update(env)
+    return Config(**data)
+
+
+@lru_cache(maxsize=None)
+def get_config() -> Config:
+    """The process-wide config, read once; defaults, with a warning, when it is invalid."""
+    try:
+        return load_config()
+    except (OSError, ValueError) as e:
+        warnings.warn(f"Ignoring the jisho config, it is invalid: {e}")
+        return Config()
+
+
+def reload_config() -> Config:
+    """Read the config again; the default client and transport follow it."""
+    get_config.cache_clear()
+    return get_config()
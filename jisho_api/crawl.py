@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterator
+
+from jisho_api.cli import console
+from jisho_api.client import Client
+from jisho_api.kanji.request import Kanji, KanjiRequest
+from jisho_api.util import is_kanji, kanji_in
+from jisho_api.word.request import Word, WordRequest
+
+Node = tuple[str, str]
+Edge = tuple[str, str, str, str, str]
+
+EDGES_HEADER = "source_kind\tsource\trelation\ttarget_kind\ttarget\n"
+# "口 1" or "口・くち" in see_also point at a sense or reading of the entry
+_REF = re.compile(r"[\s・].*$")
+
+
+def _entry(term: str, wr: WordRequest):
+    for w in wr.data:
+        if w.slug == term or any(j.word == term or j.reading == term for j in w.japanese):
+            return w
+    return wr.data[0]
+
+
+def word_edges(term: str, wr: WordRequest) -> Iterator[Edge]:
+    w = _entry(term, wr)
+    for k in kanji_in("".join(j.word for j in w.japanese if j.word)):
+        yield ("word", term, "kanji", "kanji", k)
+    for s in w.senses:
+        for ref in s.see_also:
+            yield ("word", term, "see_also", "word", _REF.sub("", ref))
+        for ref in s.antonyms:
+            yield ("word", term, "antonym", "word", _REF.sub("", ref))
+
+
+def kanji_edges(kanji: str, kr: KanjiRequest) -> Iterator[Edge]:
+    for p in kr.data.radical.parts:
+        if p != kanji and is_kanji(p):
+            yield ("kanji", kanji, "part", "kanji", p)
+    examples = kr.data.reading_examples
+    if examples is None:
+        return
+    for relation, exs in (("on_example", examples.on), ("kun_example", examples.kun)):
+        for ex in exs or ():
+            yield ("kanji", kanji, relation, "word", ex.kanji)
+
+
+class Crawler:
+    """Breadth-first crawl of the word/kanji graph, checkpointed in `out`.
+
+    `out` holds the append-only `visited.txt` and `edges.tsv`, and
+    `state.json` with the pending frontier and the length of both files
+    at the last checkpoint, replaced atomically after every batch. Pointing
+    a new crawler at the same directory resumes from the last checkpoint,
+    cutting off lines written after it, so a crash re-crawls the batch it
+    interrupted instead of losing the nodes that batch found. Nodes whose
+    fetch raises are counted in `failed` and skipped.
+    """
+
+    def __init__(
+        self,
+        out: Path | str,
+        max_depth: int = 2,
+        budget: int = 1000,
+        workers: int = 4,
+        cache: bool = True,
+        client: Client | None = None,
+    ):
+        self.out = Path(out)
+        self.max_depth = max_depth
+        self.budget = budget
+        self.workers = workers
+        self.cache = cache
+        self.client = client
+
+        self.out.mkdir(parents=True, exist_ok=True)
+        self.visited: set[Node] = set()
+        self.frontier: deque[tuple[str, str, int]] = deque()
+        self.fetched = 0
+        self.failed = 0
+        self._load()
+
+    def _load(self) -> None:
+        state = {}
+        p = self.out / "state.json"
+        if p.exists():
+            with open(p, "r", encoding="utf-8") as fp:
+                state = json.load(fp)
+        self.fetched = state.get("fetched", 0)
+        self.failed = state.get("failed", 0)
+        # drop what a batch wrote after the last checkpoint, it is crawled again
+        for name, size in state.get("sizes", {}).items():
+            if (self.out / name).exists():
+                os.truncate(self.out / name, size)
+
+        p = self.out / "visited.txt"
+        if p.exists():
+            with open(p, "r", encoding="utf-8") as fp:
+                for line in fp:
+                    kind, _, term = line.rstrip("\n").partition("\t")
+                    self.visited.add((kind, term))
+        if "frontier" in state:
+            self.frontier.extend(tuple(item) for item in state["frontier"])
+        elif (self.out / "frontier.jsonl").exists():
+            # checkpoints from before the frontier moved into state.json
+            with open(self.out / "frontier.jsonl", "r", encoding="utf-8") as fp:
+                self.frontier.extend(tuple(json.loads(line)) for line in fp)
+        if not (self.out / "edges.tsv").exists():
+            with open(self.out / "edges.tsv", "w", encoding="utf-8") as fp:
+                fp.write(EDGES_HEADER)
+
+    def checkpoint(self) -> None:
+        state = {
+            "fetched": self.fetched,
+            "failed": self.failed,
+            "frontier": list(self.frontier),
+            "sizes": {
+                name: (self.out / name).stat().st_size
+                for name in ("visited.txt", "edges.tsv")
+                if (self.out / name).exists()
+            },
+        }
+        tmp = self.out / "state.json.tmp"
+        with open(tmp, "w", encoding="utf-8") as fp:
+            json.dump(state, fp, ensure_ascii=False)
+        os.replace(tmp, self.out / "state.json")
+
+    def seed(self, kind: str, term: str) -> None:
+        if kind not in ("word", "kanji"):
+            raise ValueError(f"Can only crawl words and kanji, not {kind!r}")
+        if (kind, term) not in self.visited and not any(
+            (k, t) == (kind, term) for k, t, _ in self.frontier
+        ):
+            self.frontier.append((kind, term, 0))
+
+    def _fetch(self, node: Node) -> list[Edge]:
+        kind, term = node
+        if kind == "word":
+            wr = Word.request(term, cache=self.cache, client=self.client)
+            return list(word_edges(term, wr)) if wr is not None else []
+        kr = Kanji.request(term, cache=self.cache, client=self.client)
+        return list(kanji_edges(term, kr)) if kr is not None else []
+
+    def _try_fetch(self, node: Node) -> list[Edge] | None:
+        try:
+            return self._fetch(node)
+        except Exception as e:
+            console.print(f"[red bold][Error] [white] Failed to crawl {node[1]}: {str(e)}")
+            return None
+
+    def run(self, advance: Callable[[], None] | None = None) -> int:
+        """Crawl until the frontier is empty or the budget is spent; returns nodes fetched."""
+        start = self.fetched
+        queued = {(k, t) for k, t, _ in self.frontier}
+        with ThreadPoolExecutor(max_workers=self.workers) as ex:
+            while self.frontier and self.fetched < self.budget:
+                batch = []
+                while (
+                    self.frontier
+                    and len(batch) < self.workers
+                    and self.fetched + len(batch) < self.budget
+                ):
+                    kind, term, depth = self.frontier.popleft()
+                    if (kind, term) not in self.visited:
+                        batch.append((kind, term, depth))
+
+                results = ex.map(lambda item: self._try_fetch(item[:2]), batch)
+                with open(self.out / "edges.tsv", "a", encoding="utf-8") as edges, open(
+                    self.out / "visited.txt", "a", encoding="utf-8"
+                ) as visited:
+                    for (kind, term, depth), es in zip(batch, results):
+                        if es is None:
+                            self.failed += 1
+                            if advance:
+                                advance()
+                            continue
+                        self.visited.add((kind, term))
+                        visited.write(f"{kind}\t{term}\n")
+                        for e in es:
+                            edges.write("\t".join(e) + "\n")
+                            target = (e[3], e[4])
+                            if (
+                                depth < self.max_depth
+                                and target not in self.visited
+                                and target not in queued
+                            ):
+                                queued.add(target)
+                                self.frontier.append((*target, depth + 1))
+                        if advance:
+                            advance()
+                self.fetched += len(batch)
+                self.checkpoint()
+        return self.fetched - start
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+from pydantic import BaseModel, PrivateAttr
+
+from jisho_api.cache import CacheError, empty_payload, is_empty
+from jisho_api.client import Client, default_client
+from jisho_api.vocab import TOKEN_FIELDS, WORD_FIELDS, unpack
+
+# content hash and last check time of every cached entry, per cache root
+MANIFEST = ".manifest"
+CHANGES = ".changes.jsonl"
+
+ADDED = "added"
+CHANGED = "changed"
+REMOVED = "removed"
+
+
+def payload_hash(payload: dict[str, Any]) -> str:
+    """Hash of a payload, independent of key order, indentation and packing."""
+    payload = unpack(unpack(payload, WORD_FIELDS), TOKEN_FIELDS)
+    normalized = json.dumps(
+        payload, sort_keys=True, ensure_ascii=False, separators=(",", ":")
+    )
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+
+EMPTY_HASH = payload_hash(empty_payload())
+
+
+def load_manifest(root: Path) -> dict[str, dict[str, Any]]:
+    p = root / MANIFEST
+    if not p.exists():
+        return {}
+    with open(p, "r", encoding="utf-8") as fp:
+        return json.load(fp)
+
+
+def save_manifest(root: Path, manifest: dict[str, dict[str, Any]]) -> None:
+    root.mkdir(parents=True, exist_ok=True)
+    tmp = root / (MANIFEST + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as fp:
+        json.dump(manifest, fp, ensure_ascii=False)
+    os.replace(tmp, root / MANIFEST)
+
+
+def read_changes(root: Path | str, since: float = 0.0) -> Iterator[dict[str, Any]]:
+    """Change log entries of a cache root, newer than `since`."""
+    p = Path(root) / CHANGES
+    if not p.exists():
+        return
+    with open(p, "r", encoding="utf-8") as fp:
+        for line in fp:
+            change = json.loads(line)
+            if change["time"] > since:
+                yield change
+
+
+class DeltaReport(BaseModel):
+    checked: int
+    added: int
+    changed: int
+    removed: int
+    unchanged: int
+    failed: int
+    # cached terms still being revalidated in the background
+    pending: int = 0
+
+    _done: Future | None = PrivateAttr(default=None)
+
+    def wait(self, timeout: float | None = None) -> DeltaReport:
+        """The report of the whole run, once the background revalidation has finished."""
+        if self._done is None:
+            return self
+        return self._done.result(timeout)
+
+
+def _dump(r: Any) -> dict[str, Any]:
+    return r.model_dump(mode="json", exclude_unset=True, by_alias=True)
+
+
+def _apply(
+    cls,
+    todo: list[str],
+    missing: set[str],
+    manifest: dict[str, dict[str, Any]],
+    workers: int,
+    advance: Callable[[], None] | None,
+    client: Client,
+) -> dict[str, int]:
+    """Fetch `todo`, write what changed and log it; the manifest is saved even on errors."""
+    fc = client.cache_for(cls)
+
+    def fetch(term: str):
+        try:
+            return cls.fetch(term, client=client)
+        except Exception:
+            return None
+        finally:
+            if advance:
+                advance()
+
+    counts = {ADDED: 0, CHANGED: 0, REMOVED: 0, "unchanged": 0, "failed": 0}
+    now = time.time()
+    fc.root.mkdir(parents=True, exist_ok=True)
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as ex, open(
+            fc.root / CHANGES, "a", encoding="utf-8"
+        ) as log:
+            # results come back while the rest are still being fetched
+            for term, r in zip(todo, ex.map(fetch, todo)):
+                if r is None:
+                    counts["failed"] += 1
+                    continue
+                payload = _dump(r) if len(r) else empty_payload()
+                new_hash = payload_hash(payload)
+
+                if term in missing:
+                    old_hash = None
+                elif term in manifest:
+                    old_hash = manifest[term]["hash"]
+                else:
+                    # expired entries are still the previous content, not an addition
+                    try:
+                        old = fc.read(term)
+                    except CacheError:
+                        old = None
+                    old_hash = payload_hash(old) if old is not None else None
+                old_empty = old_hash in (None, EMPTY_HASH)
+
+                manifest[term] = {"hash": new_hash, "checked": now}
+                if new_hash == old_hash:
+                    counts["unchanged"] += 1
+                    continue
+
+                if is_empty(payload):
+                    change = None if old_empty else REMOVED
+                    fc.put_empty(term)
+                else:
+                    change = ADDED if old_empty else CHANGED
+                    cls.save(term, r, client=client)
+                if change:
+                    counts[change] += 1
+                    log.write(
+                        json.dumps(
+                            {"term": term, "change": change, "hash": new_hash, "time": now},
+                            ensure_ascii=False,
+                        )
+                        + "\n"
+                    )
+    finally:
+        save_manifest(fc.root, manifest)
+    return counts
+
+
+def _report(checked: int, counts: dict[str, int], pending: int = 0) -> DeltaReport:
+    return DeltaReport(
+        checked=checked,
+        added=counts[ADDED],
+        changed=counts[CHANGED],
+        removed=counts[REMOVED],
+        unchanged=counts["unchanged"],
+        failed=counts["failed"],
+        pending=pending,
+    )
+
+
+def delta_scrape(
+    cls,
+    terms: Iterable[str],
+    sample: int | None = None,
+    workers: int = 4,
+    advance: Callable[[], None] | None = None,
+    client: Client | None = None,
+    background: bool = False,
+) -> DeltaReport:
+    """Fetch `terms` missing from the cache of `cls`, and revalidate cached ones.
+
+    Cached terms are revalidated oldest check first, at most `sample` of
+    them per run (all when None). Only entries whose normalized payload
+    changed are written, and every addition, change and removal is
+    appended to the change log of the cache root.
+
+    With `background`, it returns once the missing terms are cached and
+    revalidates the cached ones on a background thread; the report counts
+    them in `pending`, and `wait()` returns the report of the whole run.
+    """
+    client = client or default_client()
+    fc = client.cache_for(cls)
+    manifest = load_manifest(fc.root)
+
+    terms = list(dict.fromkeys(t for t in terms if t))
+    missing: set[str] = set()
+    cached = []
+    for t in terms:
+        if fc.path(t).exists():
+            cached.append(t)
+        else:
+            missing.add(t)
+
+    def checked(t: str) -> float:
+        if t in manifest:
+            return manifest[t]["checked"]
+        return fc.path(t).stat().st_mtime
+
+    cached.sort(key=checked)
+    if sample is not None:
+        cached = cached[:sample]
+    added = [t for t in terms if t in missing]
+
+    if not background:
+        counts = _apply(cls, added + cached, missing, manifest, workers, advance, client)
+        return _report(len(added) + len(cached), counts)
+
+    counts = _apply(cls, added, missing, manifest, workers, advance, client)
+    report = _report(len(added), counts, pending=len(cached))
+    if cached:
+
+        def revalidate() -> DeltaReport:
+            rest = _apply(cls, cached, missing, manifest, workers, advance, client)
+            return _report(len(added) + len(cached), {k: counts[k] + rest[k] for k in counts})
+
+        ex = ThreadPoolExecutor(max_workers=1)
+        report._done = ex.submit(revalidate)
+        ex.shutdown(wait=False)
+    return report
@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+import threading
+import urllib.parse
+from pathlib import Path
+
+from jisho_api.tokenize.request import Tokens
+
+# recorded replies, also the ones the tests read
+FIXTURES = Path(__file__).parent / "fixtures"
+
+# what an HTTP/2 client with prior knowledge sends first
+H2_PREFACE = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
+# concurrent streams per HTTP/2 connection
+H2_STREAMS = 1000
+_REASONS = {200: "OK", 404: "Not Found", 429: "Too Many Requests", 500: "Internal Server Error"}
+
+
+class FakeJisho:
+    """Stand-in for jisho.org serving recorded fixtures, for load tests.
+
+    Serves `word.json` for the search API, and `kanji.html`,
+    `sentence.html` and `tokens.html` for `/search/` pages, whatever the
+    term; a batch tokens query gets the tokens once per sentence, split by
+    `Tokens.DELIMITER`. Every reply waits `latency` seconds plus up to
+    `jitter`, and fails with a 500 or a 429 (with `Retry-After`) at
+    `error_rate` and `throttle_rate`. Connections opening with the HTTP/2
+    preface are served over HTTP/2, which needs the `h2` package.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        fixtures: Path | str = FIXTURES,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: float = 1.0,
+        seed: int | None = None,
+    ):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.random = random.Random(seed)
+        root = Path(fixtures)
+        self.pages = {
+            kind: (root / f"{kind}.html").read_bytes()
+            for kind in ("kanji", "sentence", "tokens")
+        }
+        with open(root / "word.json", "r", encoding="utf-8") as fp:
+            payload = json.load(fp)
+        self.word = json.dumps(payload).encode("utf-8")
+        self.no_words = json.dumps({"meta": payload["meta"], "data": []}).encode("utf-8")
+        # the zen bar of the tokens page, repeated for batch queries
+        tokens = self.pages["tokens"].decode("utf-8")
+        start = tokens.index('<ul class="clearfix">') + len('<ul class="clearfix">')
+        end = tokens.index("</ul>", start)
+        self._tokens = (tokens[:start], tokens[start:end], tokens[end:])
+        self.counts = {"connections": 0, "requests": 0, "errors": 0, "throttled": 0}
+        self._server: asyncio.AbstractServer | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._connections: set[asyncio.StreamWriter] = set()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def _tokens_page(self, n: int) -> bytes:
+        head, items, tail = self._tokens
+        delimiter = (
+            '<li class="clearfix japanese_word"><span class="japanese_word__furigana_wrapper">'
+            f'</span><span class="japanese_word__text_wrapper">{Tokens.DELIMITER}</span></li>'
+        )
+        return (head + delimiter.join([items] * n) + tail).encode("utf-8")
+
+    def route(self, target: str) -> tuple[int, str, bytes]:
+        url = urllib.parse.urlsplit(target)
+        if url.path == "/api/v1/search/words":
+            query = urllib.parse.parse_qs(url.query)
+            page = int(query.get("page", ["1"])[0])
+            body = self.word if page == 1 else self.no_words
+            return 200, "application/json; charset=utf-8", body
+        if url.path.startswith("/search/"):
+            term = urllib.parse.unquote(url.path[len("/search/") :])
+            if term.endswith(" #kanji"):
+                body = self.pages["kanji"]
+            elif term.endswith(" #sentences"):
+                query = urllib.parse.parse_qs(url.query)
+                page = int(query.get("page", ["1"])[0])
+                body = self.pages["sentence"] if page == 1 else b""
+            else:
+                body = self._tokens_page(term.count(Tokens.DELIMITER) + 1)
+            return 200, "text/html; charset=utf-8", body
+        return 404, "text/plain", b"not found"
+
+    async def respond(self, target: str) -> tuple[int, dict[str, str], bytes]:
+        self.counts["requests"] += 1
+        delay = self.latency + self.jitter * self.random.random()
+        if delay:
+            await asyncio.sleep(delay)
+        roll = self.random.random()
+        if roll < self.throttle_rate:
+            self.counts["throttled"] += 1
+            return 429, {"Retry-After": f"{self.retry_after:g}"}, b"slow down"
+        if roll < self.throttle_rate + self.error_rate:
+            self.counts["errors"] += 1
+            return 500, {}, b"injected error"
+        status, content_type, body = self.route(target)
+        return status, {"Content-Type": content_type}, body
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._connections.add(writer)
+        self.counts["connections"] += 1
+        try:
+            while True:
+                line = await reader.readline()
+                if line == H2_PREFACE[: len(line)] and line:
+                    preface = line + await reader.readexactly(len(H2_PREFACE) - len(line))
+                    await self._handle_h2(preface, reader, writer)
+                    break
+                if not line.strip():
+                    break
+                _, target, _ = line.decode("latin-1").split(" ", 2)
+                keep_alive = True
+                while True:
+                    header = await reader.readline()
+                    if header in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = header.decode("latin-1").partition(":")
+                    if name.strip().lower() == "connection":
+                        keep_alive = value.strip().lower() != "close"
+
+                status, headers, body = await self.respond(target)
+                head = f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                for name, value in headers.items():
+                    head += f"{name}: {value}\r\n"
+                head += (
+                    f"Content-Length: {len(body)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+                    "\r\n"
+                )
+                writer.write(head.encode("latin-1") + body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, ValueError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+
+    async def _handle_h2(
+        self, data: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        # HTTP/2 with prior knowledge (h2c), every request on its own stream
+        import h2.config
+        import h2.connection
+        import h2.events
+        import h2.exceptions
+        import h2.settings
+
+        conn = h2.connection.H2Connection(
+            h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+        )
+        # clients may open streams before our settings reach them, so the
+        # limit must hold from the first frame rather than once acknowledged
+        conn.local_settings = h2.settings.Settings(
+            client=False,
+            initial_values={h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS: H2_STREAMS},
+        )
+        conn.initiate_connection()
+        window = asyncio.Condition()
+        paths: dict[int, str] = {}
+        streams: set[asyncio.Task] = set()
+
+        async def reply(stream_id: int) -> None:
+            status, headers, body = await self.respond(paths.pop(stream_id))
+            try:
+                conn.send_headers(
+                    stream_id,
+                    [(":status", str(status)), ("content-length", str(len(body)))]
+                    + [(k.lower(), v) for k, v in headers.items()],
+                    end_stream=not body,
+                )
+                while body:
+                    size = min(
+                        conn.local_flow_control_window(stream_id),
+                        conn.max_outbound_frame_size,
+                        len(body),
+                    )
+                    if size <= 0:
+                        writer.write(conn.data_to_send())
+                        async with window:
+                            await window.wait()
+                        continue
+                    conn.send_data(stream_id, body[:size], end_stream=size == len(body))
+                    body = body[size:]
+                writer.write(conn.data_to_send())
+            except h2.exceptions.H2Error:
+                # the client reset the stream or went away
+                pass
+
+        try:
+            while data:
+                try:
+                    events = conn.receive_data(data)
+                except h2.exceptions.ProtocolError:
+                    writer.write(conn.data_to_send())
+                    return
+                for event in events:
+                    if isinstance(event, h2.events.RequestReceived):
+                        paths[event.stream_id] = dict(event.headers)[":path"]
+                    elif isinstance(event, h2.events.StreamEnded):
+                        task = asyncio.ensure_future(reply(event.stream_id))
+                        streams.add(task)
+                        task.add_done_callback(streams.discard)
+                    elif isinstance(event, h2.events.WindowUpdated):
+                        async with window:
+                            window.notify_all()
+                    elif isinstance(event, h2.events.ConnectionTerminated):
+                        return
+                writer.write(conn.data_to_send())
+                await writer.drain()
+                data = await reader.read(65536)
+        finally:
+            for task in list(streams):
+                task.cancel()
+
+    async def _start(self) -> None:
+        self._server = await asyncio.start_server(
+            self.handle, self.host, self.port, backlog=1024
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        await self._start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    def start(self) -> str:
+        """Serve from a background thread; returns the base URL."""
+        self._loop = asyncio.new_event_loop()
+        self._loop.run_until_complete(self._start())
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    async def _shutdown(self) -> None:
+        self._server.close()
+        # idle keep-alive connections are still waiting on a request line
+        for writer in list(self._connections):
+            writer.close()
+        while self._connections:
+            await asyncio.sleep(0.01)
+
+    def stop(self) -> None:
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+
+    def __enter__(self) -> FakeJisho:
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import types
+import typing
+from functools import lru_cache
+from typing import Any, Iterable
+
+from pydantic import BaseModel
+
+# `X | None` annotations, python 3.10+
+_UNION_TYPES = (typing.Union, getattr(types, "UnionType", typing.Union))
+
+
+def _unwrap(annotation: Any) -> tuple[Any, bool]:
+    """Inner type of `annotation` without Optional, and whether it is a list."""
+    origin = typing.get_origin(annotation)
+    if origin in _UNION_TYPES:
+        args = [a for a in typing.get_args(annotation) if a is not type(None)]
+        if len(args) == 1:
+            return _unwrap(args[0])
+        return annotation, False
+    if origin is list:
+        (inner,) = typing.get_args(annotation) or (Any,)
+        inner, _ = _unwrap(inner)
+        return inner, True
+    return annotation, False
+
+
+def _is_model(tp: Any) -> bool:
+    return isinstance(tp, type) and issubclass(tp, BaseModel)
+
+
+class _Node:
+    __slots__ = ("key", "attr", "many", "column", "children")
+
+    def __init__(self, key: str, attr: str, many: bool):
+        self.key = key
+        self.attr = attr
+        self.many = many
+        self.column: str | None = None
+        self.children: list[_Node] | None = None
+
+
+def _take(col: list[Any], key: str, dicts: bool) -> list[Any]:
+    if dicts:
+        return [None if o is None else o.get(key) for o in col]
+    return [getattr(o, key, None) for o in col]
+
+
+class Flattener:
+    """Columns of a pydantic model, compiled once from its fields.
+
+    Every scalar or list-of-scalars field becomes a column named by its
+    dotted path. A list of models becomes a column with the number of items
+    per record, and the columns below it hold one value per item of all
+    records, back to back: `senses` of a `WordConfig` counts the senses of
+    each word, `senses.english_definitions` has the definitions of every
+    sense. A nested model's column is True where it is present, so empty
+    ones are kept. `unflatten` turns columns back into payload dicts that validate
+    as the model.
+    """
+
+    def __init__(self, model: type[BaseModel], separator: str = "."):
+        self.model = model
+        self.separator = separator
+        self.columns: list[str] = []
+        self._tree = self._compile(model, "")
+
+    def _compile(self, model: type[BaseModel], prefix: str) -> list[_Node]:
+        nodes = []
+        for attr, field in model.model_fields.items():
+            key = field.alias or attr
+            tp, many = _unwrap(field.annotation)
+            node = _Node(key, attr, many and _is_model(tp))
+            name = prefix + key
+            # a nested model's own column counts its items, or marks it present
+            node.column = name
+            self.columns.append(name)
+            if _is_model(tp):
+                node.children = self._compile(tp, name + self.separator)
+            nodes.append(node)
+        return nodes
+
+    def _flatten(
+        self,
+        nodes: list[_Node],
+        col: list[Any],
+        dicts: bool,
+        out: dict[str, list[Any]],
+    ) -> None:
+        # every level is read with one pass over all of its items
+        for node in nodes:
+            values = _take(col, node.key if dicts else node.attr, dicts)
+            if node.children is None:
+                out[node.column] = values
+            elif node.many:
+                out[node.column] = [None if v is None else len(v) for v in values]
+                items = [x for v in values if v for x in v]
+                self._flatten(node.children, items, dicts, out)
+            else:
+                out[node.column] = [None if v is None else True for v in values]
+                self._flatten(node.children, values, dicts, out)
+
+    def flatten(self, records: Iterable[Any]) -> dict[str, list[Any]]:
+        """Column arrays of `records`, given as models or payload dicts."""
+        records = records if isinstance(records, list) else list(records)
+        dicts = bool(records) and type(records[0]) is dict
+        out: dict[str, list[Any]] = {}
+        self._flatten(self._tree, records, dicts, out)
+        return {name: out[name] for name in self.columns}
+
+    def _rebuild(
+        self, nodes: list[_Node], columns: dict[str, list[Any]], n: int
+    ) -> list[dict[str, Any]]:
+        out: list[dict[str, Any]] = [{} for _ in range(n)]
+        for node in nodes:
+            if node.children is None:
+                key = node.key
+                for d, v in zip(out, columns[node.column]):
+                    if v is not None:
+                        d[key] = v
+            elif node.many:
+                lengths = columns[node.column]
+                items = self._rebuild(
+                    node.children, columns, sum(k for k in lengths if k)
+                )
+                i = 0
+                for d, k in zip(out, lengths):
+                    if k is not None:
+                        d[node.key] = items[i : i + k]
+                        i += k
+            else:
+                subs = self._rebuild(node.children, columns, n)
+                for d, present, sub in zip(out, columns[node.column], subs):
+                    if present:
+                        d[node.key] = sub
+        return out
+
+    def unflatten(self, columns: dict[str, list[Any]]) -> list[dict[str, Any]]:
+        """Payload dicts back from `flatten` columns; None values are left out."""
+        if not self.columns:
+            return []
+        return self._rebuild(self._tree, columns, len(columns[self.columns[0]]))
+
+
+@lru_cache(maxsize=None)
+def flattener(model: type[BaseModel], separator: str = ".") -> Flattener:
+    """The compiled `Flattener` of `model`, built on first use."""
+    return Flattener(model, separator=separator)
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Any, Iterable, Iterator, NamedTuple
+
+from jisho_api.kana import convert_column, is_romaji, to_romaji
+from jisho_api.wordindex import WordIndex
+
+
+def levenshtein(a: str, b: str, max_dist: int | None = None) -> int:
+    """Edit distance between `a` and `b`, or `max_dist + 1` once it is exceeded."""
+    if len(a) < len(b):
+        a, b = b, a
+    limit = max_dist if max_dist is not None else len(a)
+    if len(a) - len(b) > limit:
+        return limit + 1
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i]
+        for j, cb in enumerate(b, 1):
+            cur.append(min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (ca != cb)))
+        if min(cur) > limit:
+            return limit + 1
+        prev = cur
+    return prev[-1]
+
+
+class BKTree:
+    """Burkhard-Keller tree of strings under edit distance.
+
+    A search only walks children whose edge distance is within `max_dist`
+    of the query's distance to their parent, which skips most of the tree.
+    """
+
+    def __init__(self):
+        self._root: tuple[str, dict[int, tuple]] | None = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, word: str) -> None:
+        if self._root is None:
+            self._root = (word, {})
+            self._size = 1
+            return
+        node = self._root
+        while True:
+            d = levenshtein(word, node[0])
+            if d == 0:
+                return
+            child = node[1].get(d)
+            if child is None:
+                node[1][d] = (word, {})
+                self._size += 1
+                return
+            node = child
+
+    def nodes(self) -> list[tuple[str, int, int]]:
+        """The tree as `(word, parent, edge)` rows, parents first; the root's parent is -1."""
+        out: list[tuple[str, int, int]] = []
+        if self._root is None:
+            return out
+        queue = deque([(self._root, -1, 0)])
+        while queue:
+            (word, children), parent, edge = queue.popleft()
+            out.append((word, parent, edge))
+            queue.extend((child, len(out) - 1, e) for e, child in children.items())
+        return out
+
+    @classmethod
+    def from_nodes(cls, rows: Iterable[tuple[str, int, int]]) -> BKTree:
+        # no distances to compute, unlike adding the words again
+        tree = cls()
+        built: list[tuple[str, dict[int, tuple]]] = []
+        for word, parent, edge in rows:
+            node: tuple[str, dict[int, tuple]] = (word, {})
+            if parent < 0:
+                tree._root = node
+            else:
+                built[parent][1][edge] = node
+            built.append(node)
+        tree._size = len(built)
+        return tree
+
+    def search(self, query: str, max_dist: int) -> Iterator[tuple[int, str]]:
+        if self._root is None:
+            return
+        stack = [self._root]
+        while stack:
+            word, children = stack.pop()
+            d = levenshtein(query, word)
+            if d <= max_dist:
+                yield d, word
+            for edge, child in children.items():
+                if d - max_dist <= edge <= d + max_dist:
+                    stack.append(child)
+
+
+class Suggestion(NamedTuple):
+    text: str
+    distance: int
+    terms: list[str]
+
+
+class FuzzyIndex(WordIndex):
+    """Approximate search over cached english definitions, readings and slugs.
+
+    Readings are indexed in romaji, so typos in a romaji query match them
+    too. Every indexed string maps back to the cache keys it came from.
+    Strings whose entries are gone stay in the tree, but are not suggested.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.tree = BKTree()
+
+    def _new_key(self, key: str) -> None:
+        self.tree.add(key)
+
+    def keys_of(self, wr) -> list[str]:
+        readings = [j.reading for w in wr.data for j in w.japanese if j.reading]
+        keys = convert_column(to_romaji, readings)
+        for w in wr.data:
+            keys.append(w.slug)
+            for s in w.senses:
+                keys.extend(s.english_definitions)
+        return [k.lower() for k in keys]
+
+    def _dump(self, data: dict[str, Any]) -> None:
+        data["tree"] = self.tree.nodes()
+
+    def _restore(self, data: dict[str, Any]) -> None:
+        self.tree = BKTree.from_nodes(data.get("tree", ()))
+
+    def suggest(
+        self, query: str, limit: int = 5, max_dist: int | None = None
+    ) -> list[Suggestion]:
+        """Closest indexed strings to `query`, nearest first."""
+        query = query.lower()
+        if not is_romaji(query):
+            query = to_romaji(query)
+        if max_dist is None:
+            max_dist = 1 if len(query) <= 4 else 2
+        found = sorted((d, k) for d, k in self.tree.search(query, max_dist) if k in self._keys)
+        return [Suggestion(k, d, list(self._keys[k])) for d, k in found[:limit]]
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable
+
+from pydantic import BaseModel
+
+from jisho_api.cli import console
+from jisho_api.client import Client
+from jisho_api.sentence.cfg import SentenceConfig
+from jisho_api.sentence.request import Sentence
+
+SENTENCES = "sentences.jsonl"
+INDEX = "index.tsv"
+
+
+def sentence_id(s: SentenceConfig) -> str:
+    """Content hash of a sentence and its translation."""
+    content = f"{s.japanese}\t{s.en_translation}"
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()[:16]
+
+
+class SentenceStore:
+    """Example sentences stored once, with an index from words to sentence ids.
+
+    `root` holds the append-only `sentences.jsonl`, one sentence per line
+    with its id, and `index.tsv` with a `word\\tid` line per pair. A word
+    harvested with no sentences is indexed with an empty id.
+    """
+
+    def __init__(self, root: Path | str):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._sentences: dict[str, SentenceConfig] = {}
+        self._index: dict[str, dict[str, None]] = {}
+        self._load()
+
+    def _load(self) -> None:
+        p = self.root / SENTENCES
+        if p.exists():
+            with open(p, "r", encoding="utf-8") as fp:
+                for line in fp:
+                    record = json.loads(line)
+                    sid = record.pop("id")
+                    self._sentences[sid] = SentenceConfig(**record)
+        p = self.root / INDEX
+        if p.exists():
+            with open(p, "r", encoding="utf-8") as fp:
+                for line in fp:
+                    word, _, sid = line.rstrip("\n").partition("\t")
+                    ids = self._index.setdefault(word, {})
+                    if sid:
+                        ids[sid] = None
+
+    def __len__(self) -> int:
+        return len(self._sentences)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._index
+
+    def words(self) -> list[str]:
+        return list(self._index)
+
+    def add(self, word: str, sentences: Iterable[SentenceConfig]) -> int:
+        """Index `sentences` under `word`; returns how many were not stored yet."""
+        ids = self._index.setdefault(word, {})
+        new = 0
+        with open(self.root / SENTENCES, "a", encoding="utf-8") as sfp, open(
+            self.root / INDEX, "a", encoding="utf-8"
+        ) as ifp:
+            if not ids:
+                ifp.write(f"{word}\t\n")
+            for s in sentences:
+                sid = sentence_id(s)
+                if sid not in self._sentences:
+                    self._sentences[sid] = s
+                    sfp.write(
+                        json.dumps({"id": sid, **s.model_dump()}, ensure_ascii=False)
+                        + "\n"
+                    )
+                    new += 1
+                if sid not in ids:
+                    ids[sid] = None
+                    ifp.write(f"{word}\t{sid}\n")
+        return new
+
+    def get(self, sid: str) -> SentenceConfig:
+        return self._sentences[sid]
+
+    def ids(self, word: str) -> list[str]:
+        return list(self._index.get(word, ()))
+
+    def examples(self, words: Iterable[str]) -> dict[str, list[SentenceConfig]]:
+        """Sentences of every word, from the store only."""
+        return {w: [self._sentences[sid] for sid in self.ids(w)] for w in words}
+
+
+class HarvestReport(BaseModel):
+    words: int = 0
+    skipped: int = 0
+    pages: int = 0
+    sentences: int = 0
+    new: int = 0
+    duplicates: int = 0
+    failed: int = 0
+
+
+def harvest(
+    store: SentenceStore,
+    words: Iterable[str],
+    max_pages: int | None = None,
+    workers: int = 4,
+    refresh: bool = False,
+    client: Client | None = None,
+    advance: Callable[[], None] | None = None,
+) -> HarvestReport:
+    """Fetch every result page of sentences for `words` into `store`.
+
+    Words already in the store are skipped unless `refresh` is set. A word
+    with any failed page is left out of the store, so a later run retries it.
+    """
+    report = HarvestReport()
+    todo = []
+    for w in dict.fromkeys(words):
+        if not w:
+            continue
+        if w in store and not refresh:
+            report.skipped += 1
+            if advance:
+                advance()
+            continue
+        todo.append(w)
+
+    def fetch(word: str) -> list[list[SentenceConfig]] | None:
+        pages = []
+        try:
+            for r in Sentence.pages(word, max_pages=max_pages, client=client):
+                pages.append(r.data)
+        except Exception as e:
+            # stored partially, the word would count as harvested and never be completed
+            console.print(
+                f"[red bold][Error] [white] Failed to request {word} page {len(pages) + 1}: {str(e)}"
+            )
+            return None
+        return pages
+
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        for word, pages in zip(todo, ex.map(fetch, todo)):
+            if pages is None:
+                report.failed += 1
+                if advance:
+                    advance()
+                continue
+            sentences = [s for page in pages for s in page]
+            new = store.add(word, sentences)
+            report.words += 1
+            report.pages += len(pages)
+            report.sentences += len(sentences)
+            report.new += new
+            report.duplicates += len(sentences) - new
+            if advance:
+                advance()
+    return report
@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from string import ascii_lowercase
+from typing import Callable, Iterable
+
+from jisho_api.wordindex import WordIndex
+
+# katakana ァ..ヶ sit 0x60 code points above hiragana ぁ..ゖ
+_KATA_TO_HIRA = {cp: cp - 0x60 for cp in range(0x30A1, 0x30F7)}
+_HIRA_TO_KATA = {cp: cp + 0x60 for cp in range(0x3041, 0x3097)}
+
+_ROWS = {
+    "": "あいうえお",
+    "k": "かきくけこ",
+    "g": "がぎぐげご",
+    "s": "さしすせそ",
+    "z": "ざじずぜぞ",
+    "t": "たちつてと",
+    "d": "だぢづでど",
+    "n": "なにぬねの",
+    "h": "はひふへほ",
+    "b": "ばびぶべぼ",
+    "p": "ぱぴぷぺぽ",
+    "m": "まみむめも",
+    "r": "らりるれろ",
+}
+_IRREGULAR = {
+    "し": "shi",
+    "じ": "ji",
+    "ち": "chi",
+    "つ": "tsu",
+    "ぢ": "ji",
+    "づ": "zu",
+    "ふ": "fu",
+    "や": "ya",
+    "ゆ": "yu",
+    "よ": "yo",
+    "わ": "wa",
+    "ゐ": "wi",
+    "ゑ": "we",
+    "を": "wo",
+    "ん": "n",
+    "ゔ": "vu",
+    "ぁ": "xa",
+    "ぃ": "xi",
+    "ぅ": "xu",
+    "ぇ": "xe",
+    "ぉ": "xo",
+    "ゃ": "xya",
+    "ゅ": "xyu",
+    "ょ": "xyo",
+    "ゎ": "xwa",
+    "っ": "xtsu",
+    "ー": "-",
+}
+_EXTENDED = {
+    "ふぁ": "fa",
+    "ふぃ": "fi",
+    "ふぇ": "fe",
+    "ふぉ": "fo",
+    "てぃ": "ti",
+    "でぃ": "di",
+    "とぅ": "tu",
+    "どぅ": "du",
+    "うぃ": "wi",
+    "うぇ": "we",
+    "うぉ": "wo",
+    "しぇ": "she",
+    "じぇ": "je",
+    "ちぇ": "che",
+    "ゔぁ": "va",
+    "ゔぃ": "vi",
+    "ゔぇ": "ve",
+    "ゔぉ": "vo",
+}
+# accepted when typing, but never produced
+_INPUT_ONLY = {
+    "si": "し",
+    "zi": "じ",
+    "ti": "ち",
+    "tu": "つ",
+    "hu": "ふ",
+    "sya": "しゃ",
+    "syu": "しゅ",
+    "syo": "しょ",
+    "zya": "じゃ",
+    "zyu": "じゅ",
+    "zyo": "じょ",
+    "jya": "じゃ",
+    "jyu": "じゅ",
+    "jyo": "じょ",
+    "tya": "ちゃ",
+    "tyu": "ちゅ",
+    "tyo": "ちょ",
+    "ltsu": "っ",
+    "ltu": "っ",
+}
+_VOWELS = "aiueo"
+
+
+def _kana_table() -> dict[str, str]:
+    table = {}
+    for c, row in _ROWS.items():
+        for kana, v in zip(row, _VOWELS):
+            table[kana] = c + v
+    table.update(_IRREGULAR)
+    # きゃ, しゃ, ちゃ, ...: drop the i of the i-column and add the y-sound
+    for c, row in _ROWS.items():
+        if not c:
+            continue
+        i_kana = row[1]
+        stem = table[i_kana][:-1]
+        for small, v in zip("ゃゅょ", "auo"):
+            table[i_kana + small] = stem + ("" if stem in ("sh", "ch", "j") else "y") + v
+    table.update(_EXTENDED)
+    return table
+
+
+KANA_TO_ROMAJI = _kana_table()
+ROMAJI_TO_KANA: dict[str, str] = {}
+# first spelling wins, so じ stays "ji" and ぢ is only reached through it
+for _kana, _romaji in KANA_TO_ROMAJI.items():
+    ROMAJI_TO_KANA.setdefault(_romaji, _kana)
+ROMAJI_TO_KANA.update(_INPUT_ONLY)
+_MAX_KANA = max(map(len, KANA_TO_ROMAJI))
+_MAX_ROMAJI = max(map(len, ROMAJI_TO_KANA))
+
+
+def to_hiragana(text: str) -> str:
+    return text.translate(_KATA_TO_HIRA)
+
+
+def to_katakana(text: str) -> str:
+    return text.translate(_HIRA_TO_KATA)
+
+
+def is_romaji(text: str) -> bool:
+    return text.isascii() and any(ch.isalpha() for ch in text)
+
+
+def is_kana(text: str) -> bool:
+    """Only hiragana, katakana and the long vowel mark."""
+    return bool(text) and all("\u3041" <= ch <= "\u30ff" for ch in text)
+
+
+def to_romaji(text: str) -> str:
+    """Hepburn romaji for the kana in `text`; anything else is kept as is."""
+    text = to_hiragana(text)
+    out: list[str] = []
+    geminate = False
+    i = 0
+    while i < len(text):
+        for size in range(_MAX_KANA, 0, -1):
+            romaji = KANA_TO_ROMAJI.get(text[i : i + size])
+            if romaji is not None:
+                break
+        else:
+            size, romaji = 1, text[i]
+
+        if text[i] == "っ":
+            geminate = True
+            i += 1
+            continue
+        if romaji == "-" and out and out[-1][-1:] in _VOWELS:
+            romaji = out[-1][-1]
+        elif geminate and romaji[0] not in _VOWELS:
+            romaji = ("t" if romaji.startswith("ch") else romaji[0]) + romaji
+        elif out and out[-1] == "n" and text[i - 1] == "ん" and romaji[0] in _VOWELS + "y":
+            out[-1] = "n'"
+        geminate = False
+        out.append(romaji)
+        i += size
+    if geminate:
+        out.append("xtsu")
+    return "".join(out)
+
+
+def to_kana(text: str, katakana: bool = False) -> str:
+    """Hiragana (or katakana) for romaji `text`; anything else is kept as is."""
+    text = text.lower()
+    out: list[str] = []
+    i = 0
+    while i < len(text):
+        ch = text[i]
+        nxt = text[i + 1 : i + 2]
+        if ch == "n" and nxt == "'":
+            out.append("ん")
+            i += 2
+            continue
+        if ch == "n" and nxt == "n":
+            # "konnichiwa": the second n starts the next syllable
+            out.append("ん")
+            after = text[i + 2 : i + 3]
+            i += 1 if after and after in _VOWELS + "y" else 2
+            continue
+        if ch == "n" and (not nxt or nxt not in _VOWELS + "y"):
+            out.append("ん")
+            i += 1
+            continue
+        if ch == nxt and ch.isalpha() and ch not in _VOWELS:
+            out.append("っ")
+            i += 1
+            continue
+        if ch == "t" and text.startswith("ch", i + 1):
+            out.append("っ")
+            i += 1
+            continue
+        for size in range(_MAX_ROMAJI, 0, -1):
+            kana = ROMAJI_TO_KANA.get(text[i : i + size])
+            if kana is not None:
+                break
+        else:
+            size, kana = 1, ch
+        out.append(kana)
+        i += size
+    kana = "".join(out)
+    return to_katakana(kana) if katakana else kana
+
+
+def reading_key(text: str) -> str:
+    """Hiragana form of a romaji, hiragana or katakana query.
+
+    Kana goes through romaji and back, so コーヒー, こおひい and "koohii"
+    share one key.
+    """
+    if not is_romaji(text):
+        text = to_romaji(text)
+    return to_kana(text)
+
+
+def convert_column(fn: Callable[[str], str], values: Iterable[str]) -> list[str]:
+    """`fn` over a column of values, converting each distinct value once."""
+    values = list(values)
+    converted = {v: fn(v) for v in dict.fromkeys(values)}
+    return [converted[v] for v in values]
+
+
+class ReadingIndex(WordIndex):
+    """Readings and written forms of cached word entries, mapped to their cache keys.
+
+    Queries may be romaji, hiragana or katakana, and resolve to the keys
+    a `FileCache` already holds, without asking jisho.org.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._sorted: list[str] | None = None
+
+    def _new_key(self, key: str) -> None:
+        self._sorted = None
+
+    _drop_key = _new_key
+
+    def keys_of(self, wr) -> list[str]:
+        readings = [j.reading for w in wr.data for j in w.japanese if j.reading]
+        keys = convert_column(reading_key, readings)
+        for w in wr.data:
+            keys.append(w.slug)
+            keys.extend(j.word for j in w.japanese if j.word)
+        return keys
+
+    def lookup(self, query: str) -> list[str]:
+        """Cache keys holding an entry read or written as `query`."""
+        terms = self._keys.get(query) or self._keys.get(reading_key(query), {})
+        return list(terms)
+
+    def prefix(self, query: str, limit: int | None = None) -> list[str]:
+        """Cache keys of entries whose reading starts with `query`."""
+        if self._sorted is None:
+            self._sorted = sorted(self._keys)
+        # "suid" is on its way to すいど, search for すい
+        key = reading_key(query).rstrip(ascii_lowercase)
+        found: dict[str, None] = {}
+        for i in range(bisect_left(self._sorted, key), len(self._sorted)):
+            if not self._sorted[i].startswith(key):
+                break
+            found.update(self._keys[self._sorted[i]])
+            if limit is not None and len(found) >= limit:
+                break
+        return list(found)[:limit]
@@ -1,17 +1,18 @@
 from __future__ import annotations
 
-import json
 import re
 from typing import Any
 import urllib.parse
 from pathlib import Path
 
-import requests
 from bs4 import BeautifulSoup
 from pydantic import BaseModel
 
+from jisho_api import timing
+from jisho_api.cache import CacheError
+from jisho_api.client import Client, default_client
 from jisho_api.cli import console
-from jisho_api.kanji.cfg import KanjiConfig
+from jisho_api.kanji.cfg import KanjiConfig, ReadingExamples
 from jisho_api.util import CLITagger
 
 
@@ -27,6 +28,8 @@ class KanjiRequest(BaseModel):
         return 1
 
     def rich_print(self):
+        # built up and printed at once, rich renders a single block much faster
+        lines = []
         base = f"[green]{self.data.kanji} "
         base += CLITagger.colorize(
             "Kun",
@@ -36,7 +39,7 @@ class KanjiRequest(BaseModel):
         base += CLITagger.colorize(
             "On", ", ".join(self.data.main_readings.on) if self.data.main_readings.on else "", "red", last=True
         )
-        console.print(base)
+        lines.append(base)
         # TODO - TRY on this
         base = CLITagger.colorize("Strokes", self.data.strokes, "yellow")
         try:
@@ -46,10 +49,10 @@ class KanjiRequest(BaseModel):
             )
         except Exception as e:
             print(e)
-        console.print(base)
+        lines.append(base)
 
-        console.print(f"Radical no {self.data.radical.kangxi_order}:")
-        console.print(
+        lines.append(f"Radical no {self.data.radical.kangxi_order}:")
+        lines.append(
             CLITagger.colorize(
                 "Base",
                 f"{self.data.radical.basis} - {self.data.radical.meaning}",
@@ -58,7 +61,7 @@ class KanjiRequest(BaseModel):
             )
         )
         try:
-            console.print(
+            lines.append(
                 CLITagger.colorize(
                     "Alternate Radical",
                     ", ".join(self.data.radical.alt_forms) if self.data.radical.alt_forms else "",
@@ -68,13 +71,13 @@ class KanjiRequest(BaseModel):
             )
         except Exception:
             pass
-        console.print(
+        lines.append(
             CLITagger.colorize(
                 "Parts", ", ".join(self.data.radical.parts), "yellow", last=True
             )
         )
         try:
-            console.print(
+            lines.append(
                 CLITagger.colorize(
                     "Variants",
                     ", ".join(self.data.radical.variants) if self.data.radical.variants else "",
@@ -85,24 +88,27 @@ class KanjiRequest(BaseModel):
         except Exception:
             pass
 
-        console.print()
-        console.print("On Examples:")
-        for m in self.data.reading_examples.on:
+        examples = self.data.reading_examples or ReadingExamples()
+        lines.append("")
+        lines.append("On Examples:")
+        for m in examples.on or []:
             bullet_text = (
                 f"{m.kanji} [yellow][{m.reading}] [white]{', '.join(m.meanings)}"
             )
-            console.print(CLITagger.bullet(bullet_text, color="green"))
-        console.print()
-        console.print("Kun Examples:")
-        for m in self.data.reading_examples.kun:
+            lines.append(CLITagger.bullet(bullet_text, color="green"))
+        lines.append("")
+        lines.append("Kun Examples:")
+        for m in examples.kun or []:
             bullet_text = (
                 f"{m.kanji} [yellow][{m.reading}] [white]{', '.join(m.meanings)}"
             )
-            console.print(CLITagger.bullet(bullet_text, color="green"))
+            lines.append(CLITagger.bullet(bullet_text, color="green"))
+        console.print("\n".join(lines))
 
 
 class Kanji:
     URL = "https://jisho.org/search/"
+    PATH = "/search/"
     ROOT = Path.home() / ".jisho/data/kanji/"
 
     @staticmethod
@@ -323,59 +329,77 @@ class Kanji:
             "parts": parts,
         }
 
+    @staticmethod
+    def fetch(
+        kanji: str,
+        headers: dict[str, str] | None = None,
+        client: Client | None = None,
+    ) -> KanjiRequest:
+        client = client or default_client()
+        url = client.url(Kanji) + urllib.parse.quote(kanji + " #kanji")
+        client.count("fetches")
+        r = client.get(url, headers=headers).content
+
+        with timing.span("kanji.parse"):
+            soup = BeautifulSoup(r, "html.parser")
+        with timing.span("kanji.extract"):
+            data = dict(
+                kanji=kanji,
+                strokes=Kanji.strokes(soup),
+                main_meanings=Kanji.main_meanings(soup),
+                main_readings=Kanji.main_readings(soup),
+                meta=Kanji.meta(soup),
+                radical=Kanji.radical(soup),
+                reading_examples=Kanji.reading_examples(soup),
+            )
+        with timing.span("kanji.validate"):
+            return KanjiRequest(
+                meta=RequestMeta(status=200),
+                data=KanjiConfig(**data),
+            )
+
     @staticmethod
     def request(
         kanji: str,
         cache: bool = False,
         headers: dict[str, str] | None = None,
+        client: Client | None = None,
     ) -> KanjiRequest | None:
-        url = Kanji.URL + urllib.parse.quote(kanji + " #kanji")
+        client = client or default_client()
         toggle = False
 
-        if cache and (Kanji.ROOT / (kanji + ".json")).exists():
+        r = None
+        if cache:
+            try:
+                r = client.cache_for(Kanji).get(kanji)
+                client.count("cache_misses" if r is None else "cache_hits")
+            except CacheError as e:
+                console.print(f"[red bold][Error] [white] {e}")
+
+        if r is not None:
             toggle = True
-            with open(Kanji.ROOT / (kanji + ".json"), "r", encoding="utf-8") as fp:
-                r = json.load(fp)
             r = KanjiRequest(**r)
         else:
-            r = requests.get(url, headers=headers).content
-
-            soup = BeautifulSoup(r, "html.parser")
-
             try:
-                r = KanjiRequest(
-                    meta=RequestMeta(status=200),
-                    data=KanjiConfig(
-                        kanji=kanji,
-                        strokes=Kanji.strokes(soup),
-                        main_meanings=Kanji.main_meanings(soup),
-                        main_readings=Kanji.main_readings(soup),
-                        meta=Kanji.meta(soup),
-                        radical=Kanji.radical(soup),
-                        reading_examples=Kanji.reading_examples(soup),
-                    ),
-                )
-                if not len(r):
-                    console.print(
-                        f"[red bold][Error] [white] No matches found for {kanji}."
-                    )
-                    return None
+                r = Kanji.fetch(kanji, headers=headers, client=client)
             except Exception as e:
+                client.record_error(e)
                 console.print(
                     f"[red bold ][Error][/red bold] [white]Failed to request {kanji}: {e}"
                 )
                 return None
         if cache and not toggle:
-            Kanji.save(kanji, r)
+            Kanji.save(kanji, r, client=client)
         return r
 
     @staticmethod
-    def save(word: str, r: KanjiRequest | dict[str, Any]) -> None:
-        Kanji.ROOT.mkdir(exist_ok=True)
+    def save(
+        word: str, r: KanjiRequest | dict[str, Any], client: Client | None = None
+    ) -> None:
+        client = client or default_client()
         try:
             payload = r if isinstance(r, dict) else r.model_dump(exclude_unset=True, by_alias=True)
-            with open(Kanji.ROOT / f"{word}.json", "w", encoding="utf-8") as fp:
-                json.dump(payload, fp, indent=4, ensure_ascii=False)
+            client.cache_for(Kanji).put(word, payload)
         except Exception as e:
             console.print(f"[red bold][Error] [white] Failed to save {word}: {str(e)}")
 
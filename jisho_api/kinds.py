@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+# kind -> (module, request class, reply model)
+KINDS = {
+    "word": ("jisho_api.word.request", "Word", "WordRequest"),
+    "kanji": ("jisho_api.kanji.request", "Kanji", "KanjiRequest"),
+    "sentence": ("jisho_api.sentence.request", "Sentence", "SentenceRequest"),
+    "tokens": ("jisho_api.tokenize.request", "Tokens", "TokenRequest"),
+}
+
+
+def _load(kind: str, idx: int) -> Any:
+    try:
+        spec = KINDS[kind]
+    except KeyError:
+        raise ValueError(f"Unknown kind {kind!r}, expected one of {', '.join(KINDS)}")
+    return getattr(importlib.import_module(spec[0]), spec[idx])
+
+
+def request_class(kind: str) -> Any:
+    return _load(kind, 1)
+
+
+def reply_model(kind: str) -> Any:
+    return _load(kind, 2)
+
+
+def kind_of(cls: Any) -> str:
+    for kind, spec in KINDS.items():
+        if spec[1] == cls.__name__ and spec[0] == cls.__module__:
+            return kind
+    raise ValueError(f"{cls!r} is not a jisho request class")
+
+
+def pack_fields(kind: str) -> dict | None:
+    """Vocabulary fields a payload of `kind` can be packed on, if any."""
+    from jisho_api.vocab import TOKEN_FIELDS, WORD_FIELDS
+
+    return {"word": WORD_FIELDS, "tokens": TOKEN_FIELDS}.get(kind)
+
+
+def reply_from_payload(kind: str, payload: dict[str, Any]) -> Any:
+    """Reply model of `kind` from a cached payload, packed or not."""
+    from jisho_api.vocab import unpack
+
+    fields = pack_fields(kind)
+    if fields is not None:
+        payload = unpack(payload, fields)
+    return reply_model(kind)(**payload)
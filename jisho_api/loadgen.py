@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from pydantic import BaseModel
+
+from jisho_api.client import Client
+from jisho_api.ratelimit import RateController
+from jisho_api.transport import HTTP2Transport, Transport
+
+MODES = ("sync", "async", "batch")
+# sentences per batch tokens query
+BATCH_SIZE = 10
+
+
+class LoadReport(BaseModel):
+    kind: str
+    mode: str
+    requests: int = 0
+    errors: int = 0
+    seconds: float = 0.0
+    throughput: float = 0.0
+    p50: float = 0.0
+    p95: float = 0.0
+    p99: float = 0.0
+
+
+def percentile(latencies: list[float], q: float) -> float:
+    """Nearest-rank percentile `q` (0-100) of sorted `latencies`."""
+    if not latencies:
+        return 0.0
+    rank = max(math.ceil(q / 100 * len(latencies)), 1)
+    return latencies[rank - 1]
+
+
+def load_client(base_url: str, concurrency: int, http2: bool = False) -> Client:
+    """Client for `base_url` with a transport sized for `concurrency` lookups.
+
+    With `http2`, lookups are multiplexed over a single HTTP/2 connection.
+    """
+    rate = RateController(max_concurrency=concurrency)
+    if http2:
+        transport = HTTP2Transport(
+            rate=rate, pool_size=1, prior_knowledge=base_url.startswith("http://")
+        )
+    else:
+        transport = Transport(rate=rate, pool_size=concurrency)
+    return Client(base_url=base_url, transport=transport)
+
+
+def terms(kind: str, n: int) -> list[str]:
+    # distinct terms, so nothing is answered from a cache or shared in flight
+    base = {"word": "water", "kanji": "水", "sentence": "水", "tokens": "猫が好きです"}[kind]
+    return [f"{base}{i}" for i in range(n)]
+
+
+def _timed(fn: Callable[[], bool]) -> tuple[float, bool]:
+    start = time.perf_counter()
+    try:
+        ok = fn()
+    except Exception:
+        ok = False
+    return time.perf_counter() - start, ok
+
+
+def _run_sync(
+    client: Client, kind: str, todo: list[str], concurrency: int
+) -> list[tuple[float, bool]]:
+    def one(term: str) -> tuple[float, bool]:
+        return _timed(lambda: client.request(kind, term) is not None)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as ex:
+        return list(ex.map(one, todo))
+
+
+def _run_async(
+    client: Client, kind: str, todo: list[str], concurrency: int
+) -> list[tuple[float, bool]]:
+    from jisho_api.server import Daemon
+
+    # through the lookup daemon's event loop, as `jisho serve` answers them
+    daemon = Daemon(cache=False, workers=concurrency, client=client)
+
+    async def one(term: str) -> tuple[float, bool]:
+        start = time.perf_counter()
+        try:
+            ok = await daemon.lookup(kind, term) is not None
+        except Exception:
+            ok = False
+        return time.perf_counter() - start, ok
+
+    async def main() -> list[tuple[float, bool]]:
+        return await asyncio.gather(*(one(t) for t in todo))
+
+    try:
+        return asyncio.run(main())
+    finally:
+        daemon.close()
+
+
+def _run_batch(
+    client: Client, kind: str, todo: list[str], concurrency: int
+) -> list[tuple[float, bool]]:
+    from jisho_api.tokenize.request import Tokens
+
+    if kind != "tokens":
+        raise ValueError("Only tokens have a batch path")
+
+    def one(batch: list[str]) -> list[tuple[float, bool]]:
+        start = time.perf_counter()
+        try:
+            res = Tokens.request_batch(batch, client=client)
+        except Exception:
+            res = {}
+        took = time.perf_counter() - start
+        # every sentence of a batch waits for the whole query
+        return [(took, res.get(s) is not None) for s in batch]
+
+    batches = [todo[i : i + BATCH_SIZE] for i in range(0, len(todo), BATCH_SIZE)]
+    with ThreadPoolExecutor(max_workers=concurrency) as ex:
+        return [r for rs in ex.map(one, batches) for r in rs]
+
+
+_RUNNERS = {"sync": _run_sync, "async": _run_async, "batch": _run_batch}
+
+
+def run_load(
+    client: Client,
+    kind: str,
+    mode: str = "sync",
+    requests: int = 1000,
+    concurrency: int = 200,
+) -> LoadReport:
+    """Look up `requests` distinct terms of `kind`, `concurrency` at a time.
+
+    Latencies are per lookup in milliseconds, retries and rate limiting
+    included; failed lookups count as errors but are timed too.
+    """
+    if mode not in _RUNNERS:
+        raise ValueError(f"Unknown mode {mode!r}, expected one of {', '.join(MODES)}")
+    todo = terms(kind, requests)
+    start = time.perf_counter()
+    results = _RUNNERS[mode](client, kind, todo, concurrency)
+    seconds = time.perf_counter() - start
+
+    latencies = sorted(took * 1000 for took, _ in results)
+    return LoadReport(
+        kind=kind,
+        mode=mode,
+        requests=len(results),
+        errors=sum(1 for _, ok in results if not ok),
+        seconds=seconds,
+        throughput=len(results) / seconds if seconds else 0.0,
+        p50=percentile(latencies, 50),
+        p95=percentile(latencies, 95),
+        p99=percentile(latencies, 99),
+    )
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from jisho_api.client import Client, default_client
+from jisho_api.kanji.request import KanjiRequest
+from jisho_api.sentence.request import SentenceRequest
+from jisho_api.util import kanji_in
+from jisho_api.word.request import WordRequest
+
+
+class FullLookup(BaseModel):
+    word: WordRequest | None = Field(default=None)
+    kanji: dict[str, KanjiRequest] = Field(default_factory=dict)
+    sentences: SentenceRequest | None = Field(default=None)
+
+
+def dependent_kanji(wr: WordRequest) -> list[str]:
+    """Kanji written in the best matching entry of `wr`."""
+    if not len(wr):
+        return []
+    return kanji_in("".join(j.word for j in wr.data[0].japanese if j.word))
+
+
+def lookup_full(
+    word: str,
+    cache: bool = False,
+    headers: dict[str, str] | None = None,
+    client: Client | None = None,
+) -> FullLookup:
+    """Look up `word`, its kanji and example sentences together.
+
+    Sentences are requested alongside the word, and every kanji as soon
+    as the word entry is known, so the whole lookup takes about as long
+    as its two slowest round trips instead of their sum.
+    """
+    client = client or default_client()
+    sentences = client.submit("sentence", word, cache, headers)
+    wr = client.submit("word", word, cache, headers).result()
+
+    kanji: dict[str, Any] = {}
+    if wr is not None:
+        kanji = {k: client.submit("kanji", k, cache, headers) for k in dependent_kanji(wr)}
+
+    return FullLookup(
+        word=wr,
+        kanji={k: f.result() for k, f in kanji.items() if f.result() is not None},
+        sentences=sentences.result(),
+    )
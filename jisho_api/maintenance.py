@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from jisho_api.cache import CacheError, FileCache, SlugCache
+from jisho_api.kinds import pack_fields, reply_from_payload
+from jisho_api.vocab import is_packed, pack
+
+DAY = 24 * 60 * 60
+AGE_BUCKETS = (("1d", DAY), ("1w", 7 * DAY), ("30d", 30 * DAY), ("1y", 365 * DAY))
+
+
+class CacheStats(BaseModel):
+    kind: str
+    files: int = 0
+    bytes: int = 0
+    entries: int = 0
+    empty: int = 0
+    expired: int = 0
+    corrupted: int = 0
+    ages: dict[str, int] = Field(default_factory=dict)
+
+
+class VerifyReport(BaseModel):
+    kind: str
+    checked: int = 0
+    corrupted: list[str] = Field(default_factory=list)
+    removed: int = 0
+
+
+class PruneReport(BaseModel):
+    removed: int = 0
+    freed: int = 0
+    kept: int = 0
+    kept_bytes: int = 0
+
+
+class CompactReport(BaseModel):
+    kind: str
+    files: int = 0
+    skipped: int = 0
+    bytes_before: int = 0
+    bytes_after: int = 0
+
+
+def _files(fc: FileCache) -> list[Path]:
+    if not fc.root.exists():
+        return []
+    return list(fc.root.glob("*.json"))
+
+
+def _age_bucket(age: float) -> str:
+    for name, limit in AGE_BUCKETS:
+        if age < limit:
+            return f"<{name}"
+    return f">{AGE_BUCKETS[-1][0]}"
+
+
+def _map(fn, items, workers: int) -> list[Any]:
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(fn, items))
+
+
+def cache_stats(kind: str, fc: FileCache, workers: int = 8) -> CacheStats:
+    """Entries, bytes and an age histogram of one kind's cache."""
+    now = time.time()
+
+    def check(p: Path) -> tuple[str, os.stat_result]:
+        return fc.status(p.stem), p.stat()
+
+    stats = CacheStats(kind=kind, ages={f"<{name}": 0 for name, _ in AGE_BUCKETS})
+    stats.ages[_age_bucket(float("inf"))] = 0
+    for status, st in _map(check, _files(fc), workers):
+        stats.files += 1
+        stats.bytes += st.st_size
+        stats.ages[_age_bucket(now - st.st_mtime)] += 1
+        if status == fc.HIT:
+            stats.entries += 1
+        elif status == fc.EMPTY:
+            stats.empty += 1
+        elif status == fc.EXPIRED:
+            stats.expired += 1
+        else:
+            stats.corrupted += 1
+    if isinstance(fc, SlugCache):
+        # the shared entries the query files point to
+        stats.bytes += sum(
+            p.stat().st_size for p in (fc.root / fc.ENTRIES).glob("*.json")
+        )
+    return stats
+
+
+def verify(
+    kind: str, fc: FileCache, workers: int = 8, remove: bool = False
+) -> VerifyReport:
+    """Parse and validate every cached file of `kind`, optionally removing bad ones."""
+
+    def check(p: Path) -> bool:
+        try:
+            payload = fc.read(p.stem)
+            reply_from_payload(kind, payload)
+        except Exception:
+            return False
+        return True
+
+    files = _files(fc)
+    report = VerifyReport(kind=kind, checked=len(files))
+    for p, ok in zip(files, _map(check, files, workers)):
+        if ok:
+            continue
+        report.corrupted.append(p.stem)
+        if remove:
+            p.unlink(missing_ok=True)
+            report.removed += 1
+    return report
+
+
+def prune(
+    caches: list[FileCache],
+    ttl: float | None = None,
+    max_bytes: int | None = None,
+    workers: int = 8,
+    dry_run: bool = False,
+) -> PruneReport:
+    """Remove corrupted, expired and older than `ttl` files, then the least
+    recently accessed ones until all `caches` fit in `max_bytes`. Entries of
+    a `SlugCache` no remaining query refers to go too.
+
+    The budget counts the entries a `SlugCache` query refers to along with
+    the query, each shared entry once, for as long as a kept query still
+    refers to it. Access times depend on the filesystem; with `noatime`
+    mounts the eviction order falls back to the last modification.
+    """
+    now = time.time()
+
+    def check(
+        item: tuple[FileCache, Path],
+    ) -> tuple[Path, os.stat_result, bool, list[Path]]:
+        fc, p = item
+        st = p.stat()
+        stale = fc.status(p.stem) in (fc.EXPIRED, fc.MISS)
+        if ttl is not None and now - st.st_mtime > ttl:
+            stale = True
+        entries = []
+        if isinstance(fc, SlugCache) and not stale:
+            try:
+                payload = FileCache.read(fc, p.stem)
+            except CacheError:
+                payload = None
+            slugs = (payload or {}).get("slugs", ())
+            entries = [fc.entry_path(slug) for slug in slugs]
+        return p, st, stale, entries
+
+    items = [(fc, p) for fc in caches for p in _files(fc)]
+    report = PruneReport()
+    doomed: list[tuple[Path, int]] = []
+    kept: list[tuple[float, Path, int, list[Path]]] = []
+    for p, st, stale, entries in _map(check, items, workers):
+        if stale:
+            doomed.append((p, st.st_size))
+        else:
+            kept.append((max(st.st_atime, st.st_mtime), p, st.st_size, entries))
+
+    # entries are charged once, while any kept query refers to them
+    refs: dict[Path, int] = {}
+    for *_, entries in kept:
+        for e in entries:
+            refs[e] = refs.get(e, 0) + 1
+    sizes = {e: e.stat().st_size if e.exists() else 0 for e in refs}
+
+    total = sum(size for _, _, size, _ in kept) + sum(sizes.values())
+    if max_bytes is not None and total > max_bytes:
+        kept.sort(key=lambda k: k[0])
+        evicted = 0
+        while evicted < len(kept) and total > max_bytes:
+            _, p, size, entries = kept[evicted]
+            doomed.append((p, size))
+            total -= size
+            for e in entries:
+                refs[e] -= 1
+                if not refs[e]:
+                    total -= sizes[e]
+            evicted += 1
+        kept = kept[evicted:]
+
+    for p, size in doomed:
+        if not dry_run:
+            p.unlink(missing_ok=True)
+        report.removed += 1
+        report.freed += size
+    for fc in caches:
+        if isinstance(fc, SlugCache) and not dry_run:
+            removed, freed = fc.collect()
+            report.removed += removed
+            report.freed += freed
+    report.kept = len(kept)
+    report.kept_bytes = total
+    return report
+
+
+def compact(kind: str, fc: FileCache, workers: int = 8) -> CompactReport:
+    """Rewrite every readable file of `kind` without indentation, packing
+    vocabulary fields where the kind has them. Modification times are kept,
+    so TTLs are not reset.
+    """
+    if isinstance(fc, SlugCache):
+        # written without indentation already, and packing would inline the entries
+        return CompactReport(kind=kind, skipped=len(_files(fc)))
+    fields = pack_fields(kind)
+
+    def rewrite(p: Path) -> tuple[int, int] | None:
+        st = p.stat()
+        try:
+            payload = fc.read(p.stem)
+        except CacheError:
+            return None
+        if fields is not None and payload.get("data") and not is_packed(payload):
+            payload = pack(payload, fields)
+        content = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+        tmp = p.with_name(p.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as fp:
+            fp.write(content)
+        os.utime(tmp, (st.st_atime, st.st_mtime))
+        os.replace(tmp, p)
+        return st.st_size, p.stat().st_size
+
+    report = CompactReport(kind=kind)
+    for sizes in _map(rewrite, _files(fc), workers):
+        if sizes is None:
+            report.skipped += 1
+            continue
+        report.files += 1
+        report.bytes_before += sizes[0]
+        report.bytes_after += sizes[1]
+    return report
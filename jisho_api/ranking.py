@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import heapq
+import json
+import os
+import re
+import time
+from array import array
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from jisho_api.cache import CacheError, FileCache, is_empty
+
+# column -> array typecode; 0 stands for a missing value in every column
+COLUMNS = {"strokes": "B", "rank": "H", "grade": "B", "jlpt": "B"}
+META = "meta.json"
+KANJI = "kanji.txt"
+# "junior high" has no number on jisho
+JUNIOR_HIGH = 8
+
+
+def encode_grade(grade: str | None) -> int:
+    if not grade:
+        return 0
+    if "junior high" in grade:
+        return JUNIOR_HIGH
+    m = re.search(r"\d+", grade)
+    return int(m.group()) if m else 0
+
+
+def encode_jlpt(jlpt: str | None) -> int:
+    """N5 -> 5 ... N1 -> 1, so easier kanji sort higher."""
+    if not jlpt or not jlpt[1:].isdigit():
+        return 0
+    return int(jlpt[1:])
+
+
+def encode(data: dict[str, Any]) -> dict[str, int]:
+    """Column values of a cached `KanjiConfig` payload."""
+    education = (data.get("meta") or {}).get("education") or {}
+    return {
+        "strokes": int(data.get("strokes") or 0),
+        "rank": int(education.get("newspaper_rank") or 0),
+        "grade": encode_grade(education.get("grade")),
+        "jlpt": encode_jlpt(education.get("jlpt")),
+    }
+
+
+class KanjiRanking:
+    """Numeric columns of cached kanji, with a sorted index per column.
+
+    Every column is a compact `array` with one value per kanji, 0 when
+    jisho has none. Each index holds the row numbers ordered by that
+    column, missing values last, so a top-k query walks it from the
+    start and stops after `k` matches instead of sorting. Columns and
+    indexes are saved under `root` as raw arrays; `update` only reads the
+    cache files written since the last one and merges their rows into the
+    indexes, and drops the kanji that left the cache.
+    """
+
+    def __init__(self, root: Path | str | None = None):
+        self.root = Path(root) if root is not None else None
+        self.kanji: list[str] = []
+        self.columns = {name: array(code) for name, code in COLUMNS.items()}
+        self.indexes = {name: array("I") for name in COLUMNS}
+        self.synced = 0.0
+        self._rows: dict[str, int] = {}
+        if self.root is not None and (self.root / META).exists():
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self.kanji)
+
+    def __contains__(self, kanji: str) -> bool:
+        return kanji in self._rows
+
+    def _load(self) -> None:
+        with open(self.root / META, "r", encoding="utf-8") as fp:
+            meta = json.load(fp)
+        with open(self.root / KANJI, "r", encoding="utf-8") as fp:
+            self.kanji = fp.read().split("\n") if meta["size"] else []
+        for name in COLUMNS:
+            for kind, store in (("col", self.columns), ("idx", self.indexes)):
+                with open(self.root / f"{name}.{kind}", "rb") as fp:
+                    store[name].fromfile(fp, meta["size"])
+        self.synced = meta["synced"]
+        self._rows = {k: i for i, k in enumerate(self.kanji)}
+
+    def save(self) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        for name in COLUMNS:
+            for kind, store in (("col", self.columns), ("idx", self.indexes)):
+                with open(self.root / f"{name}.{kind}", "wb") as fp:
+                    store[name].tofile(fp)
+        with open(self.root / KANJI, "w", encoding="utf-8") as fp:
+            fp.write("\n".join(self.kanji))
+        # written last, a crash before it leaves the previous files readable
+        tmp = self.root / (META + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as fp:
+            json.dump({"size": len(self.kanji), "synced": self.synced}, fp)
+        os.replace(tmp, self.root / META)
+
+    def _key(self, name: str):
+        col, kanji = self.columns[name], self.kanji
+        # missing values last, ties by kanji so the order does not depend on the cache
+        return lambda i: (col[i] == 0, col[i], kanji[i])
+
+    def upsert(self, rows: Iterable[tuple[str, dict[str, int]]]) -> int:
+        """Add or replace kanji with their column values; returns how many changed."""
+        touched: dict[int, None] = {}
+        for kanji, values in rows:
+            i = self._rows.get(kanji)
+            if i is None:
+                i = len(self.kanji)
+                self._rows[kanji] = i
+                self.kanji.append(kanji)
+                for name, col in self.columns.items():
+                    col.append(values[name])
+            elif all(col[i] == values[name] for name, col in self.columns.items()):
+                continue
+            else:
+                for name, col in self.columns.items():
+                    col[i] = values[name]
+            touched[i] = None
+
+        if touched:
+            for name in COLUMNS:
+                # drop the touched rows, then merge them back in order
+                key = self._key(name)
+                kept = [i for i in self.indexes[name] if i not in touched]
+                self.indexes[name] = array(
+                    "I", heapq.merge(kept, sorted(touched, key=key), key=key)
+                )
+        return len(touched)
+
+    def remove(self, kanji: Iterable[str]) -> int:
+        """Drop kanji and their values; returns how many were there."""
+        gone = {self._rows[k] for k in kanji if k in self._rows}
+        if not gone:
+            return 0
+        kept = [i for i in range(len(self.kanji)) if i not in gone]
+        renumber = {old: new for new, old in enumerate(kept)}
+        self.kanji = [self.kanji[i] for i in kept]
+        for name, code in COLUMNS.items():
+            col = self.columns[name]
+            self.columns[name] = array(code, (col[i] for i in kept))
+            # removing rows keeps the others in order
+            self.indexes[name] = array(
+                "I", (renumber[i] for i in self.indexes[name] if i not in gone)
+            )
+        self._rows = {k: i for i, k in enumerate(self.kanji)}
+        return len(gone)
+
+    def update(self, fc: FileCache) -> int:
+        """Read the kanji cached or rewritten since the last update, and drop the
+        ones no longer cached; returns how many changed."""
+        started = time.time()
+        cached: set[str] = set()
+        emptied: list[str] = []
+
+        def rows() -> Iterator[tuple[str, dict[str, int]]]:
+            for key in fc.keys():
+                # the CLI scrapes and caches kanji under their quoted search term
+                kanji = key.strip('"')
+                cached.add(kanji)
+                p = fc.path(key)
+                try:
+                    if kanji in self._rows and p.stat().st_mtime <= self.synced:
+                        continue
+                    payload = fc.read(key)
+                except (OSError, CacheError):
+                    continue
+                if payload is None or is_empty(payload) or not payload.get("data"):
+                    emptied.append(kanji)
+                    continue
+                yield kanji, encode(payload["data"])
+
+        n = self.upsert(rows())
+        n += self.remove([k for k in self.kanji if k not in cached] + emptied)
+        self.synced = started
+        return n
+
+    def _mask(self, filters: dict[str, tuple[int | None, int | None]]) -> bytearray | None:
+        # one pass over a column per filter
+        mask = None
+        for name, (lo, hi) in filters.items():
+            col = self.columns[name]
+            lo = 1 if lo is None else lo
+            hi = (1 << (8 * col.itemsize)) - 1 if hi is None else hi
+            m = bytearray(lo <= v <= hi for v in col)
+            mask = m if mask is None else bytearray(a & b for a, b in zip(mask, m))
+        return mask
+
+    def top(
+        self,
+        order_by: str = "rank",
+        k: int | None = 20,
+        descending: bool = False,
+        **filters: tuple[int | None, int | None],
+    ) -> list[str]:
+        """Kanji ordered by `order_by`, within the inclusive `(min, max)` of
+        every filtered column, e.g. `top("strokes", jlpt=(4, 5), grade=(1, 3))`.
+
+        Kanji with no value for `order_by` come last either way; a filtered
+        column excludes kanji without a value for it.
+        """
+        for name in (order_by, *filters):
+            if name not in COLUMNS:
+                raise ValueError(
+                    f"Unknown column {name!r}, expected one of {', '.join(COLUMNS)}"
+                )
+        idx = self.indexes[order_by]
+        present = len(idx) - self.columns[order_by].count(0)
+        order = idx[:present]
+        if descending:
+            order = reversed(order)
+        mask = self._mask(filters)
+
+        out: list[str] = []
+        for rows in (order, idx[present:]):
+            for i in rows:
+                if mask is None or mask[i]:
+                    out.append(self.kanji[i])
+                    if k is not None and len(out) == k:
+                        return out
+        return out
+
+    def values(self, kanji: str) -> dict[str, int]:
+        i = self._rows[kanji]
+        return {name: col[i] for name, col in self.columns.items()}
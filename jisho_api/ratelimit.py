@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable
+
+# statuses jisho.org uses when it wants us to slow down
+THROTTLE_STATUSES = frozenset({429, 503})
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(RuntimeError):
+    pass
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RateController:
+    """Adaptive concurrency limit shared by every request to jisho.org.
+
+    The limit grows additively on success and shrinks multiplicatively when
+    jisho throttles (AIMD). `Retry-After` pauses every caller until it has
+    passed, and after `failure_threshold` consecutive failures the circuit
+    opens for `reset_timeout` seconds, failing fast with `CircuitOpenError`.
+    A single trial request is let through once it half-opens.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        min_concurrency: int = 1,
+        backoff_base: float = 0.5,
+        backoff_max: float = 60.0,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+
+        self._cond = threading.Condition()
+        self._limit = float(max_concurrency)
+        self._in_flight = 0
+        self._resume_at = 0.0
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._failures = 0
+        self._counts = {"requests": 0, "throttled": 0, "errors": 0, "rejected": 0}
+
+    @property
+    def limit(self) -> int:
+        return max(self.min_concurrency, int(self._limit))
+
+    @property
+    def state(self) -> str:
+        with self._cond:
+            self._tick()
+            return self._state
+
+    def _tick(self) -> None:
+        if (
+            self._state == self.OPEN
+            and self.clock() - self._opened_at >= self.reset_timeout
+        ):
+            self._state = self.HALF_OPEN
+
+    def acquire(self, timeout: float | None = None) -> None:
+        deadline = None if timeout is None else self.clock() + timeout
+        with self._cond:
+            while True:
+                self._tick()
+                if self._state == self.OPEN:
+                    self._counts["rejected"] += 1
+                    raise CircuitOpenError(
+                        "jisho.org keeps failing, circuit breaker is open"
+                    )
+                limit = 1 if self._state == self.HALF_OPEN else self.limit
+                wait = self._resume_at - self.clock()
+                if wait <= 0 and self._in_flight < limit:
+                    self._in_flight += 1
+                    self._counts["requests"] += 1
+                    return
+                if deadline is not None:
+                    left = deadline - self.clock()
+                    if left <= 0:
+                        raise TimeoutError("timed out waiting for a request slot")
+                    wait = min(wait, left) if wait > 0 else left
+                self._cond.wait(wait if wait > 0 else None)
+
+    def release(self, status: int | None, retry_after: float | None = None) -> None:
+        """Report how the request went; `status=None` means it never got a response."""
+        with self._cond:
+            self._in_flight -= 1
+            if retry_after:
+                self._resume_at = max(self._resume_at, self.clock() + retry_after)
+
+            if status is not None and status < 500 and status not in THROTTLE_STATUSES:
+                self._failures = 0
+                self._state = self.CLOSED
+                self._limit = min(
+                    float(self.max_concurrency), self._limit + 1 / max(self._limit, 1)
+                )
+            else:
+                if status in THROTTLE_STATUSES:
+                    self._counts["throttled"] += 1
+                    self._limit = max(float(self.min_concurrency), self._limit / 2)
+                else:
+                    self._counts["errors"] += 1
+                self._failures += 1
+                if (
+                    self._state == self.HALF_OPEN
+                    or self._failures >= self.failure_threshold
+                ):
+                    self._state = self.OPEN
+                    self._opened_at = self.clock()
+            self._cond.notify_all()
+
+    def backoff(self, attempt: int) -> float:
+        # full jitter
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    def metrics(self) -> dict[str, Any]:
+        with self._cond:
+            self._tick()
+            return {
+                "limit": self.limit,
+                "in_flight": self._in_flight,
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "paused_for": max(0.0, self._resume_at - self.clock()),
+                **self._counts,
+            }
@@ -1,16 +1,16 @@
 from __future__ import annotations
 
-import json
 from typing import Any, Iterator
 import urllib.parse
 from pathlib import Path
 
-import requests
 from bs4 import BeautifulSoup
 from pydantic import BaseModel
-from rich.markdown import Markdown
 
-from jisho_api.cli import console
+from jisho_api import timing
+from jisho_api.cache import CacheError, is_empty
+from jisho_api.client import Client, default_client
+from jisho_api.cli import RULE, console
 from jisho_api.sentence.cfg import SentenceConfig
 from jisho_api.util import CLITagger
 
@@ -31,16 +31,21 @@ class SentenceRequest(BaseModel):
 
     def rich_print(self):
         for d in self:
-            console.print("[white][[red]jp[white]]")
-            console.print(CLITagger.bullet(d.japanese))
-            console.print("[white][[blue]en[white]]")
-            console.print(CLITagger.bullet(d.en_translation))
-            console.print(Markdown("---"))
+            console.print(
+                "[white][[red]jp[white]]\n"
+                + CLITagger.bullet(d.japanese)
+                + "\n[white][[blue]en[white]]\n"
+                + CLITagger.bullet(d.en_translation)
+            )
+            console.print(RULE)
 
 
 class Sentence:
     URL = "https://jisho.org/search/"
+    PATH = "/search/"
     ROOT = Path.home() / ".jisho/data/sentence/"
+    # sentences per results page
+    PAGE_SIZE = 20
 
     @staticmethod
     def sentences(soup: BeautifulSoup) -> list[SentenceConfig]:
@@ -51,60 +56,112 @@ class Sentence:
             s1_jp = r.find("ul", {"class": "japanese_sentence"})
             s1_en = r.find_all("span", {"class": "english"})[0].text
 
-            b = ""
+            parts = []
             for s in s1_jp.contents:
                 if s.find("span") != -1:
                     u = s.find("span", {"class": "unlinked"}).text
-                    try:
-                        f = s.find("span", {"class": "furigana"}).text
-                        b += f"{u}({f})"
-                    except:
-                        b += f"{u}"
-                        pass
+                    f = s.find("span", {"class": "furigana"})
+                    parts.append(f"{u}({f.text})" if f is not None else u)
                 else:
-                    u = s.text
-                    b += u
-            b = b.strip()
-            sts.append({"japanese": b, "en_translation": s1_en})
+                    parts.append(s.text)
+            sts.append({"japanese": "".join(parts).strip(), "en_translation": s1_en})
 
         return sts
 
+    @staticmethod
+    def fetch(
+        word: str,
+        headers: dict[str, str] | None = None,
+        client: Client | None = None,
+        page: int | None = None,
+    ) -> SentenceRequest:
+        client = client or default_client()
+        url = client.url(Sentence) + urllib.parse.quote(word + " #sentences")
+        if page is not None:
+            url += f"?page={page}"
+        client.count("fetches")
+        r = client.get(url, headers=headers).content
+        with timing.span("sentence.parse"):
+            soup = BeautifulSoup(r, "html.parser")
+        with timing.span("sentence.extract"):
+            data = Sentence.sentences(soup)
+        with timing.span("sentence.validate"):
+            return SentenceRequest(
+                meta=RequestMeta(status=200),
+                data=data,
+            )
+
+    @staticmethod
+    def pages(
+        word: str,
+        max_pages: int | None = None,
+        headers: dict[str, str] | None = None,
+        client: Client | None = None,
+    ) -> Iterator[SentenceRequest]:
+        """Result pages of `word`, each requested only when the previous one was consumed.
+
+        A page that fails raises, so callers can tell a partial harvest from a complete one.
+        """
+        page = 1
+        while max_pages is None or page <= max_pages:
+            r = Sentence.fetch(word, headers=headers, client=client, page=page)
+            if not len(r):
+                return
+            yield r
+            if len(r) < Sentence.PAGE_SIZE:
+                return
+            page += 1
+
     @staticmethod
     def request(
         word: str,
         cache: bool = False,
         headers: dict[str, str] | None = None,
+        client: Client | None = None,
     ) -> SentenceRequest | None:
-        url = Sentence.URL + urllib.parse.quote(word + " #sentences")
+        client = client or default_client()
         toggle = False
 
-        if cache and (Sentence.ROOT / (word + ".json")).exists():
+        r = None
+        if cache:
+            try:
+                r = client.cache_for(Sentence).get(word)
+                client.count("cache_misses" if r is None else "cache_hits")
+            except CacheError as e:
+                console.print(f"[red bold][Error] [white] {e}")
+
+        if r is not None:
+            if is_empty(r):
+                console.print(f"[red bold][Error] [white] No matches found for {word}.")
+                return None
             toggle = True
-            with open(Sentence.ROOT / (word + ".json"), "r", encoding="utf-8") as fp:
-                r = json.load(fp)
             r = SentenceRequest(**r)
         else:
-            r = requests.get(url, headers=headers).content
-            soup = BeautifulSoup(r, "html.parser")
-
-            r = SentenceRequest(
-                meta=RequestMeta(status=200),
-                data=Sentence.sentences(soup),
-            )
+            try:
+                r = Sentence.fetch(word, headers=headers, client=client)
+            except Exception as e:
+                client.record_error(e)
+                console.print(
+                    f"[red bold][Error] [white] Failed to request {word}: {str(e)}"
+                )
+                return None
             if not len(r):
                 console.print(f"[red bold][Error] [white] No matches found for {word}.")
+                if cache:
+                    client.cache_for(Sentence).put_empty(word)
                 return None
         if cache and not toggle:
-            Sentence.save(word, r)
+            Sentence.save(word, r, client=client)
         return r
 
     @staticmethod
-    def save(word: str, r: SentenceRequest | dict[str, Any]) -> None:
-        Sentence.ROOT.mkdir(exist_ok=True)
+    def save(
+        word: str, r: SentenceRequest | dict[str, Any], client: Client | None = None
+    ) -> None:
+        client = client or default_client()
         try:
             payload = r if isinstance(r, dict) else r.model_dump(exclude_unset=True, by_alias=True)
-            with open(Sentence.ROOT / f"{word}.json", "w", encoding="utf-8") as fp:
-                json.dump(payload, fp, indent=4, ensure_ascii=False)
+            client.cache_for(Sentence).put(word, payload)
         except Exception as e:
             console.print(f"[red bold][Error] [white] Failed to save {word}: {str(e)}")
 
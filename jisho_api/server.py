@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from jisho_api.cache import MemoryCache
+from jisho_api.client import Client, default_client
+from jisho_api.kinds import KINDS
+from jisho_api.ratelimit import CircuitOpenError
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    500: "Internal Server Error",
+    502: "Bad Gateway",
+    503: "Service Unavailable",
+}
+
+
+class UpstreamError(Exception):
+    """jisho.org could not be asked, as opposed to it having no matches."""
+
+
+class Daemon:
+    """Local HTTP/JSON service over the request classes.
+
+    `GET /<kind>?q=<term>` for every kind in `jisho_api.kinds.KINDS`, and
+    `GET /metrics`. Replies are kept serialized in a shared `MemoryCache`,
+    in front of the usual disk cache, and concurrent lookups of the same
+    term share one upstream request. Terms with no matches get a 404, failed
+    upstream requests a 502, or a 503 while the circuit breaker is open.
+    """
+
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        cache: bool = True,
+        memory_size: int = 4096,
+        workers: int = 8,
+        access_log: Path | str | None = None,
+        client: Client | None = None,
+    ):
+        self.host = host
+        self.port = port
+        self.cache = cache
+        self.client = client or default_client()
+        self.memory = MemoryCache(maxsize=memory_size)
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self._inflight: dict[tuple[str, str], asyncio.Future] = {}
+        # one `<kind>\t<term>` line per lookup, to plan `jisho warm` runs
+        self.access_log = (
+            open(access_log, "a", encoding="utf-8", buffering=1) if access_log else None
+        )
+
+    def _lookup(self, kind: str, term: str) -> bytes | None:
+        self.client.last_error()
+        r = self.client.request(kind, term, cache=self.cache)
+        if r is None:
+            e = self.client.last_error()
+            if e is not None:
+                raise UpstreamError(str(e)) from e
+            return None
+        return r.model_dump_json().encode("utf-8")
+
+    async def lookup(self, kind: str, term: str) -> bytes | None:
+        key = (kind, term)
+        if self.access_log:
+            self.access_log.write(f"{kind}\t{term}\n")
+        body = self.memory.get(key, default=...)
+        if body is not ...:
+            return body
+        if key in self._inflight:
+            return await asyncio.shield(self._inflight[key])
+
+        loop = asyncio.get_running_loop()
+        fut = loop.run_in_executor(self.executor, self._lookup, kind, term)
+        self._inflight[key] = fut
+        try:
+            body = await fut
+        finally:
+            del self._inflight[key]
+        # misses are left to the disk cache, which knows empty from failed
+        if body is not None:
+            self.memory.put(key, body)
+        return body
+
+    def metrics(self) -> dict[str, Any]:
+        return {**self.client.metrics(), "memory": self.memory.stats()}
+
+    async def dispatch(self, method: str, target: str) -> tuple[int, bytes]:
+        if method != "GET":
+            return 405, b'{"error": "only GET is supported"}'
+        url = urllib.parse.urlsplit(target)
+        kind = url.path.strip("/")
+        if kind == "metrics":
+            return 200, json.dumps(self.metrics()).encode("utf-8")
+        query = urllib.parse.parse_qs(url.query)
+        if kind not in KINDS or "q" not in query:
+            return 400, b'{"error": "expected /<kind>?q=<term>"}'
+
+        try:
+            body = await self.lookup(kind, query["q"][0])
+        except UpstreamError as e:
+            # an open circuit breaker means jisho is being given a rest
+            status = 503 if isinstance(e.__cause__, CircuitOpenError) else 502
+            return status, json.dumps({"error": str(e)}).encode("utf-8")
+        except Exception as e:
+            return 500, json.dumps({"error": str(e)}).encode("utf-8")
+        if body is None:
+            return 404, b'{"error": "no matches"}'
+        return 200, body
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line.strip():
+                    break
+                method, target, _ = line.decode("latin-1").split(" ", 2)
+                keep_alive = True
+                while True:
+                    header = await reader.readline()
+                    if header in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = header.decode("latin-1").partition(":")
+                    if name.strip().lower() == "connection":
+                        keep_alive = value.strip().lower() != "close"
+
+                status, body = await self.dispatch(method, target)
+                writer.write(
+                    (
+                        f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                        "Content-Type: application/json; charset=utf-8\r\n"
+                        f"Content-Length: {len(body)}\r\n"
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+                        "\r\n"
+                    ).encode("latin-1")
+                    + body
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    def close(self) -> None:
+        self.executor.shutdown()
+        if self.access_log:
+            self.access_log.close()
+            self.access_log = None
+
+    async def serve_forever(self) -> None:
+        try:
+            server = await asyncio.start_server(self.handle, self.host, self.port)
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.close()
+
+
+def serve(**kwargs) -> None:
+    asyncio.run(Daemon(**kwargs).serve_forever())
+
+
+def query(
+    kind: str,
+    term: str,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    timeout: float = 30.0,
+) -> dict[str, Any] | None:
+    """Ask a running daemon; raises `OSError` when none is listening."""
+    url = f"http://{host}:{port}/{kind}?" + urllib.parse.urlencode({"q": term})
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as resp:
+            return json.loads(resp.read())
+    except urllib.error.HTTPError as e:
+        if e.code == 404:
+            return None
+        raise
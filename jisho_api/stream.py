@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator
+
+from jisho_api.cache import CacheError, is_empty
+from jisho_api.cli import console
+from jisho_api.client import Client, default_client
+from jisho_api.kinds import kind_of, reply_from_payload
+from jisho_api.util import quote_term
+
+INDEX = "index.jsonl"
+
+
+class SegmentWriter:
+    """Appends results to rolling JSONL segment files under `root`.
+
+    Each segment holds at most `max_records` lines of
+    `{"term": ..., "result": ...}`, gzip compressed unless `compress` is
+    False. `index.jsonl` maps every term to its segment and line. Opening
+    an existing `root` continues with a new segment.
+    """
+
+    def __init__(
+        self, root: Path | str, max_records: int = 10000, compress: bool = True
+    ):
+        self.root = Path(root)
+        self.max_records = max_records
+        self.compress = compress
+        self.root.mkdir(parents=True, exist_ok=True)
+
+        existing = sorted(self.root.glob("segment-*.jsonl*"))
+        self._segment = (
+            int(existing[-1].name.split("-")[1].split(".")[0]) + 1 if existing else 0
+        )
+        self._fp: IO[str] | None = None
+        self._lines = 0
+        # line buffered, so a crash keeps the index of every finished segment
+        self._index = open(self.root / INDEX, "a", encoding="utf-8", buffering=1)
+
+    def _segment_name(self) -> str:
+        ext = ".jsonl.gz" if self.compress else ".jsonl"
+        return f"segment-{self._segment:05d}{ext}"
+
+    def _roll(self) -> None:
+        if self._fp is not None:
+            self._fp.close()
+            self._segment += 1
+        p = self.root / self._segment_name()
+        if self.compress:
+            self._fp = gzip.open(p, "wt", encoding="utf-8")
+        else:
+            self._fp = open(p, "w", encoding="utf-8")
+        self._lines = 0
+
+    def write(self, term: str, r: Any) -> None:
+        if self._fp is None or self._lines >= self.max_records:
+            self._roll()
+        payload = r if isinstance(r, dict) else r.model_dump(mode="json", exclude_unset=True)
+        self._fp.write(
+            json.dumps({"term": term, "result": payload}, ensure_ascii=False) + "\n"
+        )
+        self._index.write(
+            json.dumps(
+                {"term": term, "segment": self._segment_name(), "line": self._lines},
+                ensure_ascii=False,
+            )
+            + "\n"
+        )
+        self._lines += 1
+
+    def close(self) -> None:
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+        self._index.close()
+
+    def __enter__(self) -> SegmentWriter:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _open_segment(p: Path) -> IO[str]:
+    if p.suffix == ".gz":
+        return gzip.open(p, "rt", encoding="utf-8")
+    return open(p, "r", encoding="utf-8")
+
+
+def read_segments(root: Path | str) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Every (term, payload) written under `root`, one line at a time."""
+    for p in sorted(Path(root).glob("segment-*.jsonl*")):
+        with _open_segment(p) as fp:
+            for line in fp:
+                record = json.loads(line)
+                yield record["term"], record["result"]
+
+
+# index path -> (size and mtime it was read at, term -> (segment, line))
+_INDEXES: dict[Path, tuple[tuple[int, int], dict[str, tuple[str, int]]]] = {}
+
+
+def load_index(root: Path | str) -> dict[str, tuple[str, int]]:
+    """Segment and line of the latest result of every term under `root`.
+
+    Read once, then again only when the index file has changed.
+    """
+    p = Path(root) / INDEX
+    st = p.stat()
+    stamp = (st.st_size, st.st_mtime_ns)
+    cached = _INDEXES.get(p)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    index: dict[str, tuple[str, int]] = {}
+    with open(p, "r", encoding="utf-8") as fp:
+        for line in fp:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                # the last line of a crashed run
+                continue
+            index[entry["term"]] = (entry["segment"], entry["line"])
+    _INDEXES[p] = (stamp, index)
+    return index
+
+
+def find(root: Path | str, term: str) -> dict[str, Any] | None:
+    """Latest payload written for `term`, located through the index."""
+    root = Path(root)
+    where = load_index(root).get(term)
+    if where is None:
+        return None
+    segment, n = where
+    with _open_segment(root / segment) as fp:
+        for i, line in enumerate(fp):
+            if i == n:
+                return json.loads(line)["result"]
+    return None
+
+
+def iter_scrape(
+    cls,
+    words: Iterable[str],
+    dump: SegmentWriter | Path | str | None = None,
+    cache_root: Path | str | None = None,
+    headers: dict[str, str] | None = None,
+    client: Client | None = None,
+) -> Iterator[tuple[str, Any]]:
+    """Yield `(term, result)` for every word that has matches, as they arrive.
+
+    Results are appended to `dump` when given, and cached in `cache_root`
+    instead of `cls.ROOT`, through `client.cache_for` so the configured
+    backend and TTLs apply. Nothing is kept in memory between terms, and no
+    class state is changed.
+    """
+    kind = kind_of(cls)
+    client = client or default_client()
+    writer = SegmentWriter(dump) if isinstance(dump, (str, Path)) else dump
+    fc = client.cache_for(cls, root=cache_root) if cache_root is not None else None
+    try:
+        for w in words:
+            if not w:
+                continue
+            w = quote_term(w)
+
+            r = None
+            if fc is not None:
+                try:
+                    payload = fc.get(w)
+                except CacheError:
+                    payload = None
+                if payload is not None:
+                    if is_empty(payload):
+                        continue
+                    r = reply_from_payload(kind, payload)
+
+            if r is None:
+                try:
+                    r = cls.fetch(w, headers=headers, client=client)
+                except Exception as e:
+                    console.print(
+                        f"[red bold][Error] [white] Failed to request {w}: {str(e)}"
+                    )
+                    continue
+                if not len(r):
+                    if fc is not None:
+                        fc.put_empty(w)
+                    continue
+                if fc is not None:
+                    # shaped as the request classes' `save` writes it
+                    fc.put(w, r.model_dump(mode="json", exclude_unset=True, by_alias=True))
+
+            if writer is not None:
+                writer.write(w, r)
+            yield w, r
+    finally:
+        if writer is not None and writer is not dump:
+            writer.close()
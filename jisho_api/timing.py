@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+# stage -> [calls, total seconds, max seconds]
+_STATS: dict[str, list[float]] = {}
+_LOCK = threading.Lock()
+_ENABLED = False
+
+
+class _Span:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        record(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+def enable() -> None:
+    global _ENABLED
+    _ENABLED = True
+
+
+def disable() -> None:
+    global _ENABLED
+    _ENABLED = False
+
+
+def enabled() -> bool:
+    return _ENABLED
+
+
+def reset() -> None:
+    with _LOCK:
+        _STATS.clear()
+
+
+def span(name: str):
+    """Time a block as stage `name`; a shared no-op when timing is disabled."""
+    if not _ENABLED:
+        return _NO_SPAN
+    return _Span(name)
+
+
+def record(name: str, seconds: float) -> None:
+    if not _ENABLED:
+        return
+    with _LOCK:
+        s = _STATS.get(name)
+        if s is None:
+            _STATS[name] = [1, seconds, seconds]
+        else:
+            s[0] += 1
+            s[1] += seconds
+            s[2] = max(s[2], seconds)
+
+
+def report() -> dict[str, dict[str, Any]]:
+    with _LOCK:
+        return {
+            name: {"calls": int(c), "total": t, "mean": t / c, "max": m}
+            for name, (c, t, m) in sorted(_STATS.items(), key=lambda i: -i[1][1])
+        }
+
+
+def rich_print() -> None:
+    from rich.table import Table
+
+    from jisho_api.cli import console
+
+    table = Table(title="Time per stage")
+    for col in ("Stage", "Calls", "Total (ms)", "Mean (ms)", "Max (ms)"):
+        table.add_column(col, justify="left" if col == "Stage" else "right")
+    for name, s in report().items():
+        table.add_row(
+            name,
+            str(s["calls"]),
+            f"{s['total'] * 1000:.1f}",
+            f"{s['mean'] * 1000:.2f}",
+            f"{s['max'] * 1000:.2f}",
+        )
+    console.print(table)
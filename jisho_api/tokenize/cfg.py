@@ -1,15 +1,26 @@
 from __future__ import annotations
+import threading
+from collections import Counter
 from enum import Enum
 from pydantic import BaseModel
 
+# tags jisho returned that PosTag does not know about, with their counts
+UNKNOWN_POS_TAGS: Counter[str] = Counter()
+# tokens are parsed from several threads at once by batches and the daemon
+_UNKNOWN_LOCK = threading.Lock()
+
 
 class PosTag(Enum):
     adj = "Adjective"
     adv = "Adverb"
+    aux_verb = "Auxiliary verb"
     conj = "Conjunction"
+    counter = "Counter"
     det = "Determiner"
+    expression = "Expression"
     interjection = "Interjection"
     noun = "Noun"
+    numeric = "Numeric"
     particle = "Particle"
     pr_noun = "Proper noun"
     prfx = "Prefix"
@@ -18,11 +29,12 @@ class PosTag(Enum):
     unk = "Unknown"
     verb = "Verb"
 
-    # rather than causing the program to crash, inform the user of the unexpected posTag
+    # rather than causing the program to crash, count the unexpected posTag
     # implementation source: https://stackoverflow.com/questions/44867597/is-there-a-way-to-specify-a-default-value-for-python-enums
     @classmethod
     def _missing_(cls, value: str) -> PosTag:
-        print("Unexpected positional Tag: {}".format(value))
+        with _UNKNOWN_LOCK:
+            UNKNOWN_POS_TAGS[value] += 1
         return cls.unk
 
 
@@ -1,17 +1,19 @@
 from __future__ import annotations
 
-import json
 import urllib.parse
 from pathlib import Path
 from typing import Any, Iterator
 
-import requests
 from pydantic import BaseModel
 from bs4 import BeautifulSoup
 
+from jisho_api import timing
+from jisho_api.cache import CacheError, is_empty
+from jisho_api.client import Client, default_client
 from jisho_api.cli import console
 from jisho_api.tokenize.cfg import TokenConfig
 from jisho_api.util import CLITagger
+from jisho_api.vocab import TOKEN_FIELDS, pack, unpack
 
 
 class RequestMeta(BaseModel):
@@ -40,7 +42,12 @@ class TokenRequest(BaseModel):
 
 class Tokens:
     URL = "https://jisho.org/search/"
+    PATH = "/search/"
     ROOT = Path.home() / ".jisho/data/tokens/"
+    # joins sentences in a batch query, and comes back as a token of its own
+    DELIMITER = "〓"
+    # longest query sent upstream, in characters
+    MAX_QUERY = 200
 
     @staticmethod
     def tokens(soup: BeautifulSoup) -> list[TokenConfig]:
@@ -64,36 +71,187 @@ class Tokens:
         return tks
 
     @staticmethod
-    def request(word, cache=False, headers=None):
-        url = Tokens.URL + urllib.parse.quote(word)
+    def fetch(
+        word: str,
+        headers: dict[str, str] | None = None,
+        client: Client | None = None,
+    ) -> TokenRequest:
+        client = client or default_client()
+        url = client.url(Tokens) + urllib.parse.quote(word)
+        client.count("fetches")
+        r = client.get(url, headers=headers).content
+        with timing.span("tokens.parse"):
+            soup = BeautifulSoup(r, "html.parser")
+        with timing.span("tokens.extract"):
+            data = Tokens.tokens(soup)
+        with timing.span("tokens.validate"):
+            return TokenRequest(
+                meta=RequestMeta(status=200),
+                data=data,
+            )
+
+    @staticmethod
+    def batches(sentences: list[str], max_len: int = MAX_QUERY) -> Iterator[list[str]]:
+        """Group `sentences` so each group joined by `DELIMITER` fits in `max_len`.
+
+        Longer sentences, and ones that contain the delimiter, go alone.
+        """
+        batch: list[str] = []
+        size = 0
+        for s in sentences:
+            if len(s) >= max_len or Tokens.DELIMITER in s:
+                yield [s]
+                continue
+            if batch and size + len(Tokens.DELIMITER) + len(s) > max_len:
+                yield batch
+                batch, size = [], 0
+            size += len(s) + (len(Tokens.DELIMITER) if batch else 0)
+            batch.append(s)
+        if batch:
+            yield batch
+
+    @staticmethod
+    def split(tokens: list[TokenConfig], n: int) -> list[list[TokenConfig]] | None:
+        """Tokens of a batch query per sentence, or None when there are not `n` parts.
+
+        This relies on jisho keeping `DELIMITER`, a symbol no word contains,
+        as a token of its own between the sentences; `test_tokenize.py` checks
+        that against the live site.
+        """
+        parts: list[list[TokenConfig]] = [[]]
+        for t in tokens:
+            if t.token == Tokens.DELIMITER:
+                parts.append([])
+            else:
+                parts[-1].append(t)
+        return parts if len(parts) == n else None
+
+    @staticmethod
+    def fetch_batch(
+        sentences: list[str],
+        headers: dict[str, str] | None = None,
+        client: Client | None = None,
+    ) -> list[TokenRequest]:
+        """Tokenize `sentences` with a single query.
+
+        If the tokens can not be split back into one part per sentence,
+        each sentence is fetched on its own instead.
+        """
+        if len(sentences) == 1:
+            return [Tokens.fetch(sentences[0], headers=headers, client=client)]
+        r = Tokens.fetch(Tokens.DELIMITER.join(sentences), headers=headers, client=client)
+        parts = Tokens.split(r.data, len(sentences))
+        if parts is None:
+            console.print(
+                f"[red bold][Error] [white] Could not split the tokens of {len(sentences)} sentences, "
+                "requesting them one at a time."
+            )
+            return [Tokens.fetch(s, headers=headers, client=client) for s in sentences]
+        return [TokenRequest(meta=r.meta, data=p) for p in parts]
+
+    @staticmethod
+    def request_batch(
+        sentences: list[str],
+        cache: bool = False,
+        headers: dict[str, str] | None = None,
+        client: Client | None = None,
+        max_len: int = MAX_QUERY,
+    ) -> dict[str, TokenRequest | None]:
+        """Tokens of many sentences, packing several into each upstream query.
+
+        Sentences without tokens, or whose batch failed, map to None.
+        """
+        client = client or default_client()
+        fc = client.cache_for(Tokens)
+        res: dict[str, TokenRequest | None] = {}
+        todo = []
+        for s in dict.fromkeys(sentences):
+            r = None
+            if cache:
+                try:
+                    r = fc.get(s)
+                except CacheError as e:
+                    console.print(f"[red bold][Error] [white] {e}")
+                client.count("cache_misses" if r is None else "cache_hits")
+            if r is None:
+                todo.append(s)
+            else:
+                res[s] = None if is_empty(r) else TokenRequest(**unpack(r, TOKEN_FIELDS))
+
+        for batch in Tokens.batches(todo, max_len):
+            try:
+                replies = Tokens.fetch_batch(batch, headers=headers, client=client)
+            except Exception as e:
+                client.record_error(e)
+                console.print(
+                    f"[red bold][Error] [white] Failed to request {len(batch)} sentences: {str(e)}"
+                )
+                res.update(dict.fromkeys(batch))
+                continue
+            for s, r in zip(batch, replies):
+                if not len(r):
+                    res[s] = None
+                    if cache:
+                        fc.put_empty(s)
+                    continue
+                res[s] = r
+                if cache:
+                    Tokens.save(s, r, client=client)
+        return res
+
+    @staticmethod
+    def request(word, cache=False, headers=None, client=None):
+        client = client or default_client()
         toggle = False
 
-        if cache and (Tokens.ROOT / (word + ".json")).exists():
+        r = None
+        if cache:
+            try:
+                r = client.cache_for(Tokens).get(word)
+                client.count("cache_misses" if r is None else "cache_hits")
+            except CacheError as e:
+                console.print(f"[red bold][Error] [white] {e}")
+
+        if r is not None:
+            if is_empty(r):
+                console.print(f"[red bold][Error] [white] No matches found for {word}.")
+                return None
             toggle = True
-            with open(Tokens.ROOT / (word + ".json"), "r", encoding="utf-8") as fp:
-                r = json.load(fp)
-            r = TokenRequest(**r)
+            r = TokenRequest(**unpack(r, TOKEN_FIELDS))
         else:
-            r = requests.get(url, headers=headers).content
-            soup = BeautifulSoup(r, "html.parser")
-
-            r = TokenRequest(
-                meta=RequestMeta(status=200),
-                data=Tokens.tokens(soup),
-            )
+            try:
+                r = Tokens.fetch(word, headers=headers, client=client)
+            except Exception as e:
+                client.record_error(e)
+                console.print(
+                    f"[red bold][Error] [white] Failed to request {word}: {str(e)}"
+                )
+                return None
             if not len(r):
                 console.print(f"[red bold][Error] [white] No matches found for {word}.")
+                if cache:
+                    client.cache_for(Tokens).put_empty(word)
                 return None
         if cache and not toggle:
-            Tokens.save(word, r)
+            Tokens.save(word, r, client=client)
         return r
 
     @staticmethod
-    def save(word: str, r: TokenRequest | dict[str, Any]) -> None:
-        Tokens.ROOT.mkdir(exist_ok=True)
+    def save(
+        word: str,
+        r: TokenRequest | dict[str, Any],
+        packed: bool = False,
+        client: Client | None = None,
+    ) -> None:
+        client = client or default_client()
         try:
-            payload = r if isinstance(r, dict) else r.model_dump(exclude_unset=True, by_alias=True)
-            with open(Tokens.ROOT / f"{word}.json", "w", encoding="utf-8") as fp:
-                json.dump(payload, fp, indent=4, ensure_ascii=False)
+            payload = (
+                r
+                if isinstance(r, dict)
+                else r.model_dump(mode="json", exclude_unset=True, by_alias=True)
+            )
+            if packed:
+                payload = pack(payload, TOKEN_FIELDS)
+            client.cache_for(Tokens).put(word, payload)
         except Exception as e:
             console.print(f"[red bold][Error] [white] Failed to save {word}: {str(e)}")
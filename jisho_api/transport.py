@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import warnings
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from jisho_api import timing
+from jisho_api.config import Config, get_config
+from jisho_api.ratelimit import (
+    RETRY_STATUSES,
+    RateController,
+    parse_retry_after,
+)
+
+
+class Transport:
+    """Pooled HTTP session that goes through a `RateController`.
+
+    Throttled and failed requests are retried with jittered exponential
+    backoff, and the last failure is raised as a `requests` exception.
+    """
+
+    # failures of a request that are retried, like throttled replies
+    ERRORS: tuple[type[Exception], ...] = (requests.RequestException,)
+
+    def __init__(
+        self,
+        rate: RateController | None = None,
+        retries: int = 3,
+        timeout: float = 30.0,
+        pool_size: int = 16,
+    ):
+        self.rate = rate or RateController()
+        self.retries = retries
+        self.timeout = timeout
+        self.session = self._session(pool_size)
+        self._retried = 0
+
+    def _session(self, pool_size: int) -> Any:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def get(self, url: str, headers: dict[str, str] | None = None) -> requests.Response:
+        for attempt in range(self.retries + 1):
+            last = attempt == self.retries
+            with timing.span("ratelimit.wait"):
+                self.rate.acquire()
+            r = None
+            status = retry_after = None
+            try:
+                with timing.span("http"):
+                    r = self.session.get(url, headers=headers, timeout=self.timeout)
+                status = r.status_code
+                retry_after = parse_retry_after(r.headers.get("Retry-After"))
+                # time to the response headers (connect, TLS and server time), the rest is transfer
+                timing.record("http.wait", r.elapsed.total_seconds())
+            except self.ERRORS:
+                if last:
+                    raise
+            finally:
+                # whatever is raised, the slot goes back
+                self.rate.release(status, retry_after)
+            if r is not None and (r.status_code not in RETRY_STATUSES or last):
+                r.raise_for_status()
+                return r
+            # Retry-After is waited out in acquire
+            self._retried += 1
+            time.sleep(self.rate.backoff(attempt))
+
+    def metrics(self) -> dict[str, Any]:
+        return {**self.rate.metrics(), "retries": self._retried}
+
+    def close(self) -> None:
+        self.session.close()
+
+    @classmethod
+    def from_config(cls, config: Config) -> Transport:
+        kwargs = dict(
+            rate=RateController(max_concurrency=config.max_concurrency),
+            retries=config.retries,
+            timeout=config.timeout,
+        )
+        if config.http2:
+            try:
+                return HTTP2Transport(**kwargs)
+            except ImportError as e:
+                warnings.warn(f"{e} Falling back to HTTP/1.1.")
+        return cls(**kwargs)
+
+
+class _LoopSession:
+    """Blocking `get` in front of an `httpx.AsyncClient` on its own event loop.
+
+    httpx's threaded HTTP/2 client can send new streams out of order, which
+    servers treat as a protocol error, so one loop thread owns the connections.
+    """
+
+    def __init__(self, client: Any):
+        self.client = client
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self.loop.run_forever, name="jisho-http2", daemon=True
+        )
+        self._thread.start()
+
+    def get(self, url: str, **kwargs: Any) -> Any:
+        return asyncio.run_coroutine_threadsafe(
+            self.client.get(url, **kwargs), self.loop
+        ).result()
+
+    def close(self) -> None:
+        if self.loop.is_closed():
+            return
+        asyncio.run_coroutine_threadsafe(self.client.aclose(), self.loop).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+
+class HTTP2Transport(Transport):
+    """`Transport` over HTTP/2 with httpx, an optional dependency.
+
+    Concurrent requests to a host are multiplexed as streams over at most
+    `pool_size` connections, instead of taking one connection each. Over
+    TLS, HTTP/2 is negotiated with ALPN and servers without it get
+    HTTP/1.1; plain `http://` URLs need `prior_knowledge`, as most local
+    servers only speak HTTP/1.1 there. Failures raise `httpx` exceptions.
+    """
+
+    def __init__(
+        self,
+        rate: RateController | None = None,
+        retries: int = 3,
+        timeout: float = 30.0,
+        pool_size: int = 2,
+        prior_knowledge: bool = False,
+    ):
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                "The HTTP/2 transport needs httpx: pip install 'jisho_api[http2]'."
+            ) from e
+        self._httpx = httpx
+        self.prior_knowledge = prior_knowledge
+        self.ERRORS = (httpx.HTTPError,)
+        super().__init__(rate=rate, retries=retries, timeout=timeout, pool_size=pool_size)
+
+    def _session(self, pool_size: int) -> Any:
+        limits = self._httpx.Limits(
+            max_connections=pool_size, max_keepalive_connections=pool_size
+        )
+        return _LoopSession(
+            self._httpx.AsyncClient(
+                http1=not self.prior_knowledge,
+                http2=True,
+                limits=limits,
+                timeout=self.timeout,
+            )
+        )
+
+
+_DEFAULT: tuple[Config, Transport] | None = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def default_transport() -> Transport:
+    """The module-wide transport, built on first use from the config in effect."""
+    global _DEFAULT
+    config = get_config()
+    with _DEFAULT_LOCK:
+        if _DEFAULT is None or _DEFAULT[0] is not config:
+            _DEFAULT = (config, Transport.from_config(config))
+        return _DEFAULT[1]
+
+
+def get(url: str, headers: dict[str, str] | None = None) -> requests.Response:
+    return default_transport().get(url, headers=headers)
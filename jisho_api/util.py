@@ -1,3 +1,26 @@
+# CJK unified ideographs, extension A and compatibility ideographs
+_KANJI_RANGES = ((0x4E00, 0x9FFF), (0x3400, 0x4DBF), (0xF900, 0xFAFF))
+
+
+def is_kanji(ch: str) -> bool:
+    cp = ord(ch)
+    return any(lo <= cp <= hi for lo, hi in _KANJI_RANGES)
+
+
+def kanji_in(text: str) -> list[str]:
+    """Unique kanji of `text`, in order of appearance."""
+    return list(dict.fromkeys(ch for ch in text if is_kanji(ch)))
+
+
+def quote_term(w: str) -> str:
+    # name should be between quotes to search specifically for it
+    # with a * it is a wildcard, to see applications of this word at the end
+    strict = "*" not in w
+    if strict:
+        w = f'"{w}"'
+    return w
+
+
 class CLITagger:
     @staticmethod
     def colorize(tag, value, color, last=False):
@@ -15,7 +38,10 @@ class CLITagger:
         return f"[underline]{text}[/underline]"
 
 
-def flatten_recur(dct, rdct={}, separator=".", parent=""):
+def flatten_recur(dct, rdct=None, separator=".", parent=""):
+    # for whole batches of cached results use jisho_api.flatten instead
+    if rdct is None:
+        rdct = {}
     for k, v in dct.items():
         if isinstance(v, list):
             if len(v) > 0 and isinstance(v[0], dict):
@@ -37,7 +63,9 @@ def flatten_recur(dct, rdct={}, separator=".", parent=""):
     return rdct
 
 
-def deflatten_recur(dct, rdct={}, separator="."):
+def deflatten_recur(dct, rdct=None, separator="."):
+    if rdct is None:
+        rdct = {}
     for k, v in dct.items():
         toks = k.split(separator)
         if len(toks) == 1:
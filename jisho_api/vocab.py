@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Iterable
+
+# fields holding a small, heavily repeated vocabulary
+# True marks a coded field, a dict descends into a list of sub-objects
+WORD_FIELDS = {
+    "tags": True,
+    "jlpt": True,
+    "senses": {"parts_of_speech": True, "tags": True},
+}
+TOKEN_FIELDS = {"pos_tag": True}
+
+
+class Vocabulary:
+    """Interning table mapping repeated strings to one shared instance and a stable integer code."""
+
+    def __init__(self, words: Iterable[str] = ()):
+        self._codes: dict[str, int] = {}
+        self._words: list[str] = []
+        self._lock = threading.Lock()
+        for w in words:
+            self.code(w)
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._codes
+
+    def code(self, word: str) -> int:
+        try:
+            return self._codes[word]
+        except KeyError:
+            with self._lock:
+                if word not in self._codes:
+                    self._codes[word] = len(self._words)
+                    self._words.append(word)
+                return self._codes[word]
+
+    def intern(self, word: str) -> str:
+        return self._words[self.code(word)]
+
+    def word(self, code: int) -> str:
+        return self._words[code]
+
+    def words(self) -> list[str]:
+        return list(self._words)
+
+
+VOCAB = Vocabulary()
+
+
+def intern_list(values: list[str | None]) -> list[str | None]:
+    return [VOCAB.intern(v) if isinstance(v, str) else v for v in values]
+
+
+def _encode(d: dict[str, Any], spec: dict, table: Vocabulary) -> dict[str, Any]:
+    d = dict(d)
+    for k, sub in spec.items():
+        v = d.get(k)
+        if v is None:
+            continue
+        if sub is True:
+            if isinstance(v, list):
+                d[k] = [table.code(x) if isinstance(x, str) else x for x in v]
+            else:
+                d[k] = table.code(v)
+        else:
+            d[k] = [_encode(x, sub, table) for x in v]
+    return d
+
+
+def _decode(d: dict[str, Any], spec: dict, words: list[str]) -> dict[str, Any]:
+    d = dict(d)
+    for k, sub in spec.items():
+        v = d.get(k)
+        if v is None:
+            continue
+        if sub is True:
+            if isinstance(v, list):
+                d[k] = [VOCAB.intern(words[x]) if isinstance(x, int) else x for x in v]
+            else:
+                d[k] = VOCAB.intern(words[v])
+        else:
+            d[k] = [_decode(x, sub, words) for x in v]
+    return d
+
+
+def is_packed(payload: dict[str, Any]) -> bool:
+    return "vocab" in payload
+
+
+def pack(payload: dict[str, Any], fields: dict) -> dict[str, Any]:
+    """Integer-code the vocabulary fields of a request payload.
+
+    The table is stored alongside the data, so a packed file decodes on its own.
+    """
+    table = Vocabulary()
+    data = [_encode(d, fields, table) for d in payload["data"]]
+    return {**payload, "vocab": table.words(), "data": data}
+
+
+def unpack(payload: dict[str, Any], fields: dict) -> dict[str, Any]:
+    if not is_packed(payload):
+        return payload
+    payload = dict(payload)
+    words = payload.pop("vocab")
+    payload["data"] = [_decode(d, fields, words) for d in payload["data"]]
+    return payload
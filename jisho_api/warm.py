@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable
+
+from pydantic import BaseModel
+
+from jisho_api.client import Client, default_client
+from jisho_api.kinds import KINDS, request_class
+from jisho_api.util import kanji_in
+
+
+class PrefetchPlan:
+    """Weighted set of (kind, term) lookups to pull into the cache.
+
+    Weights are expected request frequencies; terms from plain lists get
+    `weight` each, terms from an access log get their number of hits.
+    """
+
+    def __init__(self):
+        self.weights: Counter[tuple[str, str]] = Counter()
+
+    def __len__(self) -> int:
+        return len(self.weights)
+
+    def add(self, kind: str, term: str, weight: float = 1.0) -> None:
+        if kind not in KINDS:
+            raise ValueError(f"Unknown kind {kind!r}, expected one of {', '.join(KINDS)}")
+        term = term.strip()
+        if term:
+            self.weights[(kind, term)] += weight
+
+    def add_list(self, kind: str, terms: Iterable[str], weight: float = 1.0) -> None:
+        for t in terms:
+            self.add(kind, t, weight)
+
+    def add_kanji(self, text: str, weight: float = 1.0) -> None:
+        """Every kanji of `text`, e.g. a grade or JLPT kanji set."""
+        self.add_list("kanji", kanji_in(text), weight)
+
+    def add_file(self, kind: str, path: Path | str, weight: float = 1.0) -> None:
+        with open(path, "r", encoding="utf-8") as fp:
+            txt = fp.read()
+        if kind == "kanji":
+            self.add_kanji(txt, weight)
+        else:
+            self.add_list(kind, txt.split("\n"), weight)
+
+    def add_access_log(self, path: Path | str) -> None:
+        """Lines of `<kind>\\t<term>`, as written by `jisho serve --access-log`."""
+        with open(path, "r", encoding="utf-8") as fp:
+            for line in fp:
+                kind, _, term = line.rstrip("\n").partition("\t")
+                if kind in KINDS:
+                    self.add(kind, term)
+
+    def ordered(self) -> list[tuple[str, str, float]]:
+        # most requested first, ties keep insertion order
+        return [(k, t, w) for (k, t), w in self.weights.most_common()]
+
+
+class WarmReport(BaseModel):
+    planned: int
+    already_cached: int
+    fetched: int
+    empty: int
+    failed: int
+    coverage: float
+    estimated_hit_rate: float
+
+
+def _cached(client: Client, kind: str, term: str) -> bool:
+    fc = client.cache_for(request_class(kind))
+    return fc.status(term) in (fc.HIT, fc.EMPTY)
+
+
+def warm(
+    plan: PrefetchPlan,
+    workers: int = 4,
+    advance: Callable[[], None] | None = None,
+    client: Client | None = None,
+) -> WarmReport:
+    """Fill the disk caches with `plan`, most requested first.
+
+    Requests go through the shared rate controller, so `workers` only caps
+    how many lookups may be waiting on it at once.
+    """
+    client = client or default_client()
+    items = plan.ordered()
+    todo = []
+    already = 0
+    for kind, term, _ in items:
+        if _cached(client, kind, term):
+            already += 1
+            if advance:
+                advance()
+        else:
+            todo.append((kind, term))
+
+    def fetch(item: tuple[str, str]) -> bool:
+        kind, term = item
+        try:
+            return client.request(kind, term, cache=True) is not None
+        finally:
+            if advance:
+                advance()
+
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        results = list(ex.map(fetch, todo))
+
+    cached = {(kind, term): _cached(client, kind, term) for kind, term, _ in items}
+    total = sum(w for _, _, w in items)
+    hit = sum(w for kind, term, w in items if cached[(kind, term)])
+    return WarmReport(
+        planned=len(items),
+        already_cached=already,
+        fetched=sum(results),
+        empty=sum(1 for item, ok in zip(todo, results) if not ok and cached[item]),
+        failed=sum(1 for item, ok in zip(todo, results) if not ok and not cached[item]),
+        coverage=sum(cached.values()) / len(items) if items else 1.0,
+        estimated_hit_rate=hit / total if total else 1.0,
+    )
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from typing import Iterator
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl, field_validator
+
+from jisho_api.vocab import intern_list
 
 
 class Sense(BaseModel):
@@ -23,6 +25,11 @@ class Sense(BaseModel):
     source: list[Source] = Field(default_factory=list)
     info: list[str] = Field(default_factory=list)
 
+    @field_validator("parts_of_speech", "tags")
+    @classmethod
+    def _intern(cls, v: list[str | None]) -> list[str | None]:
+        return intern_list(v)
+
 
 class Japanese(BaseModel):
     # Japanese Word - full fledged kanji
@@ -47,5 +54,10 @@ class WordConfig(BaseModel):
     japanese: list[Japanese] = Field(default_factory=list)
     senses: list[Sense] = Field(default_factory=list)
 
+    @field_validator("tags", "jlpt")
+    @classmethod
+    def _intern(cls, v: list[str]) -> list[str]:
+        return intern_list(v)
+
     def __iter__(self) -> Iterator[Sense]:
         yield from self.senses
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+from typing import Any, Iterable, Iterator, NamedTuple
+
+from jisho_api.vocab import VOCAB, WORD_FIELDS, unpack
+from jisho_api.word.cfg import Japanese, Sense, WordConfig
+
+
+def _interned(values: Iterable[Any] | None) -> tuple:
+    # repeated vocabulary (tags, parts of speech, jlpt levels) shares one object
+    if not values:
+        return ()
+    return tuple(VOCAB.intern(v) if isinstance(v, str) else v for v in values)
+
+
+class CompactJapanese(NamedTuple):
+    word: str | None
+    reading: str | None
+
+    @property
+    def name(self):
+        if self.word:
+            return self.word
+        return self.reading
+
+    def promote(self) -> Japanese:
+        return Japanese(word=self.word, reading=self.reading)
+
+
+class CompactSense:
+    """Tuple-backed, read-only view of a `Sense`."""
+
+    __slots__ = (
+        "english_definitions",
+        "parts_of_speech",
+        "links",
+        "tags",
+        "restrictions",
+        "see_also",
+        "antonyms",
+        "source",
+        "info",
+    )
+
+    def __init__(self, d: dict[str, Any]):
+        self.english_definitions = tuple(d.get("english_definitions") or ())
+        self.parts_of_speech = _interned(d.get("parts_of_speech"))
+        # links and sources are kept as plain (text, url) and language tuples
+        self.links = tuple(
+            (VOCAB.intern(link["text"]), link["url"]) for link in d.get("links") or ()
+        )
+        self.tags = _interned(d.get("tags"))
+        self.restrictions = tuple(d.get("restrictions") or ())
+        self.see_also = tuple(d.get("see_also") or ())
+        self.antonyms = tuple(d.get("antonyms") or ())
+        self.source = _interned(s["language"] for s in d.get("source") or ())
+        self.info = tuple(d.get("info") or ())
+
+    def __setattr__(self, name, value):
+        if hasattr(self, name):
+            raise AttributeError(f"{type(self).__name__} is read-only")
+        object.__setattr__(self, name, value)
+
+    def promote(self) -> Sense:
+        return Sense(
+            english_definitions=list(self.english_definitions),
+            parts_of_speech=list(self.parts_of_speech),
+            links=[{"text": t, "url": u} for t, u in self.links],
+            tags=list(self.tags),
+            restrictions=list(self.restrictions),
+            see_also=list(self.see_also),
+            antonyms=list(self.antonyms),
+            source=[{"language": s} for s in self.source],
+            info=list(self.info),
+        )
+
+
+class CompactWord:
+    """Tuple-backed, read-only view of a `WordConfig`.
+
+    The full pydantic model is only built when `promote` is called or an
+    attribute only the model has is read, and then kept around for later
+    calls.
+    """
+
+    __slots__ = ("slug", "is_common", "tags", "jlpt", "japanese", "senses", "_model")
+
+    def __init__(self, d: dict[str, Any]):
+        object.__setattr__(self, "slug", d["slug"])
+        object.__setattr__(self, "is_common", d.get("is_common"))
+        object.__setattr__(self, "tags", _interned(d.get("tags")))
+        object.__setattr__(self, "jlpt", _interned(d.get("jlpt")))
+        object.__setattr__(
+            self,
+            "japanese",
+            tuple(
+                CompactJapanese(j.get("word"), j.get("reading"))
+                for j in d.get("japanese") or ()
+            ),
+        )
+        object.__setattr__(
+            self, "senses", tuple(CompactSense(s) for s in d.get("senses") or ())
+        )
+        object.__setattr__(self, "_model", None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __getattr__(self, name):
+        # only called for what the view does not have, e.g. `model_dump`
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.promote(), name)
+
+    def __iter__(self) -> Iterator[CompactSense]:
+        yield from self.senses
+
+    @classmethod
+    def from_config(cls, cfg: WordConfig) -> CompactWord:
+        return cls(cfg.model_dump(mode="json"))
+
+    def promote(self) -> WordConfig:
+        if self._model is None:
+            model = WordConfig(
+                slug=self.slug,
+                is_common=self.is_common,
+                tags=list(self.tags),
+                jlpt=list(self.jlpt),
+                japanese=[j.promote() for j in self.japanese],
+                senses=[s.promote() for s in self.senses],
+            )
+            object.__setattr__(self, "_model", model)
+        return self._model
+
+
+class CompactWordRequest:
+    """Read-only view of a `WordRequest` built from `CompactWord` entries.
+
+    Iteration order matches `WordRequest.__iter__`. Reading an attribute
+    only the full model has, such as `meta` or `rich_print`, promotes it
+    once and answers from the `WordRequest`.
+    """
+
+    __slots__ = ("status", "data", "_model")
+
+    def __init__(self, status: int, data: Iterable[CompactWord]):
+        object.__setattr__(self, "status", status)
+        object.__setattr__(self, "data", tuple(data))
+        object.__setattr__(self, "_model", None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.promote(), name)
+
+    def __iter__(self) -> Iterator[CompactWord]:
+        yield from reversed(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> CompactWordRequest:
+        # skips pydantic entirely, which is where most of the memory goes
+        payload = unpack(payload, WORD_FIELDS)
+        return cls(
+            payload["meta"]["status"], (CompactWord(d) for d in payload["data"])
+        )
+
+    @classmethod
+    def from_request(cls, r) -> CompactWordRequest:
+        return cls.from_dict(r.model_dump(mode="json"))
+
+    def promote(self):
+        from jisho_api.word.request import RequestMeta, WordRequest
+
+        if self._model is None:
+            model = WordRequest(
+                meta=RequestMeta(status=self.status),
+                data=[w.promote() for w in self.data],
+            )
+            object.__setattr__(self, "_model", model)
+        return self._model
@@ -1,15 +1,17 @@
 from __future__ import annotations
-import json
 import urllib.parse
 from pathlib import Path
 from typing import Any, Iterator
 
-import requests
-from pydantic import BaseModel
-from rich.markdown import Markdown
+from pydantic import BaseModel, ValidationError
 
-from jisho_api.cli import console
+from jisho_api import timing
+from jisho_api.cache import CacheError, is_empty
+from jisho_api.client import Client, default_client
+from jisho_api.cli import RULE, console
+from jisho_api.vocab import WORD_FIELDS, pack, unpack
 from jisho_api.word.cfg import WordConfig
+from jisho_api.word.compact import CompactWordRequest
 
 
 class RequestMeta(BaseModel):
@@ -26,61 +28,114 @@ class WordRequest(BaseModel):
     def __len__(self) -> int:
         return len(self.data)
 
-    def rich_print(self) -> None:
-        for wdef in self:
-            j = wdef.japanese[0]
+    def compact(self) -> CompactWordRequest:
+        return CompactWordRequest.from_request(self)
+
+    @staticmethod
+    def markup(wdef: WordConfig) -> str:
+        """Rich markup of one entry, its forms on the first line and a line per sense."""
+        forms = []
+        for i, j in enumerate(wdef.japanese):
+            color = "green" if i == 0 else "purple"
             if j.word:
-                base = f"[green]{j.word}"
+                form = f"[{color}]{j.word}"
                 if j.reading is not None:
-                    base += f" [red]([white]{j.reading}[red])"
+                    form += f" [red]([white]{j.reading}[red])"
             else:
-                base = f"[green]{j.reading}"
-
-            # TODO - really funky here
-            if len(wdef.japanese) > 1:
-                for j in wdef.japanese[1:]:
-                    if j.word:
-                        base += f", [purple]{j.word}"
-                        if j.reading is not None:
-                            base += f" [red]([white]{j.reading}[red])"
-                    else:
-                        base += f", [purple]{j.reading}"
+                form = f"[{color}]{j.reading}"
+            forms.append(form)
+        lines = [", ".join(forms)]
+        if len(wdef.jlpt):
+            lines[0] += f" [blue][JLPT: {', '.join(wdef.jlpt)}]"
 
-            if len(wdef.jlpt):
-                base += f" [blue][JLPT: {', '.join(wdef.jlpt)}]"
-            console.print(base)
+        for i, s in enumerate(wdef):
+            base = f"[yellow]{i + 1}. [white]{', '.join(s.english_definitions)}"
+            base += "".join([f", ([magenta]{t}[white])" for t in s.tags])
+            lines.append(base)
+        return "\n".join(lines)
 
-            for i, s in enumerate(wdef):
-                base = f"[yellow]{i + 1}. [white]{', '.join(s.english_definitions)}"
-                base += "".join([f", ([magenta]{t}[white])" for t in s.tags])
-                console.print(base)
-            console.print(Markdown("---"))
+    def rich_print(self, reverse: bool = True) -> None:
+        """Print every entry, the best match last unless `reverse` is False."""
+        for wdef in self if reverse else self.data:
+            console.print(self.markup(wdef))
+            console.print(RULE)
 
 
 class Word:
     URL = "https://jisho.org/api/v1/search/words?keyword="
+    PATH = "/api/v1/search/words?keyword="
     ROOT = Path.home() / ".jisho/data/word"
+    # entries per page of the search API
+    PAGE_SIZE = 20
+
+    @staticmethod
+    def fetch(
+        word: str,
+        headers: dict[str, str] | None = None,
+        client: Client | None = None,
+        page: int | None = None,
+    ) -> WordRequest:
+        client = client or default_client()
+        url = client.url(Word) + urllib.parse.quote(word)
+        if page is not None:
+            url += f"&page={page}"
+        client.count("fetches")
+        r = client.get(url, headers=headers)
+        with timing.span("word.parse"):
+            r = r.json()
+        with timing.span("word.validate"):
+            return WordRequest(**r)
+
+    @staticmethod
+    def pages(
+        word: str,
+        max_pages: int | None = None,
+        headers: dict[str, str] | None = None,
+        client: Client | None = None,
+    ) -> Iterator[WordRequest]:
+        """Result pages of `word`, each requested only when the previous one was consumed."""
+        page = 1
+        while max_pages is None or page <= max_pages:
+            try:
+                r = Word.fetch(word, headers=headers, client=client, page=page)
+            except Exception as e:
+                console.print(
+                    f"[red bold][Error] [white] Failed to request {word} page {page}: {str(e)}"
+                )
+                return
+            if not len(r):
+                return
+            yield r
+            if len(r) < Word.PAGE_SIZE:
+                return
+            page += 1
 
     @staticmethod
     def request(
-        word: str, cache: bool = False, headers: dict[str, str] | None = None
+        word: str,
+        cache: bool = False,
+        headers: dict[str, str] | None = None,
+        client: Client | None = None,
     ) -> WordRequest | None:
-        url = Word.URL + urllib.parse.quote(word)
+        client = client or default_client()
         toggle = False
 
-        if cache and (Word.ROOT / (word + ".json")).exists():
+        if cache:
             try:
-                with open(Word.ROOT / (word + ".json"), "r", encoding="utf-8") as fp:
-                    content = fp.read()
-                    if not content:  # Check if the file is empty
+                r = client.cache_for(Word).get(word)
+                client.count("cache_misses" if r is None else "cache_hits")
+                if r is not None:
+                    if is_empty(r):
                         console.print(
-                            f"[red bold][Error] [white] Cached file is empty for {word}."
+                            f"[red bold][Error] [white] No matches found for {word}."
                         )
-                        toggle = False  # Force a new request
-                    else:
-                        r = json.loads(content)  # Use loads instead of load
-                        toggle = True
-            except json.JSONDecodeError:
+                        return None
+                    r = WordRequest(**unpack(r, WORD_FIELDS))
+                    toggle = True
+            except CacheError as e:
+                console.print(f"[red bold][Error] [white] {e}")
+                toggle = False  # Force a new request
+            except ValidationError:
                 console.print(
                     f"[red bold][Error] [white] Cached file is corrupted for {word}."
                 )
@@ -88,18 +143,20 @@ class Word:
 
         if not toggle:
             try:
-                r = requests.get(url, headers=headers).json()
-                r = WordRequest(**r)
+                r = Word.fetch(word, headers=headers, client=client)
                 if not len(r):
                     console.print(
                         f"[red bold][Error] [white] No matches found for {word}."
                     )
+                    if cache:
+                        client.cache_for(Word).put_empty(word)
                     return None
 
                 if cache:
                     # Save the result to cache
-                    Word.save(word, r)
+                    Word.save(word, r, client=client)
             except Exception as e:
+                client.record_error(e)
                 console.print(
                     f"[red bold][Error] [white] Failed to request {word}: {str(e)}"
                 )
@@ -108,11 +165,21 @@ class Word:
         return r
 
     @staticmethod
-    def save(word: str, r: WordRequest | dict[str, Any]) -> None:
-        Word.ROOT.mkdir(exist_ok=True)
+    def save(
+        word: str,
+        r: WordRequest | dict[str, Any],
+        packed: bool = False,
+        client: Client | None = None,
+    ) -> None:
+        client = client or default_client()
         try:
-            payload = r if isinstance(r, dict) else r.model_dump(exclude_unset=True, by_alias=True)
-            with open(Word.ROOT / f"{word}.json", "w", encoding="utf-8") as fp:
-                json.dump(payload, fp, indent=4, ensure_ascii=False)
+            payload = (
+                r
+                if isinstance(r, dict)
+                else r.model_dump(mode="json", exclude_unset=True, by_alias=True)
+            )
+            if packed:
+                payload = pack(payload, WORD_FIELDS)
+            client.cache_for(Word).put(word, payload)
         except Exception as e:
             console.print(f"[red bold][Error] [white] Failed to save {word}: {str(e)}")
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Iterable
+
+from jisho_api.cache import CacheError, FileCache, is_empty
+from jisho_api.vocab import WORD_FIELDS, unpack
+
+
+class WordIndex:
+    """Strings taken from cached word entries, mapped to the cache keys they came from.
+
+    Subclasses pick the strings in `keys_of`. `update` only reads the
+    cache files written since the last one and drops the keys that are
+    gone, and `save`/`load` keep the index between runs, so a lookup does
+    not read and validate the whole cache.
+    """
+
+    def __init__(self):
+        self._keys: dict[str, dict[str, None]] = {}
+        # cache key -> the strings indexed for it, [] for empty or unreadable files
+        self._by_term: dict[str, list[str]] = {}
+        self.synced = 0.0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def keys_of(self, wr) -> Iterable[str]:
+        raise NotImplementedError
+
+    def _new_key(self, key: str) -> None:
+        pass
+
+    def _drop_key(self, key: str) -> None:
+        pass
+
+    def add(self, term: str, wr) -> None:
+        """Index the entries of `wr`, cached under `term`."""
+        self.remove(term)
+        keys = list(dict.fromkeys(self.keys_of(wr)))
+        for key in keys:
+            terms = self._keys.get(key)
+            if terms is None:
+                terms = self._keys[key] = {}
+                self._new_key(key)
+            terms[term] = None
+        self._by_term[term] = keys
+
+    def remove(self, term: str) -> None:
+        for key in self._by_term.pop(term, ()):
+            terms = self._keys[key]
+            terms.pop(term, None)
+            if not terms:
+                del self._keys[key]
+                self._drop_key(key)
+
+    def update(self, fc: FileCache) -> int:
+        """Index the words cached or rewritten since the last update; returns how many changed."""
+        from jisho_api.word.request import WordRequest
+
+        started = time.time()
+        cached = fc.keys()
+        gone = self._by_term.keys() - set(cached)
+        for term in gone:
+            self.remove(term)
+        changed = len(gone)
+        for term in cached:
+            try:
+                if term in self._by_term and fc.path(term).stat().st_mtime <= self.synced:
+                    continue
+                payload = fc.read(term)
+                if payload is None or is_empty(payload):
+                    wr = None
+                else:
+                    wr = WordRequest(**unpack(payload, WORD_FIELDS))
+            except (OSError, CacheError, ValueError):
+                wr = None
+            if wr is None:
+                self.remove(term)
+                self._by_term[term] = []
+            else:
+                self.add(term, wr)
+            changed += 1
+        self.synced = started
+        return changed
+
+    @classmethod
+    def from_cache(cls, fc: FileCache):
+        index = cls()
+        index.update(fc)
+        return index
+
+    def _dump(self, data: dict[str, Any]) -> None:
+        pass
+
+    def _restore(self, data: dict[str, Any]) -> None:
+        pass
+
+    def save(self, path: Path | str) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"synced": self.synced, "terms": self._by_term}
+        self._dump(data)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as fp:
+            json.dump(data, fp, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path | str):
+        """The index saved at `path`, or an empty one when there is none or it is unreadable."""
+        index = cls()
+        try:
+            with open(path, "r", encoding="utf-8") as fp:
+                data = json.load(fp)
+        except (OSError, ValueError):
+            return index
+        index.synced = data["synced"]
+        for term, keys in data["terms"].items():
+            index._by_term[term] = keys
+            for key in keys:
+                index._keys.setdefault(key, {})[term] = None
+        index._restore(data)
+        return index
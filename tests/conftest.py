@@ -0,0 +1,76 @@
+import pytest
+
+
+class FakeResponse:
+    def __init__(self, payload=None, content=b""):
+        self.payload = payload
+        self.content = content
+
+    def json(self):
+        return self.payload
+
+
+class FakeTransport:
+    """Stands in for `Transport`, answering every URL without the network.
+
+    `reply` is a JSON payload, page bytes, or a callable of the URL
+    returning either one, or raising for a failed request.
+    """
+
+    def __init__(self, reply):
+        self.reply = reply
+        self.urls = []
+
+    def get(self, url, headers=None):
+        self.urls.append(url)
+        reply = self.reply(url) if callable(self.reply) else self.reply
+        if isinstance(reply, bytes):
+            return FakeResponse(content=reply)
+        return FakeResponse(reply)
+
+    def metrics(self):
+        return {"requests": len(self.urls)}
+
+    def close(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def isolated_config(tmp_path_factory, monkeypatch):
+    """Keep the developer's ~/.jisho/config.json and `JISHO_*` variables out of every test."""
+    import os
+
+    from jisho_api.config import ENV_PREFIX, reload_config
+
+    path = tmp_path_factory.mktemp("config") / "config.json"
+
+    def isolate():
+        for name in list(os.environ):
+            if name.startswith(ENV_PREFIX):
+                monkeypatch.delenv(name)
+        monkeypatch.setenv(ENV_PREFIX + "CONFIG", str(path))
+        reload_config()
+
+    isolate()
+    yield
+    # whatever the test configured does not outlive it
+    isolate()
+
+
+@pytest.fixture
+def fake_transport():
+    """`FakeTransport`, to give each client of a test its own."""
+    return FakeTransport
+
+
+@pytest.fixture
+def fake_default_transport(monkeypatch):
+    """Make the default transport answer with `FakeTransport(reply)`, and return the fake."""
+    from jisho_api import transport
+
+    def install(reply):
+        fake = FakeTransport(reply)
+        monkeypatch.setattr(transport.default_transport(), "get", fake.get)
+        return fake
+
+    return install
@@ -0,0 +1,48 @@
+import json
+import os
+import time
+from pathlib import Path
+
+FIXTURES = Path(__file__).parents[1] / "jisho_api" / "fixtures"
+
+
+def test_negative_cache(tmp_path, monkeypatch, fake_default_transport):
+    from jisho_api.cache import FileCache
+    from jisho_api.word.request import Word
+
+    monkeypatch.setattr(Word, "ROOT", tmp_path)
+    calls = fake_default_transport({"meta": {"status": 200}, "data": []}).urls
+
+    fc = FileCache(tmp_path)
+    assert fc.status("nothing") == fc.MISS
+    assert Word.request("nothing", cache=True) is None
+    assert fc.status("nothing") == fc.EMPTY
+    assert Word.request("nothing", cache=True) is None
+    assert len(calls) == 1
+    assert fc.stats()["empty"] == 1
+
+    # negative entries expire sooner than results
+    old = time.time() - 2 * 24 * 60 * 60
+    os.utime(fc.path("nothing"), (old, old))
+    assert fc.status("nothing") == fc.EXPIRED
+    Word.request("nothing", cache=True)
+    assert len(calls) == 2
+
+
+def test_cache_hit_and_corruption(tmp_path, monkeypatch, fake_default_transport):
+    from jisho_api.cache import FileCache
+    from jisho_api.word.request import Word
+
+    with open(FIXTURES / "word.json", "r", encoding="utf-8") as fp:
+        payload = json.load(fp)
+    monkeypatch.setattr(Word, "ROOT", tmp_path)
+    fake_default_transport(payload)
+
+    fc = FileCache(tmp_path)
+    fc.path("water").parent.mkdir(parents=True, exist_ok=True)
+    fc.path("water").write_text("{not json", encoding="utf-8")
+    assert fc.stats()["corrupted"] == 1
+
+    r = Word.request("water", cache=True)
+    assert len(r) == 3
+    assert fc.status("water") == fc.HIT
@@ -0,0 +1,106 @@
+import json
+from pathlib import Path
+
+FIXTURES = Path(__file__).parents[1] / "jisho_api" / "fixtures"
+
+
+def test_pages_rejects_cache_and_daemon():
+    from click.testing import CliRunner
+
+    from jisho_api.cli import request_word
+
+    for flag in ("--cache", "--daemon", "--reading"):
+        result = CliRunner().invoke(request_word, ["water", "--pages", "2", flag])
+        assert result.exit_code == 2
+        assert "--pages can not be combined" in result.output
+
+
+def test_pages_keep_the_order_of_one_page(monkeypatch):
+    from click.testing import CliRunner
+
+    from jisho_api.cli import request_word
+    from jisho_api.word.request import Word, WordRequest
+
+    with open(FIXTURES / "word.json", "r", encoding="utf-8") as fp:
+        payload = json.load(fp)
+    slugs = [d["slug"] for d in payload["data"]]
+
+    monkeypatch.setattr(Word, "request", lambda word, cache=False: WordRequest(**payload))
+    monkeypatch.setattr(Word, "pages", lambda word, max_pages=None: iter([WordRequest(**payload)]))
+
+    outputs = []
+    for args in (["water"], ["water", "--pages", "0"]):
+        result = CliRunner().invoke(request_word, args + ["--format", "jsonl"])
+        outputs.append([json.loads(line)["slug"] for line in result.output.splitlines()])
+    assert outputs == [slugs, slugs]
+
+
+def test_rich_pages_print_as_they_arrive(monkeypatch, fake_default_transport):
+    import time
+
+    from jisho_api.cli import _stream_pages
+    from jisho_api.word.request import Word, WordRequest
+
+    with open(FIXTURES / "word.json", "r", encoding="utf-8") as fp:
+        payload = json.load(fp)
+    events = []
+
+    def reply(url):
+        time.sleep(0.05)
+        events.append(("fetch", int(url.rsplit("&page=", 1)[1])))
+        return payload
+
+    def rich_print(self, reverse=True):
+        events.append(("print", [w.slug for w in (self if reverse else self.data)]))
+
+    fake_default_transport(reply)
+    # every page is full, so the next one is requested
+    monkeypatch.setattr(Word, "PAGE_SIZE", len(payload["data"]))
+    monkeypatch.setattr(WordRequest, "rich_print", rich_print)
+
+    assert _stream_pages("water*", 3, "rich")
+    slugs = [d["slug"] for d in payload["data"]]
+    assert events == [
+        ("fetch", 1),
+        ("print", slugs),
+        ("fetch", 2),
+        ("print", slugs),
+        ("fetch", 3),
+        ("print", slugs),
+    ]
+
+
+def test_suggestions_come_before_the_search(tmp_path, monkeypatch, fake_default_transport):
+    from click.testing import CliRunner
+
+    from jisho_api.cli import request_word
+    from jisho_api.word.request import Word
+
+    with open(FIXTURES / "word.json", "r", encoding="utf-8") as fp:
+        payload = json.load(fp)
+    monkeypatch.setattr(Word, "ROOT", tmp_path / "word")
+    Word.save("water", payload)
+    events = []
+
+    def reply(url):
+        events.append("fetch")
+        return {"meta": {"status": 200}, "data": []}
+
+    fake_default_transport(reply)
+    monkeypatch.setattr(
+        "jisho_api.cli.console.print", lambda *a, **k: events.append(str(a[0]))
+    )
+
+    CliRunner().invoke(request_word, ["watr", "--suggest"])
+    assert events[0] == "[yellow]Did you mean:" and events[-1] != events[0]
+    assert events.index("fetch") > 0
+
+    events.clear()
+    CliRunner().invoke(request_word, ["watr", "--offline"])
+    assert "fetch" not in events and events[0] == "[yellow]Did you mean:"
+
+    # an exact cached definition is answered from the cache
+    events.clear()
+    result = CliRunner().invoke(request_word, ["cold water", "--offline", "--format", "jsonl"])
+    assert "fetch" not in events
+    assert [json.loads(line)["slug"] for line in result.output.splitlines()][0] == "水"
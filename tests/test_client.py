@@ -0,0 +1,30 @@
+import json
+from pathlib import Path
+
+FIXTURES = Path(__file__).parents[1] / "jisho_api" / "fixtures"
+
+
+def test_clients_do_not_share_state(tmp_path, fake_transport):
+    from jisho_api.client import Client
+    from jisho_api.word.request import Word
+
+    with open(FIXTURES / "word.json", "r", encoding="utf-8") as fp:
+        payload = json.load(fp)
+    empty = {"meta": {"status": 200}, "data": []}
+
+    a = Client(base_url="http://a.test/", root=tmp_path / "a", transport=fake_transport(payload))
+    b = Client(base_url="http://b.test", root=tmp_path / "b", transport=fake_transport(empty))
+
+    assert len(Word.request("水", cache=True, client=a)) == 3
+    assert Word.request("水", cache=True, client=b) is None
+    assert a.transport.urls == ["http://a.test/api/v1/search/words?keyword=%E6%B0%B4"]
+    assert b.transport.urls[0].startswith("http://b.test/api/")
+
+    assert a.cache_for(Word).status("水") == "hit"
+    assert b.cache_for(Word).status("水") == "empty"
+    assert (tmp_path / "a" / "word" / "水.json").exists()
+
+    assert len(a.word("水", cache=True)) == 3
+    m = a.metrics()
+    assert (m["cache_hits"], m["cache_misses"], m["fetches"]) == (1, 1, 1)
+    assert m["transport"] == {"requests": 1}
@@ -0,0 +1,66 @@
+import json
+from pathlib import Path
+
+FIXTURES = Path(__file__).parents[1] / "jisho_api" / "fixtures"
+
+
+def _load():
+    with open(FIXTURES / "word.json", "r", encoding="utf-8") as fp:
+        return json.load(fp)
+
+
+def test_compact_roundtrip():
+    from jisho_api.word.request import WordRequest
+
+    wr = WordRequest(**_load())
+    c = wr.compact()
+
+    assert len(c) == len(wr)
+    assert [w.slug for w in c] == [w.slug for w in wr]
+    for cw, w in zip(c, wr):
+        assert [s.english_definitions for s in cw] == [
+            tuple(s.english_definitions) for s in w
+        ]
+    assert c.promote() == wr
+
+
+def test_compact_interning():
+    from jisho_api.word.compact import CompactWordRequest
+
+    a = CompactWordRequest.from_dict(_load())
+    b = CompactWordRequest.from_dict(_load())
+    assert a.data[0].senses[0].parts_of_speech[0] is b.data[1].senses[0].parts_of_speech[0]
+
+
+def test_compact_read_only():
+    import pytest
+
+    from jisho_api.word.compact import CompactWordRequest
+
+    w = CompactWordRequest.from_dict(_load()).data[0]
+    with pytest.raises(AttributeError):
+        w.slug = "x"
+    with pytest.raises(AttributeError):
+        w.senses[0].tags = ()
+    assert w.promote() is w.promote()
+
+
+def test_compact_request_read_only_and_lazy():
+    import pytest
+
+    from jisho_api.word.compact import CompactWordRequest
+
+    c = CompactWordRequest.from_dict(_load())
+    with pytest.raises(AttributeError):
+        c.data = ()
+    with pytest.raises(AttributeError):
+        c.status = 500
+    assert c._model is None
+
+    # attributes only the full model has promote it, once
+    assert c.meta.status == 200
+    assert c.promote() is c.promote()
+    assert c.model_dump(mode="json")["data"][0]["slug"] == "水"
+    assert c.data[0].model_dump()["slug"] == "水"
+    with pytest.raises(AttributeError):
+        c.nothing
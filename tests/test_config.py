@@ -0,0 +1,94 @@
+import json
+
+import pytest
+
+
+def test_load_config_with_env_overrides(tmp_path):
+    from jisho_api.config import load_config
+
+    p = tmp_path / "config.json"
+    with open(p, "w") as fp:
+        json.dump({"cache": True, "workers": 2, "kinds": {"word": {"ttl": 60}}}, fp)
+
+    cfg = load_config(p, environ={})
+    assert cfg.cache and cfg.workers == 2
+    assert cfg.kind("word").ttl == 60
+    assert cfg.kind("kanji").cache is True
+    assert cfg.kind("kanji").concurrency == 2
+
+    env = {"JISHO_WORKERS": "6", "JISHO_KANJI_CACHE": "0", "JISHO_WORD_CONCURRENCY": "3"}
+    cfg = load_config(p, environ=env)
+    assert cfg.workers == 6
+    assert cfg.kind("kanji").cache is False
+    assert cfg.kind("word").concurrency == 3
+    assert cfg.kind("word").ttl == 60
+
+
+def test_old_config_and_missing_file(tmp_path):
+    from jisho_api.config import load_config
+
+    p = tmp_path / "config.json"
+    with open(p, "w") as fp:
+        json.dump({"cache": True}, fp)
+    assert load_config(p, environ={}).kind("sentence").cache is True
+
+    env = {"JISHO_CONFIG": str(tmp_path / "missing.json")}
+    assert load_config(environ=env).cache is False
+
+
+def test_unknown_backend():
+    from jisho_api.config import KindConfig
+
+    with pytest.raises(ValueError):
+        KindConfig(backend="redis")
+
+
+def test_client_ttls_from_config(tmp_path):
+    from jisho_api.client import Client
+    from jisho_api.config import Config
+    from jisho_api.word.request import Word
+
+    cfg = Config(root=tmp_path, kinds={"word": {"ttl": 60, "negative_ttl": None}})
+    fc = Client.from_config(cfg).cache_for(Word)
+    assert fc.root == tmp_path / "word"
+    assert (fc.ttl, fc.negative_ttl) == (60, None)
+
+
+def test_invalid_config_falls_back(tmp_path, monkeypatch):
+    import subprocess
+    import sys
+
+    from jisho_api.client import default_client
+    from jisho_api.config import Config, reload_config
+
+    p = tmp_path / "config.json"
+    p.write_text("{not json")
+    monkeypatch.setenv("JISHO_CONFIG", str(p))
+    monkeypatch.setenv("JISHO_WORD_TTL", "abc")
+    # importing never reads the config
+    subprocess.run([sys.executable, "-c", "import jisho_api.word"], check=True)
+
+    before = default_client()
+    with pytest.warns(UserWarning, match="invalid"):
+        cfg = reload_config()
+    assert cfg == Config()
+    assert default_client() is not before
+    assert default_client().config is cfg
+
+
+def test_scrape_uses_the_configured_root(tmp_path, monkeypatch, fake_default_transport):
+    from click.testing import CliRunner
+
+    from jisho_api.cli import scrape_words
+    from jisho_api.config import reload_config
+
+    monkeypatch.setenv("JISHO_ROOT", str(tmp_path / "data"))
+    reload_config()
+    (tmp_path / "data" / "word").mkdir(parents=True)
+    (tmp_path / "data" / "word" / '"water".json').write_text("{}")
+    words = tmp_path / "words.txt"
+    words.write_text("water\nfire", encoding="utf-8")
+
+    fake = fake_default_transport({"meta": {"status": 200}, "data": []})
+    CliRunner().invoke(scrape_words, [str(words)])
+    assert len(fake.urls) == 1 and "fire" in fake.urls[0]
@@ -0,0 +1,89 @@
+import json
+from pathlib import Path
+
+FIXTURES = Path(__file__).parents[1] / "jisho_api" / "fixtures"
+
+
+def _water():
+    from jisho_api.word.request import WordRequest
+
+    with open(FIXTURES / "word.json", "r", encoding="utf-8") as fp:
+        return WordRequest(**json.load(fp))
+
+
+def test_word_edges():
+    from jisho_api.crawl import word_edges
+
+    edges = set(word_edges("水", _water()))
+    assert ("word", "水", "kanji", "kanji", "水") in edges
+    assert ("word", "水", "see_also", "word", "湯") in edges
+    assert ("word", "水", "antonym", "word", "湯") in edges
+
+
+def test_crawl_budget_and_resume(tmp_path, monkeypatch):
+    from jisho_api.crawl import Crawler
+    from jisho_api.kanji.request import Kanji
+    from jisho_api.word.request import Word
+
+    fetched = []
+
+    def word_request(term, cache=False, client=None):
+        fetched.append(("word", term))
+        return _water()
+
+    def kanji_request(term, cache=False, client=None):
+        fetched.append(("kanji", term))
+        return None
+
+    monkeypatch.setattr(Word, "request", word_request)
+    monkeypatch.setattr(Kanji, "request", kanji_request)
+
+    c = Crawler(tmp_path, budget=1, workers=2)
+    c.seed("word", "水")
+    assert c.run() == 1
+    assert len(c.frontier) == 2
+
+    c = Crawler(tmp_path, budget=10, workers=2)
+    assert c.fetched == 1
+    c.run()
+    assert sorted(fetched) == [("kanji", "水"), ("word", "水"), ("word", "湯")]
+
+    lines = (tmp_path / "edges.tsv").read_text(encoding="utf-8").splitlines()
+    assert lines[0].startswith("source_kind")
+    assert len(lines) == 1 + 3 + 3
+
+
+def test_crawl_skips_failures_and_drops_uncommitted_lines(tmp_path, monkeypatch):
+    from jisho_api.crawl import Crawler
+    from jisho_api.kanji.request import Kanji
+    from jisho_api.word.request import Word
+
+    def word_request(term, cache=False, client=None):
+        if term == "湯":
+            raise RuntimeError("boom")
+        return _water()
+
+    monkeypatch.setattr(Word, "request", word_request)
+    monkeypatch.setattr(Kanji, "request", lambda term, cache=False, client=None: None)
+
+    c = Crawler(tmp_path, budget=1, workers=2)
+    c.seed("word", "水")
+    c.run()
+    committed = (tmp_path / "edges.tsv").read_text(encoding="utf-8")
+
+    # a crash after the appends but before the checkpoint
+    with open(tmp_path / "visited.txt", "a", encoding="utf-8") as fp:
+        fp.write("word\t湯\n")
+    with open(tmp_path / "edges.tsv", "a", encoding="utf-8") as fp:
+        fp.write("word\t湯\tsee_also\tword\t水\n")
+
+    c = Crawler(tmp_path, budget=10, workers=2)
+    assert ("word", "湯") not in c.visited
+    assert len(c.frontier) == 2
+    assert (tmp_path / "edges.tsv").read_text(encoding="utf-8") == committed
+
+    c.run()
+    assert c.failed == 1
+    assert ("word", "湯") not in c.visited
+    assert ("kanji", "水") in c.visited
+    assert Crawler(tmp_path).failed == 1
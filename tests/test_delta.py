@@ -0,0 +1,111 @@
+import json
+from pathlib import Path
+
+FIXTURES = Path(__file__).parents[1] / "jisho_api" / "fixtures"
+
+
+def _payload():
+    with open(FIXTURES / "word.json", "r", encoding="utf-8") as fp:
+        return json.load(fp)
+
+
+def test_payload_hash_normalized():
+    from jisho_api.delta import payload_hash
+    from jisho_api.vocab import WORD_FIELDS, pack
+
+    p = _payload()
+    reordered = json.loads(json.dumps(p, sort_keys=True))
+    assert payload_hash(p) == payload_hash(reordered) == payload_hash(pack(p, WORD_FIELDS))
+
+
+def test_delta_scrape(tmp_path, monkeypatch):
+    from jisho_api.delta import delta_scrape, read_changes
+    from jisho_api.word.request import Word, WordRequest
+
+    results = {"water": _payload(), "fire": _payload()}
+
+    def fetch(word, headers=None, client=None):
+        if word == "broken":
+            raise ConnectionError("down")
+        return WordRequest(**results.get(word, {"meta": {"status": 200}, "data": []}))
+
+    monkeypatch.setattr(Word, "ROOT", tmp_path)
+    monkeypatch.setattr(Word, "fetch", fetch)
+
+    r = delta_scrape(Word, ["water", "fire", "broken"])
+    assert (r.added, r.changed, r.removed, r.failed) == (2, 0, 0, 1)
+
+    results["fire"] = {**_payload(), "data": _payload()["data"][:1]}
+    del results["water"]
+    r = delta_scrape(Word, ["water", "fire", "broken"])
+    assert (r.added, r.changed, r.removed, r.unchanged) == (0, 1, 1, 0)
+    assert len(WordRequest(**json.loads((tmp_path / "fire.json").read_text())).data) == 1
+
+    mtimes = {p.name: p.stat().st_mtime_ns for p in tmp_path.glob("*.json")}
+    r = delta_scrape(Word, ["water", "fire"], sample=1)
+    assert r.checked == 1 and r.unchanged == 1
+
+    changes = [(c["term"], c["change"]) for c in read_changes(tmp_path)]
+    assert changes == [
+        ("water", "added"),
+        ("fire", "added"),
+        ("water", "removed"),
+        ("fire", "changed"),
+    ]
+    assert mtimes == {p.name: p.stat().st_mtime_ns for p in tmp_path.glob("*.json")}
+
+
+def test_delta_scrape_expired_and_background(tmp_path, monkeypatch):
+    import os
+    import threading
+
+    from jisho_api.client import Client
+    from jisho_api.delta import MANIFEST, delta_scrape, load_manifest
+    from jisho_api.word.request import Word, WordRequest
+
+    hold, release = threading.Event(), threading.Event()
+
+    def fetch(word, headers=None, client=None):
+        if word == "water" and hold.is_set():
+            release.wait(5)
+        return WordRequest(**_payload())
+
+    monkeypatch.setattr(Word, "ROOT", tmp_path)
+    monkeypatch.setattr(Word, "fetch", fetch)
+    client = Client(ttl=60)
+
+    delta_scrape(Word, ["water"], client=client, workers=1)
+    # expired, and without a manifest entry to compare with
+    os.remove(tmp_path / MANIFEST)
+    os.utime(tmp_path / "water.json", (0, 0))
+    hold.set()
+
+    r = delta_scrape(Word, ["water", "fire"], client=client, workers=1, background=True)
+    assert (r.checked, r.added, r.pending) == (1, 1, 1)
+    assert "water" not in load_manifest(tmp_path)
+    release.set()
+    r = r.wait(5)
+    assert (r.checked, r.added, r.changed, r.unchanged, r.pending) == (2, 1, 0, 1, 0)
+    assert "water" in load_manifest(tmp_path)
+
+
+def test_delta_scrape_saves_manifest_on_errors(tmp_path, monkeypatch):
+    import pytest
+
+    from jisho_api.delta import delta_scrape, load_manifest
+    from jisho_api.word.request import Word, WordRequest
+
+    def save(term, r, client=None):
+        if term == "fire":
+            raise OSError("disk full")
+        client.cache_for(Word).put(term, r.model_dump(mode="json", by_alias=True))
+
+    monkeypatch.setattr(Word, "ROOT", tmp_path)
+    monkeypatch.setattr(
+        Word, "fetch", lambda word, headers=None, client=None: WordRequest(**_payload())
+    )
+    monkeypatch.setattr(Word, "save", save)
+
+    with pytest.raises(OSError):
+        delta_scrape(Word, ["water", "fire"], workers=1)
+    assert list(load_manifest(tmp_path)) == ["water", "fire"]
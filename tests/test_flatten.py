@@ -0,0 +1,83 @@
+import json
+from pathlib import Path
+
+FIXTURES = Path(__file__).parents[1] / "jisho_api" / "fixtures"
+
+
+def _data():
+    with open(FIXTURES / "word.json", "r", encoding="utf-8") as fp:
+        return json.load(fp)["data"]
+
+
+def test_flatten_roundtrip():
+    from jisho_api.flatten import flattener
+    from jisho_api.word.cfg import WordConfig
+
+    f = flattener(WordConfig)
+    assert f is flattener(WordConfig)
+    cols = f.flatten(_data())
+    assert cols["slug"] == ["水", "水道", "お冷"]
+    assert cols["japanese"] == [1, 1, 2]
+    assert cols["japanese.reading"] == ["みず", "すいどう", "おひや", "おひや"]
+    senses = cols["senses"]
+    assert len(cols["senses.english_definitions"]) == sum(senses)
+    assert cols["senses.english_definitions"][senses[0]] == [
+        "water supply",
+        "water service",
+        "waterworks",
+    ]
+
+    back = [WordConfig(**d) for d in f.unflatten(cols)]
+    assert back == [WordConfig(**d) for d in _data()]
+    assert f.flatten(back)["senses.tags"] == cols["senses.tags"]
+
+
+def test_flatten_optional_models():
+    from jisho_api.flatten import flattener
+    from jisho_api.kanji.cfg import KanjiConfig
+
+    f = flattener(KanjiConfig)
+    assert "meta.education.jlpt" in f.columns
+    k = {
+        "kanji": "水",
+        "strokes": 4,
+        "main_meanings": ["water"],
+        "main_readings": {"kun": ["みず"], "on": ["スイ"]},
+        "meta": {"education": {"grade": "1", "jlpt": "N5"}},
+        "radical": {"meaning": "water", "parts": ["水"], "basis": "水"},
+    }
+    cols = f.flatten([k])
+    assert cols["meta.education.jlpt"] == ["N5"]
+    assert cols["reading_examples.on"] == [None]
+    assert cols["reading_examples.on.kanji"] == []
+    assert KanjiConfig(**f.unflatten(cols)[0]) == KanjiConfig(**k)
+
+
+def test_flatten_recur_no_shared_default():
+    from jisho_api.util import deflatten_recur, flatten_recur
+
+    assert flatten_recur({"a": {"b": 1}}) == {"a.b": 1}
+    assert flatten_recur({"c": 2}) == {"c": 2}
+    assert deflatten_recur({"a.b": 1}) == {"a": {"b": 1}}
+    assert deflatten_recur({"c": 2}) == {"c": 2}
+
+
+def test_flatten_keeps_empty_models():
+    from jisho_api.flatten import flattener
+    from jisho_api.kanji.cfg import KanjiConfig
+
+    f = flattener(KanjiConfig)
+    k = {
+        "kanji": "水",
+        "strokes": 4,
+        "main_meanings": [],
+        "main_readings": {},
+        "meta": {"education": {}},
+        "radical": {"meaning": "water", "parts": [], "basis": "水"},
+    }
+    cols = f.flatten([k])
+    assert cols["main_readings"] == [True]
+    assert cols["meta.readings"] == [None]
+    assert f.unflatten(cols) == [k]
+    assert f.flatten([KanjiConfig(**k)]) == cols
+    assert KanjiConfig(**f.unflatten(cols)[0]) == KanjiConfig(**k)
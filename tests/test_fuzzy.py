@@ -0,0 +1,65 @@
+import json
+from pathlib import Path
+
+FIXTURES = Path(__file__).parents[1] / "jisho_api" / "fixtures"
+
+
+def test_levenshtein():
+    from jisho_api.fuzzy import levenshtein
+
+    assert levenshtein("water", "water") == 0
+    assert levenshtein("watr", "water") == 1
+    assert levenshtein("kitten", "sitting") == 3
+    assert levenshtein("kitten", "sitting", max_dist=1) == 2
+
+
+def test_bktree():
+    from jisho_api.fuzzy import BKTree, levenshtein
+
+    words = ["water", "waiter", "wafer", "later", "cold", "hot", "mizu", "mozu"]
+    tree = BKTree()
+    for w in words:
+        tree.add(w)
+    tree.add("water")
+    assert len(tree) == len(words)
+    for q in ("watr", "mizo", "colt"):
+        expected = sorted((levenshtein(q, w), w) for w in words if levenshtein(q, w) <= 2)
+        assert sorted(tree.search(q, 2)) == expected
+
+
+def test_suggest(tmp_path):
+    from jisho_api.cache import FileCache
+    from jisho_api.fuzzy import FuzzyIndex
+
+    with open(FIXTURES / "word.json", "r", encoding="utf-8") as fp:
+        payload = json.load(fp)
+    fc = FileCache(tmp_path)
+    fc.put("water", payload)
+
+    index = FuzzyIndex.from_cache(fc)
+    top = index.suggest("watr")[0]
+    assert (top.text, top.distance, top.terms) == ("water", 1, ["water"])
+    assert index.suggest("mizo")[0].text == "mizu"
+    assert index.suggest("みぞ")[0].text == "mizu"
+    assert index.suggest("xylophone") == []
+
+
+def test_fuzzy_index_persists(tmp_path):
+    from jisho_api.cache import FileCache
+    from jisho_api.fuzzy import FuzzyIndex
+
+    with open(FIXTURES / "word.json", "r", encoding="utf-8") as fp:
+        payload = json.load(fp)
+    fc = FileCache(tmp_path / "word")
+    fc.put("water", payload)
+
+    index = FuzzyIndex.from_cache(fc)
+    index.save(tmp_path / "fuzzy.json")
+    loaded = FuzzyIndex.load(tmp_path / "fuzzy.json")
+    assert loaded.tree.nodes() == index.tree.nodes()
+    assert loaded.suggest("watr") == index.suggest("watr")
+    assert loaded.update(fc) == 0
+
+    fc.path("water").unlink()
+    assert loaded.update(fc) == 1
+    assert loaded.suggest("watr") == []
@@ -0,0 +1,67 @@
+from pathlib import Path
+
+FIXTURES = Path(__file__).parents[1] / "jisho_api" / "fixtures"
+
+
+def test_sentences_keep_furigana():
+    from bs4 import BeautifulSoup
+
+    from jisho_api.sentence.request import Sentence
+
+    with open(FIXTURES / "sentence.html", "rb") as fp:
+        soup = BeautifulSoup(fp.read(), "html.parser")
+    sts = Sentence.sentences(soup)
+    assert sts[0]["japanese"] == "水(みず)を一杯(いっぱい)ください。"
+
+
+def _page():
+    with open(FIXTURES / "sentence.html", "rb") as fp:
+        return fp.read()
+
+
+def test_harvest_dedupes(tmp_path, fake_transport):
+    from jisho_api.client import Client
+    from jisho_api.harvest import SentenceStore, harvest
+
+    t = fake_transport(_page())
+    client = Client(transport=t)
+    store = SentenceStore(tmp_path)
+
+    report = harvest(store, ["水", "水", "お冷"], client=client)
+    assert (report.words, report.pages, report.sentences) == (2, 2, 4)
+    assert (report.new, report.duplicates) == (2, 2)
+    assert len(store) == 2
+    assert store.ids("水") == store.ids("お冷")
+
+    # one results page, fewer than PAGE_SIZE sentences: no second request
+    assert len(t.urls) == 2
+
+    # reopened from disk, the join needs no requests
+    store = SentenceStore(tmp_path)
+    report = harvest(store, ["水"], client=client)
+    assert report.skipped == 1 and len(t.urls) == 2
+    ex = store.examples(["水", "火"])
+    assert [s.en_translation for s in ex["水"]] == [
+        "Please give me a glass of water.",
+        "Water boils at 100 degrees.",
+    ]
+    assert ex["火"] == []
+
+
+def test_harvest_partial_failure_is_retried(tmp_path, monkeypatch, fake_transport):
+    from jisho_api.client import Client
+    from jisho_api.harvest import SentenceStore, harvest
+    from jisho_api.sentence.request import Sentence
+
+    def reply(url):
+        if "page=2" in url:
+            raise ConnectionError("page 2")
+        return _page()
+
+    t = fake_transport(reply)
+    store = SentenceStore(tmp_path)
+    # a full first page, so a second one is requested
+    monkeypatch.setattr(Sentence, "PAGE_SIZE", 2)
+    report = harvest(store, ["水"], client=Client(transport=t))
+    assert (report.words, report.failed) == (0, 1)
+    assert "水" not in store and len(store) == 0
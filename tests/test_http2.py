@@ -0,0 +1,47 @@
+import pytest
+
+
+def test_http2_transport_against_fake_jisho():
+    pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+    from jisho_api.client import Client
+    from jisho_api.fake import FakeJisho
+    from jisho_api.loadgen import load_client, run_load
+    from jisho_api.transport import HTTP2Transport
+
+    with FakeJisho(latency=0.01) as fake:
+        transport = HTTP2Transport(prior_knowledge=True)
+        client = Client(base_url=fake.base_url, transport=transport)
+        assert len(client.word("anything")) == 3
+        assert client.kanji("水").data.radical.kangxi_order == 85
+        assert len(client.sentence("水")) == 2
+        assert [t.token for t in client.tokens("猫が好きです")] == ["猫", "が", "好き", "です"]
+        transport.close()
+        assert fake.counts["connections"] == 1
+
+        client = load_client(fake.base_url, 150, http2=True)
+        r = run_load(client, "word", "sync", requests=300, concurrency=150)
+        client.transport.close()
+        assert (r.requests, r.errors) == (300, 0)
+        assert fake.counts["connections"] == 2
+
+
+def test_http2_config_falls_back(monkeypatch):
+    import builtins
+
+    from jisho_api.config import Config
+    from jisho_api.transport import HTTP2Transport, Transport
+
+    real_import = builtins.__import__
+
+    def no_httpx(name, *args, **kwargs):
+        if name == "httpx":
+            raise ImportError(name)
+        return real_import(name, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "__import__", no_httpx)
+    with pytest.warns(UserWarning, match="httpx"):
+        t = Transport.from_config(Config(http2=True))
+    assert type(t) is Transport
+    with pytest.raises(ImportError):
+        HTTP2Transport()
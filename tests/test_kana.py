@@ -0,0 +1,80 @@
+import json
+from pathlib import Path
+
+FIXTURES = Path(__file__).parents[1] / "jisho_api" / "fixtures"
+
+
+def test_transliteration():
+    from jisho_api.kana import to_hiragana, to_kana, to_katakana, to_romaji
+
+    assert to_romaji("みず") == "mizu"
+    assert to_romaji("マッチ") == "matchi"
+    assert to_romaji("コーヒー") == "koohii"
+    assert to_romaji("きんえん") == "kin'en"
+    assert to_romaji("じゅう") == "juu"
+    assert to_kana("konnichiwa") == "こんにちわ"
+    assert to_kana("kin'en") == "きんえん"
+    assert to_kana("shinbun") == "しんぶん"
+    assert to_kana("Kitte", katakana=True) == "キッテ"
+    assert to_hiragana("カタカナ") == "かたかな"
+    assert to_katakana("ひらがな") == "ヒラガナ"
+
+    for kana in ("がっこう", "しゃしん", "ふぁいる", "せんせい", "ほんや"):
+        assert to_kana(to_romaji(kana)) == kana
+
+
+def test_convert_column():
+    from jisho_api.kana import convert_column, to_romaji
+
+    calls = []
+
+    def fn(v):
+        calls.append(v)
+        return to_romaji(v)
+
+    assert convert_column(fn, ["みず", "ゆ", "みず"]) == ["mizu", "yu", "mizu"]
+    assert calls == ["みず", "ゆ"]
+
+
+def test_reading_index(tmp_path):
+    from jisho_api.cache import FileCache
+    from jisho_api.kana import ReadingIndex
+
+    with open(FIXTURES / "word.json", "r", encoding="utf-8") as fp:
+        payload = json.load(fp)
+    fc = FileCache(tmp_path)
+    fc.put("water", payload)
+    fc.put_empty("nothing")
+
+    index = ReadingIndex.from_cache(fc)
+    assert index.lookup("mizu") == ["water"]
+    assert index.lookup("ミズ") == ["water"]
+    assert index.lookup("水道") == ["water"]
+    assert index.lookup("yu") == []
+    assert index.prefix("suid") == ["water"]
+
+
+def test_reading_index_updates_and_persists(tmp_path):
+    from jisho_api.cache import FileCache
+    from jisho_api.kana import ReadingIndex, is_kana
+
+    with open(FIXTURES / "word.json", "r", encoding="utf-8") as fp:
+        payload = json.load(fp)
+    fc = FileCache(tmp_path / "word")
+    fc.put("water", payload)
+
+    index = ReadingIndex.load(tmp_path / "readings.json")
+    assert index.update(fc) == 1
+    index.save(tmp_path / "readings.json")
+
+    index = ReadingIndex.load(tmp_path / "readings.json")
+    assert index.lookup("みず") == ["water"]
+    assert index.update(fc) == 0
+
+    fc.put("水", payload)
+    fc.path("water").unlink()
+    assert index.update(fc) == 2
+    assert index.lookup("みず") == ["水"]
+    assert index.prefix("suid") == ["水"]
+
+    assert is_kana("コーヒー") and not is_kana("same") and not is_kana("水")
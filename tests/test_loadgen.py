@@ -0,0 +1,69 @@
+import pytest
+
+
+def test_fake_jisho_serves_every_kind():
+    from jisho_api.client import Client
+    from jisho_api.fake import FakeJisho
+    from jisho_api.tokenize.request import Tokens
+    from jisho_api.transport import Transport
+
+    with FakeJisho() as fake:
+        client = Client(base_url=fake.base_url, transport=Transport())
+        assert len(client.word("anything")) == 3
+        assert client.kanji("水").data.radical.kangxi_order == 85
+        assert len(client.sentence("水")) == 2
+        assert [t.token for t in client.tokens("猫が好きです")] == ["猫", "が", "好き", "です"]
+
+        res = Tokens.request_batch(["猫が好き", "水を飲む", "です"], client=client)
+        assert all(len(r) == 4 for r in res.values())
+        assert client.metrics()["fetches"] == 5
+
+
+def test_fake_jisho_injects_errors():
+    from jisho_api.client import Client
+    from jisho_api.fake import FakeJisho
+    from jisho_api.transport import Transport
+
+    with FakeJisho(error_rate=1.0) as fake:
+        client = Client(base_url=fake.base_url, transport=Transport(retries=0))
+        assert client.word("water") is None
+        assert client.metrics()["errors"] == 1
+        assert fake.counts == {"connections": 1, "requests": 1, "errors": 1, "throttled": 0}
+
+
+def test_run_load():
+    from jisho_api.fake import FakeJisho
+    from jisho_api.loadgen import load_client, percentile, run_load
+
+    assert percentile([1.0, 2.0, 3.0, 4.0], 50) == 2.0
+    assert percentile([1.0, 2.0, 3.0, 4.0], 99) == 4.0
+
+    with FakeJisho(latency=0.01) as fake:
+        for mode in ("sync", "async", "batch"):
+            r = run_load(load_client(fake.base_url, 8), "tokens", mode, requests=20, concurrency=8)
+            assert (r.requests, r.errors) == (20, 0)
+            assert 10 <= r.p50 <= r.p95 <= r.p99
+        with pytest.raises(ValueError):
+            run_load(load_client(fake.base_url, 8), "word", "batch", requests=1)
+
+
+def test_loadtest_closes_its_clients(monkeypatch):
+    from click.testing import CliRunner
+
+    from jisho_api import loadgen
+    from jisho_api.cli import loadtest
+
+    clients = []
+
+    def load_client(url, concurrency, http2=False):
+        client = loadgen.Client(base_url=url)
+        closed = client.transport.close
+        client.transport.close = lambda: (clients.append(client), closed())
+        return client
+
+    monkeypatch.setattr(loadgen, "load_client", load_client)
+    result = CliRunner().invoke(
+        loadtest, ["--kind", "word", "--mode", "sync", "--mode", "async", "--requests", "4"]
+    )
+    assert result.exit_code == 0, result.output
+    assert len(clients) == 2
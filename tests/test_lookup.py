@@ -0,0 +1,53 @@
+import json
+from pathlib import Path
+
+FIXTURES = Path(__file__).parents[1] / "jisho_api" / "fixtures"
+
+
+def test_lookup_full(fake_default_transport):
+    from jisho_api.lookup import lookup_full
+
+    with open(FIXTURES / "word.json", "r", encoding="utf-8") as fp:
+        word = json.load(fp)
+    sentences = (FIXTURES / "sentence.html").read_bytes()
+
+    def reply(url):
+        if "words?keyword" in url:
+            return word
+        if "sentences" in url:
+            return sentences
+        # a kanji page we can not parse
+        return b"<html></html>"
+
+    calls = fake_default_transport(reply).urls
+    r = lookup_full("water")
+    assert len(r.word) == 3
+    assert len(r.sentences) == 2
+    assert r.kanji == {}
+    assert sum("%23kanji" in c for c in calls) == 1
+
+
+def test_submit_shares_requests_per_client():
+    import threading
+
+    from jisho_api.client import Client
+
+    release = threading.Event()
+    calls = []
+
+    class SlowClient(Client):
+        def request(self, kind, term, cache=False, headers=None):
+            calls.append((self, term))
+            release.wait(5)
+            return term
+
+    a, b = SlowClient(), SlowClient()
+    futures = [a.submit("word", "water"), a.submit("word", "water"), b.submit("word", "water")]
+    assert futures[0] is futures[1] and futures[0] is not futures[2]
+    release.set()
+    assert [f.result(5) for f in futures] == ["water"] * 3
+    assert sorted(map(id, (c for c, _ in calls))) == sorted([id(a), id(b)])
+
+    executor = a._executor
+    a.close()
+    assert a._executor is None and executor._shutdown
@@ -0,0 +1,103 @@
+import json
+import os
+import time
+from pathlib import Path
+
+FIXTURES = Path(__file__).parents[1] / "jisho_api" / "fixtures"
+
+
+def _cache(tmp_path):
+    from jisho_api.cache import FileCache
+
+    with open(FIXTURES / "word.json", "r", encoding="utf-8") as fp:
+        payload = json.load(fp)
+    fc = FileCache(tmp_path)
+    fc.put("水", payload)
+    fc.put("water", payload)
+    fc.put_empty("nothing")
+    with open(fc.path("bad"), "w", encoding="utf-8") as fp:
+        fp.write("{bad")
+    return fc
+
+
+def test_stats_and_verify(tmp_path):
+    from jisho_api.maintenance import cache_stats, verify
+
+    fc = _cache(tmp_path)
+    st = cache_stats("word", fc)
+    assert (st.files, st.entries, st.empty, st.corrupted) == (4, 2, 1, 1)
+    assert st.ages["<1d"] == 4
+
+    report = verify("word", fc, remove=True)
+    assert (report.checked, report.corrupted, report.removed) == (4, ["bad"], 1)
+    assert not fc.path("bad").exists()
+
+
+def test_prune(tmp_path):
+    from jisho_api.maintenance import prune
+
+    fc = _cache(tmp_path)
+    report = prune([fc], dry_run=True)
+    assert report.removed == 1 and fc.path("bad").exists()
+
+    old = time.time() - 3600
+    os.utime(fc.path("water"), (old, old))
+
+    size = fc.path("水").stat().st_size + fc.path("nothing").stat().st_size
+    report = prune([fc], max_bytes=size)
+    assert (report.removed, report.kept, report.kept_bytes) == (2, 2, size)
+    assert sorted(fc.keys()) == ["nothing", "水"]
+
+
+def test_compact(tmp_path):
+    from jisho_api.maintenance import compact
+    from jisho_api.word.request import Word
+
+    fc = _cache(tmp_path)
+    before = fc.read("水")
+    mtime = fc.path("水").stat().st_mtime
+
+    report = compact("word", fc)
+    assert (report.files, report.skipped) == (3, 1)
+    assert report.bytes_after < report.bytes_before
+    assert "vocab" in fc.read("水")
+    assert fc.path("水").stat().st_mtime == mtime
+
+    Word.ROOT, root = tmp_path, Word.ROOT
+    try:
+        wr = Word.request("水", cache=True)
+    finally:
+        Word.ROOT = root
+    senses = before["data"][0]["senses"]
+    assert [s.parts_of_speech for s in wr.data[0].senses] == [
+        s["parts_of_speech"] for s in senses
+    ]
+
+
+def test_prune_counts_slug_entries(tmp_path):
+    import copy
+
+    from jisho_api.cache import SlugCache
+    from jisho_api.maintenance import prune
+
+    with open(FIXTURES / "word.json", "r", encoding="utf-8") as fp:
+        payload = json.load(fp)
+    fc = SlugCache(tmp_path)
+    for i in range(50):
+        p = copy.deepcopy(payload)
+        for entry in p["data"][:2]:
+            entry["slug"] = f"{entry['slug']}{i}"
+        # the third entry is shared by every query
+        fc.put(f"q{i}", p)
+        old = time.time() - 3600 + i
+        os.utime(fc.path(f"q{i}"), (old, old))
+
+    def on_disk():
+        return sum(p.stat().st_size for p in tmp_path.rglob("*.json"))
+
+    budget = on_disk() // 5
+    report = prune([fc], max_bytes=budget)
+    assert 0 < report.kept < 50
+    assert report.kept_bytes == on_disk() <= budget
+    assert fc.keys() and "q49" in fc.keys() and "q0" not in fc.keys()
+    assert fc.read("q49") is not None
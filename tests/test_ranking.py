@@ -0,0 +1,70 @@
+import os
+import time
+
+
+def _kanji(kanji, strokes, rank=None, grade=None, jlpt=None):
+    education = {"grade": grade, "jlpt": jlpt, "newspaper_rank": rank}
+    return {"meta": {"status": 200}, "data": {"kanji": kanji, "strokes": strokes, "meta": {"education": education}}}
+
+
+def test_encode():
+    from jisho_api.ranking import encode_grade, encode_jlpt
+
+    assert [encode_grade(g) for g in ("grade 1", "junior high", None)] == [1, 8, 0]
+    assert [encode_jlpt(j) for j in ("N5", "N1", None)] == [5, 1, 0]
+
+
+def test_top_and_incremental_update(tmp_path):
+    from jisho_api.cache import FileCache
+    from jisho_api.ranking import KanjiRanking
+
+    fc = FileCache(tmp_path / "kanji")
+    fc.put("水", _kanji("水", 4, 223, "grade 1", "N5"))
+    fc.put("日", _kanji("日", 4, 1, "grade 1", "N5"))
+    fc.put("憂", _kanji("憂", 15, 1524, "junior high", "N1"))
+    fc.put("鬱", _kanji("鬱", 29))
+    fc.put_empty("無")
+
+    r = KanjiRanking(tmp_path / "index")
+    assert r.update(fc) == 4
+    assert r.top("rank") == ["日", "水", "憂", "鬱"]
+    assert r.top("rank", descending=True) == ["憂", "水", "日", "鬱"]
+    assert r.top("strokes", k=2, descending=True) == ["鬱", "憂"]
+    assert r.top("rank", jlpt=(5, 5)) == ["日", "水"]
+    assert r.top("strokes", grade=(None, 6), rank=(100, None)) == ["水"]
+    r.save()
+
+    r = KanjiRanking(tmp_path / "index")
+    assert len(r) == 4 and r.values("鬱")["rank"] == 0
+    assert r.update(fc) == 0
+
+    past = time.time() - 60
+    fc.put("木", _kanji("木", 4, 317, "grade 1", "N5"))
+    fc.put("鬱", _kanji("鬱", 29, 2000, "junior high", "N1"))
+    os.utime(fc.path("水"), (past, past))
+    assert r.update(fc) == 2
+    assert r.top("rank") == ["日", "水", "木", "憂", "鬱"]
+    assert r.top("strokes", k=3) == ["日", "木", "水"]
+
+
+def test_quoted_keys_and_pruning(tmp_path):
+    from jisho_api.cache import FileCache
+    from jisho_api.ranking import KanjiRanking
+
+    fc = FileCache(tmp_path / "kanji")
+    fc.put('"水"', _kanji("水", 4, 223, "grade 1", "N5"))
+    fc.put('"日"', _kanji("日", 4, 1, "grade 1", "N5"))
+    fc.put('"憂"', _kanji("憂", 15, 1524, "junior high", "N1"))
+
+    r = KanjiRanking(tmp_path / "index")
+    assert r.update(fc) == 3
+    assert r.top("rank") == ["日", "水", "憂"]
+
+    fc.path('"日"').unlink()
+    fc.put_empty('"憂"')
+    assert r.update(fc) == 2
+    assert r.top("rank") == ["水"] and "日" not in r
+    r.save()
+
+    r = KanjiRanking(tmp_path / "index")
+    assert r.top("strokes") == ["水"] and r.values("水")["rank"] == 223
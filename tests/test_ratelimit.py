@@ -0,0 +1,99 @@
+def test_retry_after_parsing():
+    from jisho_api.ratelimit import parse_retry_after
+
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("garbage") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def test_aimd():
+    from jisho_api.ratelimit import RateController
+
+    rc = RateController(max_concurrency=8)
+    rc.acquire()
+    rc.release(429)
+    assert rc.limit == 4
+    for _ in range(8):
+        rc.acquire()
+        rc.release(200)
+    assert rc.limit > 4
+    assert rc.metrics()["throttled"] == 1
+
+
+def test_circuit_breaker():
+    import pytest
+
+    from jisho_api.ratelimit import CircuitOpenError, RateController
+
+    now = [0.0]
+    rc = RateController(failure_threshold=2, reset_timeout=10, clock=lambda: now[0])
+    for _ in range(2):
+        rc.acquire()
+        rc.release(None)
+    assert rc.state == rc.OPEN
+    with pytest.raises(CircuitOpenError):
+        rc.acquire()
+
+    now[0] = 11
+    assert rc.state == rc.HALF_OPEN
+    rc.acquire()
+    rc.release(200)
+    assert rc.state == rc.CLOSED
+
+
+def test_transport_retries_throttled(monkeypatch):
+    import requests
+
+    from jisho_api.ratelimit import RateController
+    from jisho_api.transport import Transport
+
+    statuses = [429, 503, 200]
+
+    def fake_get(url, headers=None, timeout=None):
+        r = requests.Response()
+        r.status_code = statuses.pop(0)
+        r._content = b"{}"
+        return r
+
+    t = Transport(rate=RateController(backoff_base=0))
+    monkeypatch.setattr(t.session, "get", fake_get)
+    assert t.get("http://jisho.invalid").status_code == 200
+    m = t.metrics()
+    assert m["retries"] == 2
+    assert m["throttled"] == 2
+
+
+def test_transport_gives_up(monkeypatch):
+    import pytest
+    import requests
+
+    from jisho_api.ratelimit import RateController
+    from jisho_api.transport import Transport
+
+    def fake_get(url, headers=None, timeout=None):
+        r = requests.Response()
+        r.status_code = 503
+        return r
+
+    t = Transport(rate=RateController(backoff_base=0), retries=1)
+    monkeypatch.setattr(t.session, "get", fake_get)
+    with pytest.raises(requests.HTTPError):
+        t.get("http://jisho.invalid")
+
+
+def test_transport_releases_on_any_exception(monkeypatch):
+    import pytest
+
+    from jisho_api.ratelimit import RateController
+    from jisho_api.transport import Transport
+
+    def fake_get(url, headers=None, timeout=None):
+        raise KeyboardInterrupt
+
+    t = Transport(rate=RateController(max_concurrency=1))
+    monkeypatch.setattr(t.session, "get", fake_get)
+    for _ in range(2):
+        with pytest.raises(KeyboardInterrupt):
+            t.get("http://jisho.invalid")
+    assert t.metrics()["in_flight"] == 0
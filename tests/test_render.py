@@ -0,0 +1,50 @@
+import json
+from pathlib import Path
+
+FIXTURES = Path(__file__).parents[1] / "jisho_api" / "fixtures"
+
+
+def _payload():
+    with open(FIXTURES / "word.json", "r", encoding="utf-8") as fp:
+        return json.load(fp)
+
+
+def test_pages_are_lazy(fake_transport):
+    from jisho_api.client import Client
+    from jisho_api.word.request import Word
+
+    data = _payload()["data"]
+    full = {"meta": {"status": 200}, "data": (data * 7)[: Word.PAGE_SIZE]}
+    last = {"meta": {"status": 200}, "data": data}
+    replies = [full, full, last]
+    t = fake_transport(lambda url: replies[int(url.rsplit("&page=", 1)[1]) - 1])
+
+    pages = Word.pages("water*", client=Client(transport=t))
+    assert len(next(pages)) == Word.PAGE_SIZE
+    assert len(t.urls) == 1
+    assert [len(r) for r in pages] == [Word.PAGE_SIZE, 3]
+    assert t.urls[-1].endswith("&page=3")
+
+    t.urls.clear()
+    assert len(list(Word.pages("water*", max_pages=1, client=Client(transport=t)))) == 1
+    assert len(t.urls) == 1
+
+
+def test_markup():
+    from jisho_api.word.request import WordRequest
+
+    wr = WordRequest(**_payload())
+    lines = wr.markup(wr.data[2]).split("\n")
+    assert lines[0] == (
+        "[green]お冷 [red]([white]おひや[red]), [purple]お冷や [red]([white]おひや[red])"
+    )
+    assert lines[1].startswith("[yellow]1. [white]cold (drinking) water")
+
+
+def test_emit_jsonl(capsys):
+    from jisho_api.cli import _emit
+    from jisho_api.word.request import WordRequest
+
+    _emit(WordRequest(**_payload()), "jsonl")
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line)["slug"] for line in lines] == ["水", "水道", "お冷"]
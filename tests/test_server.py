@@ -0,0 +1,63 @@
+import asyncio
+import json
+from pathlib import Path
+
+FIXTURES = Path(__file__).parents[1] / "jisho_api" / "fixtures"
+
+
+def test_daemon_dispatch(fake_default_transport):
+    from jisho_api.server import Daemon
+
+    with open(FIXTURES / "word.json", "r", encoding="utf-8") as fp:
+        payload = json.load(fp)
+    calls = fake_default_transport(payload).urls
+    d = Daemon(cache=False)
+
+    async def run():
+        return await asyncio.gather(
+            d.dispatch("GET", "/word?q=water"),
+            d.dispatch("GET", "/word?q=water"),
+            d.dispatch("GET", "/nope?q=water"),
+        )
+
+    (s1, b1), (s2, b2), (s3, _) = asyncio.run(run())
+    assert s1 == s2 == 200
+    assert b1 == b2
+    assert s3 == 400
+    assert len(json.loads(b1)["data"]) == 3
+    assert len(calls) == 1
+
+    asyncio.run(d.dispatch("GET", "/word?q=water"))
+    assert len(calls) == 1
+    assert d.memory.stats()["hits"] >= 1
+
+
+def test_daemon_tells_failures_from_misses(fake_default_transport, tmp_path):
+    from jisho_api.ratelimit import CircuitOpenError
+    from jisho_api.server import Daemon
+
+    def reply(url):
+        if "empty" in url:
+            return {"meta": {"status": 200}, "data": []}
+        if "open" in url:
+            raise CircuitOpenError("circuit breaker is open")
+        raise ConnectionError("jisho is down")
+
+    fake_default_transport(reply)
+    d = Daemon(cache=False, access_log=tmp_path / "access.log")
+
+    async def run():
+        return await asyncio.gather(
+            d.dispatch("GET", "/word?q=empty"),
+            d.dispatch("GET", "/word?q=down"),
+            d.dispatch("GET", "/word?q=open"),
+        )
+
+    (s1, _), (s2, b2), (s3, _) = asyncio.run(run())
+    assert (s1, s2, s3) == (404, 502, 503)
+    assert "jisho is down" in json.loads(b2)["error"]
+    assert len(d.memory) == 0
+
+    d.close()
+    assert d.access_log is None
+    assert (tmp_path / "access.log").read_text().count("\n") == 3
@@ -0,0 +1,103 @@
+import json
+from pathlib import Path
+
+import pytest
+
+FIXTURES = Path(__file__).parents[1] / "jisho_api" / "fixtures"
+
+
+def _payload():
+    with open(FIXTURES / "word.json", "r", encoding="utf-8") as fp:
+        return json.load(fp)
+
+
+def test_entries_are_shared_between_queries(tmp_path):
+    from jisho_api.cache import SlugCache
+    from jisho_api.vocab import WORD_FIELDS, pack
+    from jisho_api.word.request import WordRequest
+
+    payload = _payload()
+    fc = SlugCache(tmp_path)
+    fc.put("water", payload)
+    fc.put("水", pack({**payload, "data": payload["data"][::-1][:2]}, WORD_FIELDS))
+    fc.put_empty("nothing")
+
+    assert len(list((tmp_path / "entries").glob("*.json"))) == 3
+    assert fc.read("water") == payload
+    assert [w.slug for w in WordRequest(**fc.get("水")).data] == ["お冷", "水道"]
+    assert fc.status("nothing") == fc.EMPTY
+    assert sorted(fc.keys()) == ["nothing", "water", "水"]
+
+    entry = fc.entry("水道")
+    entry["jlpt"] = ["jlpt-n1"]
+    assert fc.put_entry(entry) and not fc.put_entry(entry)
+    assert fc.get("water")["data"][1]["jlpt"] == ["jlpt-n1"]
+    assert fc.get("水")["data"][1]["jlpt"] == ["jlpt-n1"]
+
+    fc.path("water").unlink()
+    size = fc.entry_path("水").stat().st_size
+    assert fc.collect() == (1, size)
+    assert fc.entry("水") is None and fc.entry("水道") is not None
+
+
+def test_missing_entry_is_corrupted(tmp_path):
+    from jisho_api.cache import SlugCache
+    from jisho_api.maintenance import verify
+
+    fc = SlugCache(tmp_path)
+    fc.put("water", _payload())
+    fc.entry_path("お冷").unlink()
+    assert fc.status("water") == fc.MISS
+    assert verify("word", fc).corrupted == ["water"]
+
+
+def test_slug_backend_from_config(tmp_path, fake_transport):
+    from jisho_api.cache import SlugCache
+    from jisho_api.client import Client
+    from jisho_api.config import Config
+    from jisho_api.word.request import Word
+
+    cfg = Config(root=tmp_path, kinds={"word": {"backend": "slug"}})
+    client = Client.from_config(cfg, transport=fake_transport(lambda url: _payload()))
+    assert isinstance(client.cache_for(Word), SlugCache)
+    assert len(Word.request("water", cache=True, client=client)) == 3
+    assert len(Word.request("water", cache=True, client=client)) == 3
+    assert client.metrics()["cache_hits"] == 1
+    assert (tmp_path / "word" / "entries").is_dir()
+
+    with pytest.raises(ValueError):
+        Config(kinds={"kanji": {"backend": "slug"}})
+
+
+def test_collect_waits_for_writers(tmp_path, monkeypatch):
+    import threading
+
+    from jisho_api.cache import SlugCache
+
+    fc = SlugCache(tmp_path)
+    writing, release = threading.Event(), threading.Event()
+    write = SlugCache._write
+
+    def slow_write(self, p, obj):
+        write(self, p, obj)
+        # the first entry is written, the query listing it is not yet
+        if p.parent.name == "entries" and not writing.is_set():
+            writing.set()
+            release.wait(5)
+
+    monkeypatch.setattr(SlugCache, "_write", slow_write)
+
+    putter = threading.Thread(target=fc.put, args=("water", _payload()))
+    putter.start()
+    writing.wait(5)
+    result = []
+    collector = threading.Thread(target=lambda: result.append(fc.collect()))
+    collector.start()
+    collector.join(0.2)
+    assert collector.is_alive()
+    release.set()
+    putter.join(5)
+    collector.join(5)
+
+    assert result == [(0, 0)]
+    assert fc.read("water") == _payload()
@@ -0,0 +1,90 @@
+import json
+from pathlib import Path
+
+FIXTURES = Path(__file__).parents[1] / "jisho_api" / "fixtures"
+
+
+def _fetch(word, headers=None, client=None):
+    from jisho_api.word.request import WordRequest
+
+    if word == '"nothing"':
+        return WordRequest(meta={"status": 200}, data=[])
+    with open(FIXTURES / "word.json", "r", encoding="utf-8") as fp:
+        return WordRequest(**json.load(fp))
+
+
+def test_iter_scrape_segments(tmp_path, monkeypatch):
+    from jisho_api import iter_scrape
+    from jisho_api.stream import find, read_segments
+    from jisho_api.word.request import Word
+
+    monkeypatch.setattr(Word, "fetch", _fetch)
+    root = Word.ROOT
+    words = ["water", "nothing", "fire", "earth*"]
+
+    it = iter_scrape(Word, words, dump=tmp_path / "dump")
+    first = next(it)
+    assert first[0] == '"water"'
+    rest = list(it)
+    assert [w for w, _ in rest] == ['"fire"', "earth*"]
+    assert Word.ROOT == root
+
+    assert [t for t, _ in read_segments(tmp_path / "dump")] == ['"water"', '"fire"', "earth*"]
+    assert len(find(tmp_path / "dump", '"fire"')["data"]) == 3
+    assert find(tmp_path / "dump", "missing") is None
+
+
+def test_segment_rolling(tmp_path):
+    from jisho_api.stream import SegmentWriter, read_segments
+
+    with SegmentWriter(tmp_path, max_records=2) as w:
+        for i in range(5):
+            w.write(str(i), {"meta": {"status": 200}, "data": [i]})
+    with SegmentWriter(tmp_path, compress=False) as w:
+        w.write("5", {"meta": {"status": 200}, "data": [5]})
+
+    names = sorted(p.name for p in tmp_path.glob("segment-*"))
+    assert names == [
+        "segment-00000.jsonl.gz",
+        "segment-00001.jsonl.gz",
+        "segment-00002.jsonl.gz",
+        "segment-00003.jsonl",
+    ]
+    assert [t for t, _ in read_segments(tmp_path)] == [str(i) for i in range(6)]
+
+
+def test_scrape_does_not_touch_root(tmp_path, monkeypatch):
+    from jisho_api import scrape
+    from jisho_api.word.request import Word
+
+    monkeypatch.setattr(Word, "fetch", _fetch)
+    root = Word.ROOT
+    r = scrape(Word, ["water", "nothing"], tmp_path)
+    assert list(r) == ['"water"']
+    assert Word.ROOT == root
+    assert (tmp_path / '"water".json').exists()
+    assert (tmp_path / '"nothing".json').exists()
+
+
+def test_iter_scrape_caches_through_client(tmp_path, monkeypatch):
+    from jisho_api import iter_scrape
+    from jisho_api.cache import SlugCache
+    from jisho_api.client import Client
+    from jisho_api.config import Config
+    from jisho_api.stream import SegmentWriter, find
+    from jisho_api.word.request import Word
+
+    monkeypatch.setattr(Word, "fetch", _fetch)
+    client = Client(config=Config(kinds={"word": {"backend": "slug"}}))
+    list(iter_scrape(Word, ["water"], cache_root=tmp_path / "cache", client=client))
+    assert (tmp_path / "cache" / "entries").is_dir()
+    assert len(SlugCache(tmp_path / "cache").get('"water"')["data"]) == 3
+
+    # the index is on disk before the writer is closed
+    w = SegmentWriter(tmp_path / "dump", compress=False)
+    w.write("a", {"meta": {"status": 200}, "data": [1]})
+    w._fp.flush()
+    assert find(tmp_path / "dump", "a")["data"] == [1]
+    w.write("a", {"meta": {"status": 200}, "data": [2]})
+    w.close()
+    assert find(tmp_path / "dump", "a")["data"] == [2]
@@ -0,0 +1,23 @@
+def test_spans():
+    from jisho_api import timing
+
+    timing.reset()
+    with timing.span("off"):
+        pass
+    assert timing.report() == {}
+
+    timing.enable()
+    try:
+        with timing.span("stage"):
+            pass
+        with timing.span("stage"):
+            pass
+        timing.record("other", 0.5)
+    finally:
+        timing.disable()
+
+    r = timing.report()
+    assert r["stage"]["calls"] == 2
+    assert r["other"]["total"] == 0.5
+    assert list(r)[0] == "other"
+    timing.reset()
@@ -13,5 +13,16 @@ def test_tokens_tatoeba():
         result = Tokens.request(sentence)
 
 
+def test_tokens_batch_splits_like_single_requests():
+    from jisho_api.tokenize import Tokens
+
+    sentences = ["猫が好きです", "水を飲む", "昨日すき焼きを食べました"]
+    batched = Tokens.fetch(Tokens.DELIMITER.join(sentences))
+    parts = Tokens.split(batched.data, len(sentences))
+    assert parts is not None, [t.token for t in batched.data]
+    for s, part in zip(sentences, parts):
+        assert part == Tokens.fetch(s).data
+
+
 if __name__ == "__main__":
     test_tokens_tatoeba()
@@ -0,0 +1,58 @@
+from pathlib import Path
+from urllib.parse import unquote
+
+FIXTURES = Path(__file__).parents[1] / "jisho_api" / "fixtures"
+
+
+def _query(url):
+    return unquote(url.rsplit("/", 1)[1])
+
+
+def _batch_page():
+    with open(FIXTURES / "tokens_batch.html", "rb") as fp:
+        return fp.read()
+
+
+def test_batches():
+    from jisho_api.tokenize.request import Tokens
+
+    sentences = ["あいう", "えお", "かきくけこ", "〓さ", "たちつてとなにぬねの"]
+    batches = list(Tokens.batches(sentences, max_len=10))
+    assert batches == [["あいう", "えお"], ["〓さ"], ["たちつてとなにぬねの"], ["かきくけこ"]]
+    for b in batches:
+        assert len(Tokens.DELIMITER.join(b)) <= 10
+
+
+def test_request_batch(tmp_path, fake_transport):
+    from jisho_api.client import Client
+    from jisho_api.tokenize.request import Tokens
+
+    pages = {"猫が好きです〓水を飲む": _batch_page()}
+    t = fake_transport(lambda url: pages.get(_query(url), b"<html></html>"))
+    client = Client(root=tmp_path, transport=t)
+
+    res = Tokens.request_batch(["猫が好きです", "水を飲む"], cache=True, client=client)
+    assert [tk.token for tk in res["猫が好きです"]] == ["猫", "が", "好き", "です"]
+    assert [tk.pos_tag.value for tk in res["水を飲む"]] == ["Noun", "Particle", "Verb"]
+    assert [_query(u) for u in t.urls] == ["猫が好きです〓水を飲む"]
+
+    # cached now, and matches what a single request reads back
+    res = Tokens.request_batch(["水を飲む"], cache=True, client=client)
+    assert len(t.urls) == 1
+    assert Tokens.request("水を飲む", cache=True, client=client).data == res["水を飲む"].data
+
+
+def test_request_batch_falls_back(tmp_path, fake_transport):
+    from jisho_api.client import Client
+    from jisho_api.tokenize.request import Tokens
+
+    # the delimiter did not come back as a token, so each sentence is asked alone
+    page = _batch_page().replace("〓".encode(), "x".encode())
+    pages = {"猫が好きです〓水を飲む": page, "水を飲む": _batch_page()}
+    t = fake_transport(lambda url: pages.get(_query(url), b"<html></html>"))
+    client = Client(root=tmp_path, transport=t)
+
+    res = Tokens.request_batch(["猫が好きです", "水を飲む"], client=client)
+    assert [_query(u) for u in t.urls] == ["猫が好きです〓水を飲む", "猫が好きです", "水を飲む"]
+    assert res["猫が好きです"] is None
+    assert len(res["水を飲む"]) == 8
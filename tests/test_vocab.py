@@ -0,0 +1,62 @@
+import json
+from pathlib import Path
+
+FIXTURES = Path(__file__).parents[1] / "jisho_api" / "fixtures"
+
+
+def _load():
+    with open(FIXTURES / "word.json", "r", encoding="utf-8") as fp:
+        return json.load(fp)
+
+
+def test_pack_roundtrip():
+    from jisho_api.vocab import WORD_FIELDS, pack, unpack
+
+    payload = _load()
+    packed = pack(payload, WORD_FIELDS)
+    assert "vocab" in packed
+    assert all(isinstance(t, int) for t in packed["data"][0]["jlpt"])
+
+    many = {**payload, "data": payload["data"] * 20}
+    assert len(json.dumps(pack(many, WORD_FIELDS))) < len(json.dumps(many))
+    assert unpack(packed, WORD_FIELDS) == payload
+
+
+def test_validation_interns():
+    from jisho_api.word.request import WordRequest
+
+    a = WordRequest(**_load())
+    b = WordRequest(**json.loads(json.dumps(_load())))
+    assert a.data[0].senses[0].parts_of_speech[0] is b.data[2].senses[0].parts_of_speech[0]
+
+
+def test_unknown_pos_tags_counted():
+    import threading
+
+    from jisho_api.tokenize.cfg import UNKNOWN_POS_TAGS, PosTag, TokenConfig
+
+    before = UNKNOWN_POS_TAGS["Not a tag"]
+    t = TokenConfig(token="x", pos_tag="Not a tag")
+    assert t.pos_tag is PosTag.unk
+    assert UNKNOWN_POS_TAGS["Not a tag"] == before + 1
+
+    def parse():
+        for _ in range(500):
+            PosTag("Threaded tag")
+
+    threads = [threading.Thread(target=parse) for _ in range(8)]
+    for th in threads:
+        th.start()
+    for th in threads:
+        th.join()
+    assert UNKNOWN_POS_TAGS["Threaded tag"] == 8 * 500
+
+
+def test_word_cache_packed(tmp_path, monkeypatch):
+    from jisho_api.word.request import Word, WordRequest
+
+    monkeypatch.setattr(Word, "ROOT", tmp_path)
+    Word.save("water", WordRequest(**_load()), packed=True)
+    r = Word.request("water", cache=True)
+    assert isinstance(r, WordRequest)
+    assert r == WordRequest(**_load())
@@ -0,0 +1,36 @@
+import json
+from pathlib import Path
+
+FIXTURES = Path(__file__).parents[1] / "jisho_api" / "fixtures"
+
+
+def test_warm_plan(tmp_path, monkeypatch, fake_default_transport):
+    from jisho_api.warm import PrefetchPlan, warm
+    from jisho_api.word.request import Word
+
+    with open(FIXTURES / "word.json", "r", encoding="utf-8") as fp:
+        payload = json.load(fp)
+
+    def reply(url):
+        if "nothing" in url:
+            return {"meta": {"status": 200}, "data": []}
+        return payload
+
+    monkeypatch.setattr(Word, "ROOT", tmp_path)
+    fake_default_transport(reply)
+
+    log = tmp_path / "access.log"
+    log.write_text("word\twater\nword\twater\nword\tfire\nbogus\tx\n", encoding="utf-8")
+    plan = PrefetchPlan()
+    plan.add_access_log(log)
+    plan.add_list("word", ["nothing", "fire"])
+    assert plan.ordered()[0][:2] == ("word", "water")
+
+    Word.save("fire", payload)
+    report = warm(plan, workers=2)
+    assert report.planned == 3
+    assert report.already_cached == 1
+    assert report.fetched == 1
+    assert report.empty == 1
+    assert report.coverage == 1.0
+    assert report.estimated_hit_rate == 1.0